@@ -1,7 +1,8 @@
 from .crawler import *
 from .preprocess import *
 from .utils import *
+from .pool import CrawlerPool
 
-__all__ = ["Crawler" , "get_product_detail_info" , "crawl_product_list" , "get_one_product_info" , "get_row_product_info" , 
+__all__ = ["Crawler" , "CrawlerPool" , "get_product_detail_info" , "crawl_product_list" , "crawl_product_list_bulk" , "crawl_product_list_network" , "get_one_product_info" , "get_row_product_info" , 
            "image_preprocess" ,
-           "concat_images_horizontally_centered" , "pil_to_numpy" , "numpy_to_pil" , "pil_image_show" , "is_wide_image" , "get_pil_image_from_url" , "make_dir" , "add_data_to_dataframe" , "save_dataframe_to_csv" , "load_dataframe_from_csv"]
\ No newline at end of file
+           "concat_images_horizontally_centered" , "pil_to_numpy" , "numpy_to_pil" , "pil_image_show" , "is_wide_image" , "get_pil_image_from_url" , "make_dir" , "add_data_to_dataframe" , "save_dataframe_to_csv" , "load_dataframe_from_csv" , "merge_csv_chunks"]
\ No newline at end of file
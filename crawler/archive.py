@@ -0,0 +1,163 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, Generator, Tuple
+
+try:
+    import zstandard
+except ImportError:  # zstandard 는 선택 의존성 (pip install zstandard) , 없으면 zlib 으로 압축
+    zstandard = None
+
+_CREATE_TABLE = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    product_id TEXT NOT NULL,
+    crawled_at REAL NOT NULL,
+    blob_hash TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    PRIMARY KEY (product_id, crawled_at)
+)
+"""
+_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_snapshots_blob ON snapshots (blob_hash)"
+
+
+class SnapshotArchive:
+    """
+    상품 상세 페이지의 섹션 HTML 을 압축하여 내용 주소(sha256) 기반으로 저장하는 아카이브.
+    셀렉터가 바뀌거나 새 필드가 필요할 때 다시 크롤링하지 않고 저장된 HTML 로 파서만 다시 실행(reparse)하기 위해 사용합니다.
+
+    저장 구조:
+        archive_dir/blobs/{hash[:2]}/{hash}  : 압축된 스냅샷(JSON) , 내용이 같으면 한 번만 저장
+        archive_dir/index.sqlite3            : (product_id , crawled_at) -> blob_hash , codec
+
+    스냅샷 형식: {"product_id": str , "sections": {섹션 이름: innerHTML | None} , "option_data": Dict | None ,
+                 "crawling_status": {섹션 이름: 실시간 크롤링 상태}}
+
+    Args:
+        archive_dir (str | Path): 아카이브 디렉터리
+        codec (str, optional): "zstd" 또는 "zlib" (기본값 : zstandard 가 설치되어 있으면 zstd , 아니면 zlib)
+        level (int, optional): 압축 레벨 (기본값 : codec 의 기본 레벨)
+    """
+    def __init__(self, archive_dir: str | Path, codec: str | None = None, level: int | None = None):
+        self.archive_dir = Path(archive_dir)
+        self.blob_dir = self.archive_dir / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.archive_dir / "index.sqlite3"
+        self.codec = codec or ("zstd" if zstandard is not None else "zlib")
+        if self.codec == "zstd" and zstandard is None:
+            raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다. (pip install zstandard)")
+        self.level = level
+        self._lock = threading.Lock()
+        self._conn = None
+
+    def __getstate__(self):
+        # 프로세스 워커로 넘길 때 SQLite 연결은 넘기지 않고 , 워커에서 처음 사용할 때 다시 연결
+        state = self.__dict__.copy()
+        state["_conn"] = None
+        state["_lock"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.index_path, timeout=30, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_CREATE_TABLE)
+            self._conn.execute(_CREATE_INDEX)
+            self._conn.commit()
+        return self._conn
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.level or 3).compress(data)
+        return zlib.compress(data, self.level if self.level is not None else 6)
+
+    @staticmethod
+    def _decompress(data: bytes, codec: str) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise ImportError("zstd 로 압축된 스냅샷을 읽으려면 zstandard 패키지가 필요합니다. (pip install zstandard)")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def blob_path(self, blob_hash: str) -> Path:
+        return self.blob_dir / blob_hash[:2] / blob_hash
+
+    def put(self, product_id: str, sections: Dict[str, str | None], option_data: Dict | None = None,
+            crawled_at: float | None = None, crawling_status: Dict[str, str] | None = None) -> str:
+        """
+        스냅샷을 저장하고 blob_hash 를 반환합니다. 같은 내용의 blob 이 이미 있으면 인덱스에 행만 추가합니다.
+        crawling_status 는 HTML 이 없는 섹션을 다시 파싱할 때 실시간 크롤링 결과를 그대로 재현하기 위해 함께 저장합니다.
+        """
+        snapshot = {"product_id": product_id, "sections": sections, "option_data": option_data,
+                    "crawling_status": crawling_status or {}}
+        raw = json.dumps(snapshot, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        # 압축 방식이 달라도 같은 내용이면 같은 주소가 되도록 압축 전 내용으로 해시
+        blob_hash = hashlib.sha256(raw).hexdigest()
+        path = self.blob_path(blob_hash)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.parent / f"{blob_hash}.{os.getpid()}.{threading.get_ident()}.tmp"
+            tmp_path.write_bytes(self._compress(raw))
+            tmp_path.replace(path)
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO snapshots (product_id, crawled_at, blob_hash, codec) VALUES (?, ?, ?, ?)",
+                (product_id, crawled_at if crawled_at is not None else time.time(), blob_hash, self.codec),
+            )
+            self.conn.commit()
+        return blob_hash
+
+    def get(self, blob_hash: str, codec: str | None = None) -> Dict:
+        """blob_hash 의 스냅샷을 읽습니다."""
+        if codec is None:
+            with self._lock:
+                row = self.conn.execute("SELECT codec FROM snapshots WHERE blob_hash = ? LIMIT 1", (blob_hash,)).fetchone()
+            if row is None:
+                raise KeyError(blob_hash)
+            codec = row[0]
+        return self.read_blob(self.blob_path(blob_hash), codec)
+
+    @classmethod
+    def read_blob(cls, path: str | Path, codec: str) -> Dict:
+        """압축된 스냅샷 파일을 읽습니다. (인덱스 연결 없이 프로세스 워커에서 사용)"""
+        return json.loads(cls._decompress(Path(path).read_bytes(), codec))
+
+    def latest(self, product_id: str) -> Dict | None:
+        """product_id 의 가장 최근 스냅샷을 읽습니다. (없으면 None)"""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT blob_hash, codec FROM snapshots WHERE product_id = ? ORDER BY crawled_at DESC LIMIT 1", (product_id,)
+            ).fetchone()
+        return self.get(*row) if row else None
+
+    def iter_latest(self) -> Generator[Tuple[str, float, str, str], None, None]:
+        """상품별 가장 최근 스냅샷의 (product_id , crawled_at , blob_hash , codec) 를 반환합니다."""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT product_id, MAX(crawled_at), blob_hash, codec FROM snapshots GROUP BY product_id ORDER BY product_id"
+            ).fetchall()
+        yield from rows
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(DISTINCT product_id) FROM snapshots").fetchone()[0]
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,330 @@
+import asyncio
+import fnmatch
+import logging
+import re
+from typing import AsyncGenerator, Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+
+from .breaker import SectionCircuitBreaker
+from .crawler import (
+    BLOCKED_URL_PATTERNS, OPTION_API_URL, SECTION_DEFAULT_VALUES, SECTION_SELECTORS, USER_AGENT,
+    _OPTION_DATA_SCRIPT, _PROBE_ELEMENTS_SCRIPT, build_presence_selectors, plan_detail_sections,
+    parse_detail_images, parse_detail_text, parse_fit_info, parse_option_data, parse_reviews_text,
+    parse_size_detail_info, parse_summary_images,
+)
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # playwright 는 선택 의존성 (pip install playwright && playwright install chromium)
+    async_playwright = None
+
+# Selenium 의 page_load_strategy 와 같은 시점에 go() 가 반환되도록 하는 Playwright 의 wait_until 값
+_WAIT_UNTIL = {"normal": "load", "eager": "domcontentloaded", "none": "commit"}
+
+# 워커가 결과 큐로 보내는 메세지 종류
+_RESULT = "result"
+_DONE = "done"
+
+
+async def _evaluate_async_script(page, script: str, *args):
+    """
+    Selenium 의 execute_async_script 용 스크립트(arguments 의 마지막 값이 완료 콜백)를 Playwright 에서 그대로 실행합니다.
+    """
+    wrapper = "(args) => new Promise((done) => { (function () {" + script + "}).apply(null, [...args, done]); })"
+    return await page.evaluate(wrapper, list(args))
+
+
+class AsyncBrowser:
+    """
+    하나의 브라우저 프로세스 안에 상품마다 독립된 context/page(AsyncCrawler)를 여러 개 만들어
+    asyncio 로 동시에 크롤링하기 위한 Playwright 기반 엔진.
+
+    Args:
+        headless (bool): headless 모드 여부
+        base_url (str, optional): 상품 상세 페이지 기본 url
+        time_out (float): 요소 대기 최대 시간(초)
+        error_message (str): 요소를 찾지 못했을 때 반환하는 값 (Crawler 와 동일)
+        page_load_strategy (str): go() 의 반환 시점 (normal / eager / none , Crawler 와 동일)
+        block_resources (bool): 이미지와 blocked_url_patterns 의 요청을 차단
+        blocked_url_patterns (List[str], optional): 차단할 url 패턴 (기본값 BLOCKED_URL_PATTERNS)
+        navigation_timeout (float): 페이지 이동 최대 시간(초)
+        option_api_url (str, optional): 페이지 내장 상태에 옵션 정보가 없을 때 호출할 옵션 API (None 이면 호출하지 않음 , Crawler 와 동일)
+    """
+    def __init__(self, headless: bool = True, base_url: str | None = None, time_out: float = 3, error_message: str = "failed",
+                 page_load_strategy: str = "eager", block_resources: bool = True, blocked_url_patterns: List[str] | None = None,
+                 navigation_timeout: float = 30, option_api_url: str | None = OPTION_API_URL):
+        if async_playwright is None:
+            raise ImportError("AsyncBrowser 를 사용하려면 playwright 가 필요합니다. (pip install playwright && playwright install chromium)")
+        self.headless = headless
+        self.base_url = base_url
+        self.time_out = time_out
+        self.error_message = error_message
+        self.wait_until = _WAIT_UNTIL[page_load_strategy]
+        self.block_resources = block_resources
+        self.blocked_url_patterns = BLOCKED_URL_PATTERNS if blocked_url_patterns is None else blocked_url_patterns
+        # CDP Network.setBlockedURLs 와 같이 "*" 만 와일드카드로 사용 (fnmatch 의 "?" , "[" 는 문자 그대로 비교)
+        self._blocked_url_regexes = [
+            re.compile(fnmatch.translate(pattern.replace("[", "[[]").replace("?", "[?]"))) for pattern in self.blocked_url_patterns
+        ]
+        self.navigation_timeout = navigation_timeout
+        self.option_api_url = option_api_url
+        self._playwright = None
+        self._browser = None
+
+    async def start(self) -> "AsyncBrowser":
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=["--disable-notifications", "--disable-blink-features=AutomationControlled"],
+        )
+        return self
+
+    async def _route_request(self, route):
+        request = route.request
+        if request.resource_type == "image" or any(regex.match(request.url) for regex in self._blocked_url_regexes):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def new_crawler(self) -> "AsyncCrawler":
+        """같은 브라우저 프로세스 안에 독립된 context/page 를 가진 AsyncCrawler 를 만듭니다."""
+        context = await self._browser.new_context(user_agent=USER_AGENT, viewport={"width": 1600, "height": 1080})
+        if self.block_resources:
+            await context.route("**/*", self._route_request)
+        page = await context.new_page()
+        page.set_default_navigation_timeout(self.navigation_timeout * 1000)
+        return AsyncCrawler(context, page, base_url=self.base_url, time_out=self.time_out,
+                            error_message=self.error_message, wait_until=self.wait_until, option_api_url=self.option_api_url)
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+class AsyncCrawler:
+    """
+    Crawler 와 같은 공개 메서드(go , wait_for_element_by_css_selector , is_exist_element , handle_alert , close)를
+    async 로 제공하는 Playwright 페이지 하나. AsyncBrowser.new_crawler() 로 생성합니다.
+    """
+    def __init__(self, context, page, base_url: str | None = None, time_out: float = 3, error_message: str = "failed",
+                 wait_until: str = "domcontentloaded", option_api_url: str | None = OPTION_API_URL):
+        self.context = context
+        self.page = page
+        self.base_url = base_url
+        self.time_out = time_out
+        self.error_message = error_message
+        self.wait_until = wait_until
+        self.option_api_url = option_api_url
+        self.page_soup = None
+        self._section_cache = {}
+        self._alert_text = None
+        # 경고창은 뜨는 즉시 '확인'을 누르고 텍스트를 보관 (handle_alert 에서 반환)
+        page.on("dialog", self._on_dialog)
+
+    async def _on_dialog(self, dialog) -> None:
+        self._alert_text = dialog.message
+        print(f"경고창 감지: '{dialog.message}'")
+        await dialog.accept()
+
+    async def go(self, url: str) -> None:
+        self.page_soup = None  # 이전 페이지의 스냅샷 무효화
+        self._section_cache = {}  # 이전 페이지의 섹션 캐시 무효화
+        self._alert_text = None
+        await self.page.goto(url, wait_until=self.wait_until)
+
+    async def wait_for_element_by_css_selector(self, css_selector: str):
+        try:
+            return await self.page.wait_for_selector(css_selector, state="attached", timeout=self.time_out * 1000)
+        except Exception as e:
+            print(f"요소 로드 대기 중 오류 발생: {e}")
+            return self.error_message
+
+    async def is_exist_element(self, css_selector: str) -> bool:
+        try:
+            return await self.page.query_selector(css_selector) is not None
+        except Exception:
+            return False
+
+    async def handle_alert(self) -> str | None:
+        """경고창이 떴었다면 텍스트를 반환하고 , 없으면 None 을 반환합니다. ('확인'은 이미 눌린 상태)"""
+        alert_text, self._alert_text = self._alert_text, None
+        return alert_text
+
+    async def take_page_snapshot(self) -> BeautifulSoup | None:
+        """#root 하위 DOM 을 한 번에 가져와 파싱한 뒤 self.page_soup 에 저장합니다."""
+        try:
+            html = await self.page.evaluate("() => { const root = document.getElementById('root'); return root ? root.outerHTML : null; }")
+            self.page_soup = BeautifulSoup(html, "html.parser") if html else None
+        except Exception as e:
+            print(f"페이지 스냅샷 생성 중 오류 발생: {e}")
+            self.page_soup = None
+        return self.page_soup
+
+    async def get_section_soup(self, css_selector: str) -> BeautifulSoup | str:
+        """스냅샷에 섹션이 있으면 재사용하고 , 없으면 요소를 기다린 뒤 innerHTML 을 파싱합니다. (현재 페이지 동안 캐시)"""
+        if css_selector in self._section_cache:
+            return self._section_cache[css_selector]
+        section = self.page_soup.select_one(css_selector) if self.page_soup is not None else None
+        if section is None:
+            element = await self.wait_for_element_by_css_selector(css_selector)
+            section = self.error_message if element == self.error_message else BeautifulSoup(await element.inner_html(), "html.parser")
+        self._section_cache[css_selector] = section
+        return section
+
+    async def probe_elements(self, selectors: Dict[str, str], settle_ms: int = 300, time_out: float | None = None) -> Dict[str, bool]:
+        """DOM 변경이 settle_ms 동안 멈출 때까지 기다린 뒤 셀렉터별 존재 여부를 반환합니다. (Crawler.probe_elements 와 동일)"""
+        time_out = self.time_out if time_out is None else time_out
+        try:
+            return await _evaluate_async_script(self.page, _PROBE_ELEMENTS_SCRIPT, selectors, settle_ms, int(time_out * 1000))
+        except Exception as e:
+            print(f"요소 존재 여부 확인 중 오류 발생: {e}")
+            return {}
+
+    async def get_option_data(self, product_id: str) -> Dict | None:
+        """상품의 전체 옵션 데이터를 가져옵니다. (Crawler.get_option_data 와 동일)"""
+        api_url = self.option_api_url.format(product_id=product_id) if self.option_api_url else None
+        try:
+            result = await _evaluate_async_script(self.page, _OPTION_DATA_SCRIPT, api_url, int(self.time_out * 1000))
+            return result["data"] if result else None
+        except Exception as e:
+            print(f"옵션 데이터 조회 중 오류 발생: {e}")
+            return None
+
+    async def close(self) -> None:
+        try:
+            await self.context.close()
+        except Exception as e:
+            print(f"페이지 종료 중 오류 발생: {e}")
+
+
+async def _crawl_section(crawler: AsyncCrawler, product_id: str, section: str, logger: logging.Logger, num_reviews: int) -> Tuple[str, object]:
+    """섹션 하나를 Selenium 용 get_* 함수와 같은 파서로 크롤링합니다. (드롭다운 클릭 방식의 옵션 추출은 지원하지 않음)"""
+    try:
+        if section == "color_size_info":
+            option_data = await crawler.get_option_data(product_id)
+            if option_data is None:
+                logger.error(f"크롤링 실패 [Section 7] 옵션 데이터 조회 실패 : {product_id} ")
+                return "failed", SECTION_DEFAULT_VALUES[section]()
+            return parse_option_data(option_data)
+
+        if section == "detail_images" and crawler.page_soup is not None and crawler.page_soup.select_one(SECTION_SELECTORS[section]) is None:
+            return "not_exist", SECTION_DEFAULT_VALUES[section]()
+
+        soup = await crawler.get_section_soup(SECTION_SELECTORS[section])
+        if soup == crawler.error_message:
+            logger.error(f"크롤링 실패 [{section}] 요소 탐색 실패 (wait_for_element) : {product_id} ")
+            return "failed", SECTION_DEFAULT_VALUES[section]()
+        if section == "review_texts":
+            return parse_reviews_text(soup, num_reviews)
+        return _SECTION_PARSERS[section](soup)
+    except Exception as e:
+        logger.error(f"크롤링 실패 [{section}] 추출 중 오류 발생 : {product_id} , 에러 : {e}")
+        return "failed", SECTION_DEFAULT_VALUES[section]()
+
+
+_SECTION_PARSERS = {
+    "summary_images": parse_summary_images,
+    "detail_text": parse_detail_text,
+    "detail_images": parse_detail_images,
+    "size_detail_info": parse_size_detail_info,
+    "fit_info": parse_fit_info,
+}
+
+
+async def get_product_detail_info_async(crawler: AsyncCrawler, product_id: str, logger: logging.Logger, sections: List[str] | None = None,
+                                        breaker: SectionCircuitBreaker | None = None, num_reviews: int = 10) -> Dict:
+    """get_product_detail_info 의 AsyncCrawler 버전. 결과 형식(crawling_status , success_status 등)이 동일합니다."""
+    await crawler.go(f"{crawler.base_url}/{product_id}")
+
+    # 유효하지 않은 상품 처리 (경고창은 go() 가 반환된 뒤에 뜰 수 있으므로 섹션 대기 후 한 번 더 확인)
+    if await crawler.handle_alert() is not None:
+        logger.error(f"크롤링 실패 유효하지 않은 상품 id : {product_id} ")
+        return {
+            "success_status": "error_product_id"
+        }
+
+    presence = {}
+    if await crawler.wait_for_element_by_css_selector(SECTION_SELECTORS["summary_images"]) != crawler.error_message:
+        presence = await crawler.probe_elements(build_presence_selectors())
+        await crawler.take_page_snapshot()
+    elif await crawler.handle_alert() is not None:
+        logger.error(f"크롤링 실패 유효하지 않은 상품 id : {product_id} ")
+        return {
+            "success_status": "error_product_id"
+        }
+
+    # 섹션 처리 순서와 결과 조합은 동기 엔진과 같은 공통 로직(plan_detail_sections)을 사용
+    plan = plan_detail_sections(product_id, presence, sections, breaker)
+    try:
+        section = next(plan)
+        while True:
+            section = plan.send(await _crawl_section(crawler, product_id, section, logger, num_reviews))
+    except StopIteration as stop:
+        return stop.value
+
+
+async def crawl_product_details_async(browser: AsyncBrowser, summaries: List[Dict], logger: logging.Logger, concurrency: int = 20,
+                                      breaker: SectionCircuitBreaker | None = None) -> AsyncGenerator[Tuple[Dict, Dict], None]:
+    """
+    하나의 브라우저에서 concurrency 개의 페이지로 상품 상세정보를 동시에 크롤링하고 ,
+    (summary , detail_info) 를 완료되는 순서대로 반환합니다. (CrawlerPool.run 과 같은 형식)
+    """
+    pending = asyncio.Queue()
+    for summary in summaries:
+        pending.put_nowait(summary)
+    results = asyncio.Queue()
+
+    async def worker(worker_id: int):
+        crawler = None
+        try:
+            crawler = await browser.new_crawler()
+            while True:
+                try:
+                    summary = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                product_id = summary["product_id"]
+                try:
+                    detail_info = await get_product_detail_info_async(crawler, product_id, logger, breaker=breaker)
+                except Exception as e:
+                    # 한 상품의 예외가 다른 페이지에 영향을 주지 않도록 격리
+                    logger.error(f"[page {worker_id}] 상세 정보 크롤링 간 예기치 못한 예외 발생 {product_id} , 에러 : {e}")
+                    detail_info = {"product_id": product_id, "success_status": "failed"}
+                await results.put((_RESULT, (summary, detail_info)))
+        except Exception as e:
+            # 페이지 생성 실패 등 : 남은 상품은 다른 페이지들이 처리
+            logger.error(f"[page {worker_id}] 페이지 비정상 종료 , 에러 : {e}")
+        finally:
+            if crawler is not None:
+                await crawler.close()
+            await results.put((_DONE, None))
+
+    num_workers = max(1, min(concurrency, len(summaries)))
+    tasks = [asyncio.create_task(worker(worker_id)) for worker_id in range(num_workers)]
+    finished = 0
+    try:
+        while finished < num_workers:
+            kind, payload = await results.get()
+            if kind == _DONE:
+                finished += 1
+            else:
+                yield payload
+        # 모든 페이지가 비정상 종료되어 남은 상품 : worker_failed 로 돌려보냄
+        while not pending.empty():
+            summary = pending.get_nowait()
+            yield summary, {"product_id": summary["product_id"], "success_status": "worker_failed"}
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
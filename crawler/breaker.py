@@ -0,0 +1,81 @@
+import logging
+import threading
+from typing import Callable, Dict
+
+# 서킷 상태
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class SectionCircuitBreaker:
+    """
+    상세 페이지 섹션별 서킷 브레이커.
+    sc-* 클래스명이 바뀌어 한 섹션의 셀렉터가 깨지면 , 남은 상품마다 WebDriverWait 의 timeout 을 기다리지 않도록
+    연속 failure_threshold 번 실패한 섹션을 차단(open)하고 건너뜁니다.
+    차단된 섹션은 probe_interval 개 상품마다 한 번씩 시도(half-open)하여 성공하면 다시 열어줍니다(closed).
+
+    Args:
+        failure_threshold (int): 차단할 연속 실패 횟수
+        probe_interval (int): 차단 중 몇 개 상품마다 한 번씩 시도해볼지
+        alert_callback (Callable[[str, int], None], optional): 차단 시 호출할 함수 (섹션 이름 , 연속 실패 횟수)
+        logger (logging.Logger, optional): 차단/복구 로그를 남길 로거
+    """
+    def __init__(self, failure_threshold: int = 5, probe_interval: int = 50,
+                 alert_callback: Callable[[str, int], None] | None = None, logger: logging.Logger | None = None):
+        self.failure_threshold = failure_threshold
+        self.probe_interval = probe_interval
+        self.alert_callback = alert_callback
+        self.logger = logger or logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._state = {}
+        self._consecutive_failures = {}
+        self._skipped = {}
+
+    def allow(self, section: str) -> bool:
+        """해당 섹션을 이번 상품에서 실행해도 되는지 반환합니다."""
+        with self._lock:
+            state = self._state.get(section, CLOSED)
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN:
+                # 이미 시도 중인 probe 가 있으면 결과가 나올 때까지 건너뜀
+                return False
+            self._skipped[section] = self._skipped.get(section, 0) + 1
+            if self._skipped[section] >= self.probe_interval:
+                self._state[section] = HALF_OPEN
+                self._skipped[section] = 0
+                self.logger.info(f"[CircuitBreaker] {section} 섹션 복구 여부 확인(probe) 시도")
+                return True
+            return False
+
+    def record(self, section: str, status: str) -> None:
+        """실행한 섹션의 결과 상태(success / not_exist / failed 등)를 기록합니다."""
+        alert = None
+        with self._lock:
+            state = self._state.get(section, CLOSED)
+            if status in ("success", "not_exist"):
+                if state != CLOSED:
+                    self.logger.error(f"[CircuitBreaker] {section} 섹션 복구되어 다시 크롤링합니다.")
+                self._state[section] = CLOSED
+                self._consecutive_failures[section] = 0
+                return
+
+            failures = self._consecutive_failures.get(section, 0) + 1
+            self._consecutive_failures[section] = failures
+            if state == HALF_OPEN:
+                self._state[section] = OPEN
+            elif state == CLOSED and failures >= self.failure_threshold:
+                self._state[section] = OPEN
+                self._skipped[section] = 0
+                alert = failures
+
+        if alert is not None:
+            self.logger.error(f"[CircuitBreaker] {section} 섹션이 연속 {alert}번 실패하여 차단합니다. 셀렉터(클래스명) 변경 여부를 확인하세요.")
+            if self.alert_callback is not None:
+                self.alert_callback(section, alert)
+
+    def states(self) -> Dict[str, str]:
+        """섹션별 현재 서킷 상태를 반환합니다."""
+        with self._lock:
+            return dict(self._state)
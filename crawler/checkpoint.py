@@ -0,0 +1,212 @@
+import json
+import os
+from pathlib import Path
+from typing import Dict, Generator, Set
+
+from .crawler import DRIVER_RESTARTED, SECTION_DEFAULT_VALUES, get_failed_sections
+
+# 상세 정보 결과에 함께 저장하는 요약(summary) 정보 컬럼
+SUMMARY_KEYS_TO_MERGE = [
+    "product_id", "product_price", "product_original_price", "product_discount_price",
+    "product_discount_rate", "product_brand_name", "product_name",
+    "num_likes", "avg_rating", "review_count", "category_main",
+    "category_sub", "gender"
+]
+
+
+class JsonlWriter:
+    """
+    크롤링 결과를 한 줄(JSON)씩 바로 파일에 추가하는 append-only writer.
+    레코드마다 flush(+fsync) 하므로 프로세스가 죽어도 최대 한 개의 상품만 유실되고 , 메모리에 결과를 쌓지 않습니다.
+
+    Args:
+        file_path (str | Path): 저장할 .jsonl 파일 경로 (없으면 생성 , 있으면 이어쓰기)
+        fsync (bool): True 이면 레코드마다 디스크까지 동기화
+    """
+    def __init__(self, file_path: str | Path, fsync: bool = True):
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync = fsync
+        self.count = 0
+        self._file = open(self.file_path, "a", encoding="utf-8")
+        # 비정상 종료로 마지막 줄이 끝나지 않은 경우 , 새 레코드가 깨진 줄에 이어 붙지 않도록 줄바꿈 추가
+        if self.file_path.stat().st_size and not self._ends_with_newline():
+            self._file.write("\n")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.file_path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def write(self, record: Dict) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.count += 1
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def read_jsonl(file_path: str | Path) -> Generator[Dict, None, None]:
+    """
+    JSONL 파일의 레코드를 한 줄씩 읽습니다.
+    비정상 종료로 마지막 줄이 깨진 경우 해당 줄은 건너뜁니다.
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        return
+    with open(file_path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                print(f"손상된 JSONL 줄을 건너뜁니다: {file_path}")
+
+
+def load_product_ids(*file_paths: str | Path) -> Set[str]:
+    """이미 저장된 JSONL 파일들에서 product_id 집합을 읽어옵니다. (이어서 크롤링할 때 건너뛸 상품)"""
+    product_ids = set()
+    for file_path in file_paths:
+        for record in read_jsonl(file_path):
+            if record.get("product_id") is not None:
+                product_ids.add(str(record["product_id"]))
+    return product_ids
+
+
+def convert_jsonl_to_json(jsonl_path: str | Path, json_path: str | Path) -> int:
+    """
+    JSONL 파일을 기존 후처리 코드가 읽는 JSON 배열 파일로 변환합니다.
+    레코드를 하나씩 스트리밍하여 쓰므로 전체 결과를 메모리에 올리지 않습니다.
+
+    Returns:
+        int: 변환한 레코드 수
+    """
+    count = 0
+    with open(json_path, "w", encoding="utf-8") as f:
+        f.write("[\n")
+        for record in read_jsonl(jsonl_path):
+            if count:
+                f.write(",\n")
+            f.write(json.dumps(record, ensure_ascii=False, indent=4, default=str))
+            count += 1
+        f.write("\n]")
+    return count
+
+
+class RetryQueue:
+    """
+    일부 섹션만 실패한 상품을 (product_id , 실패 섹션 , 지금까지의 결과) 로 JSONL 파일에 저장하는 재시도 큐.
+    append-only 로 기록하며 같은 상품이 여러 번 기록된 경우 마지막 기록을 사용하고 ,
+    실패 섹션이 비어 있는 기록은 처리 완료(mark_done)를 뜻합니다.
+
+    Args:
+        file_path (str | Path): 재시도 큐 .jsonl 파일 경로
+    """
+    def __init__(self, file_path: str | Path):
+        self.file_path = Path(file_path)
+        self._writer = None
+
+    def add(self, record: Dict, failed_sections: list, attempts: int = 0) -> None:
+        if self._writer is None:
+            self._writer = JsonlWriter(self.file_path)
+        self._writer.write({
+            "product_id": record.get("product_id"),
+            "failed_sections": sorted(failed_sections),
+            "attempts": attempts,
+            "record": record,
+        })
+
+    def mark_done(self, product_id: str) -> None:
+        """재시도가 끝난(성공 또는 포기) 상품을 큐에서 제외합니다."""
+        self.add({"product_id": product_id}, [])
+
+    def load(self) -> Dict[str, Dict]:
+        """아직 처리되지 않은 product_id 별 마지막 재시도 항목을 반환합니다."""
+        latest = {str(entry["product_id"]): entry for entry in read_jsonl(self.file_path)}
+        return {product_id: entry for product_id, entry in latest.items() if entry["failed_sections"]}
+
+    def product_ids(self) -> Set[str]:
+        return set(self.load())
+
+    def load_grouped(self) -> Dict[tuple, list]:
+        """실패한 섹션 조합별로 재시도 항목을 묶어 반환합니다. (같은 섹션 조합끼리 연속으로 재시도하기 위함)"""
+        groups = {}
+        for entry in self.load().values():
+            groups.setdefault(tuple(entry["failed_sections"]), []).append(entry)
+        return groups
+
+    def compact(self) -> None:
+        """처리 완료/중복 기록을 제거하여 큐 파일을 다시 씁니다. (임시 파일에 쓴 뒤 교체)"""
+        entries = self.load()
+        self.close()
+        tmp_path = self.file_path.with_suffix(".tmp")
+        tmp_path.unlink(missing_ok=True)
+        with JsonlWriter(tmp_path, fsync=False) as writer:
+            for entry in entries.values():
+                writer.write(entry)
+        os.replace(tmp_path, self.file_path)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def merge_summary_into_detail(detail_info: Dict, product_summary) -> Dict:
+    """제품 요약 정보(dict 또는 itertuples 의 namedtuple)를 상세 정보 딕셔너리에 병합합니다."""
+    product_summary_dict = product_summary._asdict() if hasattr(product_summary, "_asdict") else product_summary
+    for key in SUMMARY_KEYS_TO_MERGE:
+        detail_info[key] = product_summary_dict.get(key)
+    return detail_info
+
+
+def store_detail_result(detail_info: Dict, success_writer: JsonlWriter, unavailable_writer: JsonlWriter, logger,
+                        retry_queue: RetryQueue | None = None) -> str:
+    """
+    상세 정보 크롤링 결과를 상태에 따라 성공 / 품절·정보없음 JSONL 파일에 바로 기록합니다.
+    일부 섹션만 실패한 경우 retry_queue 가 있으면 실패 섹션과 함께 재시도 큐에 넣습니다.
+    드라이버 재시작(DRIVER_RESTARTED)이나 워커 종료(worker_failed)로 크롤링하지 못한 상품은 전체 섹션을 재시도 큐에 넣습니다.
+    동기/비동기/작업 큐 실행 스크립트가 같은 기준으로 결과를 나누도록 함께 사용합니다.
+
+    Returns:
+        str: "success" , "unavailable" , "retry"(재시도 큐에 넣음) , "error_product_id" , "failed"(기록하지 못함) 중 하나
+    """
+    success_status = detail_info.get("success_status")
+    failed_sections = get_failed_sections(detail_info)
+    if success_status in (DRIVER_RESTARTED, "worker_failed"):
+        if retry_queue is not None:
+            retry_queue.add(detail_info, list(SECTION_DEFAULT_VALUES))
+            return "retry"
+        logger.error(f"크롤링하지 못한 상품 ({success_status}) : {detail_info.get('product_id')}")
+        return "failed"
+    if success_status == "success":
+        success_writer.write(detail_info)
+        return "success"
+    if detail_info.get("crawling_status", {}).get("color_size_info") == "not_exist":
+        unavailable_writer.write(detail_info)
+        return "unavailable"
+    if success_status == "error_product_id":
+        return "error_product_id"
+    if retry_queue is not None and failed_sections:
+        retry_queue.add(detail_info, failed_sections)
+        return "retry"
+    logger.error(f"상세 정보 크롤링 실패 : {detail_info.get('product_id')} , 상태 : {detail_info.get('crawling_status', success_status)}")
+    return "failed"
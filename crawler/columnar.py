@@ -0,0 +1,122 @@
+from pathlib import Path
+from typing import Dict, List
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pyarrow 는 선택 의존성 (pip install pyarrow)
+    pa = None
+    pq = None
+
+# 값의 종류가 적어 dictionary 인코딩(pandas 에서는 category)으로 저장할 컬럼
+DICTIONARY_COLUMNS = ["category_main", "category_sub", "gender", "product_brand_name", "success_status"]
+CRAWLING_STATUS_FIELDS = ["image_section", "detail_section"]
+
+
+def summary_schema() -> "pa.Schema":
+    """
+    목록 요약 정보(get_one_product_info 결과)의 Parquet 스키마.
+    숫자 필드는 crawler.numeric 으로 변환된 타입을 따르고 , crawling_status 는 섹션별 상태를 담는 struct 로 저장합니다.
+    """
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("category_main", category),
+        ("category_sub", category),
+        ("gender", category),
+        ("product_id", pa.string()),
+        ("product_name", pa.string()),
+        ("product_href", pa.string()),
+        ("product_price", pa.int64()),
+        ("product_original_price", pa.int64()),
+        ("product_discount_price", pa.int64()),
+        ("product_discount_rate", pa.int64()),
+        ("product_brand_name", category),
+        ("num_likes", pa.int64()),
+        ("avg_rating", pa.float64()),
+        ("review_count", pa.int64()),
+        ("num_likes_is_lower_bound", pa.bool_()),
+        ("review_count_is_lower_bound", pa.bool_()),
+        ("crawling_status", pa.struct([(field, category) for field in CRAWLING_STATUS_FIELDS])),
+        ("success_status", category),
+    ])
+
+
+class SummaryParquetWriter:
+    """
+    목록 크롤링 결과를 청크가 들어올 때마다 Parquet row group 으로 이어 쓰는 writer.
+    CSV 청크를 모두 저장했다가 다시 읽어 합치는 과정 없이 하나의 파일로 바로 저장합니다.
+    close() 시 파일 footer 가 기록되므로 예외가 나더라도 with 문으로 닫으면 그때까지의 결과는 읽을 수 있습니다.
+    dedup_column 이 있으면 이미 쓴 값과 중복되는 행은 쓰지 않습니다. (crawler.utils.merge_csv_chunks 와 같이 값이 없거나 "failed" 인 행은 유지)
+
+    Args:
+        file_path (str | Path): 저장할 .parquet 파일 경로 (덮어씀)
+        compression (str): 압축 방식
+        dedup_column (str, optional): 중복 제거 기준 컬럼. None 이면 중복 제거 안 함
+    """
+    def __init__(self, file_path: str | Path, compression: str = "zstd", dedup_column: str | None = "product_id"):
+        if pa is None:
+            raise ImportError("Parquet 로 저장하려면 pyarrow 패키지가 필요합니다. (pip install pyarrow)")
+        self.file_path = Path(file_path)
+        self.file_path.parent.mkdir(parents=True, exist_ok=True)
+        self.schema = summary_schema()
+        self.dedup_column = dedup_column
+        self.count = 0
+        self.num_duplicates = 0
+        self.num_row_groups = 0
+        self._seen = set()
+        self._writer = pq.ParquetWriter(self.file_path, self.schema, compression=compression,
+                                        use_dictionary=DICTIONARY_COLUMNS + [f"crawling_status.{field}" for field in CRAWLING_STATUS_FIELDS])
+
+    def _to_row(self, product_data: Dict) -> Dict:
+        row = {name: product_data.get(name) for name in self.schema.names}
+        status = product_data.get("crawling_status")
+        row["crawling_status"] = {field: status.get(field) for field in CRAWLING_STATUS_FIELDS} if isinstance(status, dict) else None
+        return row
+
+    def write(self, rows: List[Dict]) -> None:
+        """상품 정보 목록을 하나의 row group 으로 추가합니다."""
+        if self.dedup_column:
+            unique_rows = []
+            for row in rows:
+                key = row.get(self.dedup_column)
+                if key is not None and key != "failed":
+                    if key in self._seen:
+                        self.num_duplicates += 1
+                        continue
+                    self._seen.add(key)
+                unique_rows.append(row)
+            rows = unique_rows
+        if not rows:
+            return
+        table = pa.Table.from_pylist([self._to_row(row) for row in rows], schema=self.schema)
+        self._writer.write_table(table)
+        self.count += len(rows)
+        self.num_row_groups += 1
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def load_summary_parquet(file_path: str | Path, columns: List[str] | None = None, filters: List | None = None) -> pd.DataFrame:
+    """
+    SummaryParquetWriter 로 저장한 파일에서 필요한 컬럼만 읽어 DataFrame 으로 반환합니다.
+    dictionary 컬럼은 category , crawling_status 는 dict 로 읽힙니다.
+
+    Args:
+        file_path (str | Path): .parquet 파일 경로
+        columns (List[str], optional): 읽을 컬럼 (기본값 : 전체)
+        filters (List, optional): pyarrow 필터 (예: [("success_status", "==", "success")]) , row group 통계로 건너뛸 수 있는 부분은 읽지 않음
+    """
+    if pq is None:
+        raise ImportError("Parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다. (pip install pyarrow)")
+    return pq.read_table(file_path, columns=columns, filters=filters).to_pandas()
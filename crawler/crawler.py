@@ -1,54 +1,519 @@
 from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from typing import List , Dict , Tuple, Generator
+from typing import List , Dict , Tuple, Generator, Callable
 from bs4 import BeautifulSoup
 import time
 from selenium.webdriver.remote.webelement import WebElement
-from selenium.common.exceptions import NoAlertPresentException
+from selenium.common.exceptions import NoAlertPresentException, TimeoutException, UnexpectedAlertPresentException, WebDriverException, InvalidSessionIdException
 import logging
+import json
+from contextlib import contextmanager, nullcontext
+import re
+import psutil
+from .breaker import SectionCircuitBreaker
+from .timeouts import AdaptiveTimeouts
+from .driver_factory import USER_AGENT, DriverFactory, build_chrome_options
+from .rate_limit import HostRateLimiter
+from .metrics import MetricsRegistry
+from .archive import SnapshotArchive
+from .numeric import normalize_product_summary
 
-COLUMNS = ["category_main" , "category_sub" , "gender" , "product_id" ,"product_name", "product_href" ,"product_price" , "product_original_price" , "product_discount_price" , "product_discount_rate", "product_brand_name" , "num_likes" , "avg_rating" , "review_count"]
+# container 에 MutationObserver 를 설치하여 selector 요소가 렌더링되는 즉시(또는 selector 가 없으면 첫 변경 시) resolve 하는 스크립트
+# timeout 은 요소가 끝내 나타나지 않을 때의 안전장치로만 사용
+_WAIT_FOR_MUTATION_SCRIPT = """
+const [containerSelector, selector, timeoutMs, done] = arguments;
+const container = document.querySelector(containerSelector);
+if (!container) { done(null); return; }
+const find = () => selector ? container.querySelector(selector) : null;
+const found = find();
+if (found) { done(found); return; }
+let timer = null;
+const observer = new MutationObserver(() => {
+    const element = find();
+    if (!selector || element) {
+        observer.disconnect();
+        clearTimeout(timer);
+        done(selector ? element : true);
+    }
+});
+observer.observe(container, {childList: true, subtree: true});
+timer = setTimeout(() => { observer.disconnect(); done(null); }, timeoutMs);
+"""
+
+# 페이지의 DOM 변경이 settle_ms 동안 멈출 때까지(최대 timeout) 기다린 뒤 , 셀렉터별 존재 여부를 한 번에 반환하는 스크립트
+_PROBE_ELEMENTS_SCRIPT = """
+const [selectors, settleMs, timeoutMs, done] = arguments;
+const probe = () => {
+    const presence = {};
+    for (const [name, selector] of Object.entries(selectors)) {
+        presence[name] = document.querySelector(selector) !== null;
+    }
+    return presence;
+};
+let settleTimer = null;
+let hardTimer = null;
+const finish = () => { observer.disconnect(); clearTimeout(settleTimer); clearTimeout(hardTimer); done(probe()); };
+const observer = new MutationObserver(() => { clearTimeout(settleTimer); settleTimer = setTimeout(finish, settleMs); });
+observer.observe(document.body, {childList: true, subtree: true});
+settleTimer = setTimeout(finish, settleMs);
+hardTimer = setTimeout(finish, timeoutMs);
+"""
+
+# 상품 옵션(색상 x 사이즈 , 품절 여부) 전체를 한 번의 스크립트 호출로 가져오는 스크립트
+# 1) 페이지에 내장된 상태(window.__MSS__)에서 옵션 구조(basic + optionItems)를 찾고 , 2) 없으면 페이지가 사용하는 옵션 API 를 직접 호출
+# (apiUrl 이 null 이면 API 를 호출하지 않고 null 반환 : fixture 재생 중 실제 사이트로 요청이 나가지 않도록 함)
+_OPTION_DATA_SCRIPT = """
+const [apiUrl, timeoutMs, done] = arguments;
+const isOptionData = (obj) => obj && Array.isArray(obj.basic) && Array.isArray(obj.optionItems);
+const findOptionData = (root) => {
+    const queue = [[root, 0]];
+    const visited = new Set();
+    while (queue.length) {
+        const [obj, depth] = queue.shift();
+        if (!obj || typeof obj !== "object" || visited.has(obj) || depth > 6) continue;
+        visited.add(obj);
+        if (isOptionData(obj)) return obj;
+        for (const value of Object.values(obj)) queue.push([value, depth + 1]);
+    }
+    return null;
+};
+let embedded = null;
+try { embedded = findOptionData(window.__MSS__); } catch (e) { embedded = null; }
+if (embedded) { done({source: "state", data: embedded}); return; }
+if (!apiUrl) { done(null); return; }
+const controller = new AbortController();
+const timer = setTimeout(() => controller.abort(), timeoutMs);
+fetch(apiUrl, {credentials: "include", signal: controller.signal})
+    .then(response => response.ok ? response.json() : null)
+    .then(json => { clearTimeout(timer); const data = json && (json.data || json); done(isOptionData(data) ? {source: "api", data: data} : null); })
+    .catch(() => { clearTimeout(timer); done(null); });
+"""
+
+# 응답 본문을 가져오지 못한 네트워크 응답을 다시 시도할 최대 횟수 (get_json_responses 호출 기준 , 이후에는 버림)
+MAX_RESPONSE_BODY_ATTEMPTS = 5
+
+# 상품 옵션 API (페이지 내장 상태에 옵션 정보가 없을 때 사용)
+OPTION_API_URL = "https://goods-detail.musinsa.com/api2/goods/{product_id}/v2/options?goodsSaleType=SALE"
+
+# block_resources=True 일 때 CDP Network.setBlockedURLs 로 차단할 URL 패턴 (이미지/폰트/미디어 , 광고/트래킹 스크립트)
+# 이미지 url 은 img 태그의 src 속성에서 읽으므로 실제 다운로드는 필요 없음
+# 확장자 패턴은 경로 끝("*.png")이나 쿼리 앞("*.png?*")에서만 일치하도록 하여 "/api/icons" , "?format=png" 같은 API 요청은 차단하지 않음
+# (패턴의 와일드카드는 "*" 뿐이며 "?" 는 문자 그대로 비교)
+BLOCKED_URL_EXTENSIONS = [
+    "jpg" , "jpeg" , "png" , "gif" , "webp" , "avif" , "svg" , "ico" ,
+    "woff" , "woff2" , "ttf" , "otf" , "eot" ,
+    "mp4" , "webm" , "m3u8" , "mp3" ,
+]
+BLOCKED_URL_PATTERNS = [pattern for extension in BLOCKED_URL_EXTENSIONS for pattern in (f"*.{extension}" , f"*.{extension}?*")] + [
+    "*google-analytics.com*" , "*googletagmanager.com*" , "*googlesyndication.com*" , "*doubleclick.net*" ,
+    "*facebook.net*" , "*connect.facebook.com*" , "*criteo.*" , "*analytics.tiktok.com*" , "*hotjar.com*" ,
+    "*amplitude.com*" , "*braze.com*" , "*appsflyer.com*" , "*adservice.*" ,
+]
+
+# 미리 로드한 탭으로 전환할 때 document.readyState 를 기다리는 최대 시간(초)
+PREFETCH_READY_TIMEOUT = 30
+
+# 현재 문서 응답의 HTTP 상태 코드 (Navigation Timing Level 2 의 responseStatus , 지원하지 않는 브라우저는 null)
+_NAVIGATION_STATUS_SCRIPT = "const nav = performance.getEntriesByType('navigation')[0]; return nav && nav.responseStatus ? nav.responseStatus : null;"
+
+# 현재 문서의 Navigation Timing (navigationStart 기준 ms , 아직 발생하지 않은 이벤트는 0)
+_NAVIGATION_TIMING_SCRIPT = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav) return null;
+return {ttfb: nav.responseStart, dom_content_loaded: nav.domContentLoadedEventEnd, load: nav.loadEventEnd};
+"""
+
+# 드라이버(세션)가 죽은 것으로 판단하는 WebDriverException 메세지
+DEAD_SESSION_MESSAGES = ("invalid session id" , "session deleted" , "disconnected" , "tab crashed" , "chrome not reachable" , "no such window" , "target window already closed")
+
+# 처리 중 드라이버가 죽어 재시작된 상품의 success_status (호출한 쪽에서 다시 큐에 넣어야 함)
+DRIVER_RESTARTED = "driver_restarted"
+
+COLUMNS = ["category_main" , "category_sub" , "gender" , "product_id" ,"product_name", "product_href" ,"product_price" , "product_original_price" , "product_discount_price" , "product_discount_rate", "product_brand_name" , "num_likes" , "avg_rating" , "review_count" , "num_likes_is_lower_bound" , "review_count_is_lower_bound"]
 class Crawler:
-    def __init__(self, headless=False , base_url:str|None=None , time_out:int=3 , error_message:str = "failed"):
+    def __init__(self, headless=False , base_url:str|None=None , time_out:int=3 , error_message:str = "failed" , capture_network:bool=False ,
+                 page_load_strategy:str="normal" , block_resources:bool=False , blocked_url_patterns:List[str]|None=None ,
+                 adaptive_timeouts:AdaptiveTimeouts|None=None , num_tabs:int=1 ,
+                 max_products_per_driver:int|None=None , max_rss_mb:float|None=None , rss_check_interval:int=50 ,
+                 driver_factory:DriverFactory|None=None , rate_limiter:HostRateLimiter|None=None , metrics:MetricsRegistry|None=None ,
+                 option_api_url:str|None=OPTION_API_URL):
         self.base_url = base_url
         self.driver = None
         self.headless = headless
+        self.capture_network = capture_network
+        # 빠른 로딩 프로필 : page_load_strategy="eager" 이면 DOMContentLoaded 시점에 go() 가 반환되고 ,
+        # block_resources=True 이면 이미지 디코딩을 끄고 blocked_url_patterns 의 요청을 차단
+        self.page_load_strategy = page_load_strategy
+        self.block_resources = block_resources
+        self.blocked_url_patterns = BLOCKED_URL_PATTERNS if blocked_url_patterns is None else blocked_url_patterns
+        self._pending_responses = {}
         self.error_message = error_message
+        self.time_out = time_out
+        # num_tabs >= 2 이면 여분의 탭에서 다음 상품을 미리 로드(prefetch)하여 현재 상품 파싱과 다음 상품 로드를 겹침
+        self.num_tabs = num_tabs
+        self._prefetched = {}
+        self._dismissed_alert_text = None
+        # 셀렉터별 관측 지연시간으로 wait_for_element_by_css_selector 의 대기 시간/폴링 간격을 조절 (상한은 time_out)
+        self.adaptive_timeouts = adaptive_timeouts
+        if adaptive_timeouts is not None and adaptive_timeouts.max_timeout is None:
+            adaptive_timeouts.max_timeout = time_out
+        # 드라이버 재시작 기준 : go() 호출 수(max_products_per_driver) , 크롬 프로세스 메모리(max_rss_mb , rss_check_interval 번마다 확인)
+        self.max_products_per_driver = max_products_per_driver
+        self.max_rss_mb = max_rss_mb
+        self.rss_check_interval = rss_check_interval
+        self.products_served = 0
+        self.restart_count = 0
+        # 드라이버는 팩토리의 옵션으로 시작되므로 옵션이 다르면 조용히 무시하지 않고 에러 발생
+        if driver_factory is not None:
+            driver_factory.check_options(headless=headless , capture_network=capture_network ,
+                                         page_load_strategy=page_load_strategy , block_resources=block_resources)
+        self.driver_factory = driver_factory
+        self.startup_time = None
+        # 호스트별 요청 속도 제한 (go() , 목록 스크롤 전에 통과를 기다리고 , 응답 상태/timeout/경고창으로 속도를 조절)
+        self.rate_limiter = rate_limiter
+        self._last_url = None
+        # 단계별 span , WebDriver 명령 , Navigation Timing 을 히스토그램으로 기록
+        self.metrics = metrics
+        # 페이지 내장 상태에 옵션 정보가 없을 때 호출할 옵션 API (None 이면 호출하지 않음 , fixture 재생 시 사용)
+        self.option_api_url = option_api_url
         self.setup_driver(time_out)
         self.recommend_commercial_flag = True
+        self.page_soup = None
+        self._section_cache = {}
+        self.option_data = None
     
     def setup_driver(self, time_out:int):
-        """웹드라이버 설정"""
-        chrome_options = Options()
-        
-        if self.headless:
-            chrome_options.add_argument("--headless")
-        
-        # chrome_options.add_argument("--no-sandbox")
-        # chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--window-size=1600,1080")
-        chrome_options.add_argument("--disable-notifications")
-        
-        # 자동화 감지 방지
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option("useAutomationExtension", False)
-        chrome_options.add_argument("disable-blink-features=AutomationControlled")
-        
-        # User-Agent 설정
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36")
+        """웹드라이버 설정 (driver_factory 가 있으면 미리 띄워 둔 드라이버를 사용) 후 시작에 걸린 시간을 기록합니다."""
+        start = time.perf_counter()
+        if self.driver_factory is not None:
+            self.driver = self.driver_factory.acquire()
+        else:
+            chrome_options = build_chrome_options(headless=self.headless , capture_network=self.capture_network ,
+                                                  page_load_strategy=self.page_load_strategy , block_resources=self.block_resources)
+            # service = Service(ChromeDriverManager().install())
+            self.driver = webdriver.Chrome(options=chrome_options)
         
-        # service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(options=chrome_options)
+        if self.metrics is not None:
+            self.metrics.instrument_driver(self.driver)
+        self._apply_network_settings()
         self.wait = WebDriverWait(self.driver, time_out , poll_frequency=time_out/10)
+        self.startup_time = time.perf_counter() - start
+        print(f"웹드라이버 시작 완료 ({self.startup_time:.2f}초)")
+    
+    def _quit_driver(self):
+        if self.driver_factory is not None:
+            self.driver_factory.dispose(self.driver)
+        else:
+            self.driver.quit()
+    
+    def _apply_network_settings(self):
+        """현재 탭에 요청 차단(CDP) 설정을 적용합니다. CDP 설정은 탭마다 따로 적용해야 합니다."""
+        if self.block_resources and self.blocked_url_patterns:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.blocked_url_patterns})
+    
+    def get_browser_rss_mb(self) -> float | None:
+        """chromedriver 와 그 하위 크롬 프로세스(브라우저 , 렌더러 등)의 메모리(RSS) 합계(MB)를 반환합니다."""
+        try:
+            driver_process = psutil.Process(self.driver.service.process.pid)
+            processes = [driver_process] + driver_process.children(recursive=True)
+        except Exception:
+            return None
+        rss = 0
+        for process in processes:
+            try:
+                rss += process.memory_info().rss
+            except psutil.Error:
+                pass
+        return rss / 1024 / 1024
+    
+    def _recycle_reason(self) -> str | None:
+        if self.max_products_per_driver and self.products_served >= self.max_products_per_driver:
+            return f"상품 {self.products_served}개 처리"
+        if self.max_rss_mb and self.products_served and self.products_served % self.rss_check_interval == 0:
+            rss_mb = self.get_browser_rss_mb()
+            if rss_mb is not None and rss_mb >= self.max_rss_mb:
+                return f"크롬 메모리 {rss_mb:.0f}MB"
+        return None
     
+    @staticmethod
+    def is_dead_session_error(error:Exception) -> bool:
+        """드라이버 세션/브라우저가 죽어서 발생한 예외인지 확인합니다."""
+        if isinstance(error , InvalidSessionIdException):
+            return True
+        return isinstance(error , WebDriverException) and any(message in str(error).lower() for message in DEAD_SESSION_MESSAGES)
+    
+    def is_alive(self) -> bool:
+        try:
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+    
+    def restart(self , reason:str = ""):
+        """기존 드라이버를 종료하고 같은 설정(base_url , 옵션)으로 새 드라이버를 띄웁니다."""
+        print(f"웹드라이버 재시작 ({reason})")
+        try:
+            self._quit_driver()
+        except Exception:
+            pass
+        self.page_soup = None
+        self._section_cache = {}
+        self._prefetched = {}
+        self._dismissed_alert_text = None
+        self._pending_responses = {}
+        self.products_served = 0
+        self.restart_count += 1
+        self.setup_driver(self.time_out)
+    
+    def restart_if_dead(self) -> bool:
+        """드라이버가 죽었으면 재시작하고 True 를 반환합니다."""
+        if self.is_alive():
+            return False
+        self.restart("세션 종료 감지")
+        return True
     
     def go(self , url:str):
+        reason = self._recycle_reason()
+        if reason is not None:
+            self.restart(reason)
+        self.products_served += 1
+        self._last_url = url
+        # 미리 로드한 페이지는 prefetch() 에서 이미 rate limiter 를 통과함
+        if self.rate_limiter is not None and url not in self._prefetched:
+            self.rate_limiter.acquire(url)
+        try:
+            self._go(url)
+        except WebDriverException as e:
+            if self.rate_limiter is not None and isinstance(e , TimeoutException):
+                self.rate_limiter.record(url , throttled=True)
+            if not self.is_dead_session_error(e):
+                raise
+            # 렌더러 크래시 등으로 세션이 죽은 경우 새 드라이버로 한 번 더 시도
+            self.restart(f"세션 종료 감지 : {e.msg}")
+            self._go(url)
+        if self.rate_limiter is not None:
+            self.rate_limiter.record_status(url , self.get_navigation_status())
+    
+    def get_navigation_status(self) -> int | None:
+        """현재 문서 응답의 HTTP 상태 코드를 반환합니다. (알 수 없으면 None)"""
+        try:
+            return self.driver.execute_script(_NAVIGATION_STATUS_SCRIPT)
+        except UnexpectedAlertPresentException as e:
+            # 드라이버가 경고창을 자동으로 닫은 경우 handle_alert 에서 처리할 수 있도록 텍스트를 보관
+            self._dismissed_alert_text = e.alert_text or ""
+        except Exception:
+            pass
+        return None
+    
+    def span(self , step:str):
+        """metrics 가 있으면 step 의 소요 시간을 기록하는 context manager 를 반환합니다."""
+        return self.metrics.span(step) if self.metrics is not None else nullcontext()
+    
+    def record_navigation_timing(self):
+        """현재 문서의 TTFB , DOMContentLoaded , load 시점(초)을 metrics 에 기록합니다."""
+        if self.metrics is None:
+            return
+        try:
+            timing = self.driver.execute_script(_NAVIGATION_TIMING_SCRIPT)
+        except Exception:
+            return
+        for phase , value in (timing or {}).items():
+            if value and value > 0:
+                self.metrics.observe("navigation_timing_seconds" , value / 1000 , "페이지 이동 시작부터 각 이벤트까지의 시간(초)" , phase=phase)
+    
+    def throttle(self):
+        """목록 스크롤처럼 페이지 이동 없이 요청을 일으키기 전에 , 현재 호스트의 rate limiter 를 통과할 때까지 기다립니다."""
+        if self.rate_limiter is not None and self._last_url is not None:
+            self.rate_limiter.acquire(self._last_url)
+    
+    def _go(self , url:str):
+        self.page_soup = None  # 이전 페이지의 스냅샷 무효화
+        self._section_cache = {}  # 이전 페이지의 섹션 캐시 무효화
+        self.option_data = None
+        self._dismissed_alert_text = None
+        if self.capture_network:
+            self.clear_network_responses()
+        # 미리 로드해 둔 탭이 있으면 전환만 하고 , 사용되지 않은 나머지 탭은 다음 prefetch 에 재사용
+        handle = self._prefetched.pop(url, None)
+        self._prefetched = {}
+        if handle is not None:
+            try:
+                self.driver.switch_to.window(handle)
+                self._wait_for_ready_state()
+                return
+            except Exception as e:
+                print(f"미리 로드한 탭 전환 중 오류 발생: {e}")
         self.driver.get(url)
     
+    def prefetch(self , url:str) -> bool:
+        """
+        다음에 방문할 url 을 여분의 탭에서 로드하기 시작하고 바로 반환합니다. (num_tabs >= 2 일 때만 동작)
+        현재 탭에서 섹션을 파싱하는 동안 다음 페이지가 로드되며 , 이후 go(url) 은 해당 탭으로 전환만 합니다.
+        
+        Returns:
+            bool: 미리 로드를 시작했거나 이미 시작된 경우 True
+        """
+        if url in self._prefetched:
+            return True
+        if self.num_tabs < 2:
+            return False
+        current = self.driver.current_window_handle
+        busy = set(self._prefetched.values()) | {current}
+        idle = [handle for handle in self.driver.window_handles if handle not in busy]
+        try:
+            if idle:
+                self.driver.switch_to.window(idle[0])
+            elif len(self.driver.window_handles) < self.num_tabs:
+                self.driver.switch_to.new_window("tab")
+                self._apply_network_settings()
+            else:
+                return False
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(url)
+            # driver.get 과 달리 페이지 로드를 기다리지 않음
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+            self._prefetched[url] = self.driver.current_window_handle
+            return True
+        except Exception as e:
+            print(f"다음 페이지 미리 로드 중 오류 발생: {e}")
+            return False
+        finally:
+            self.driver.switch_to.window(current)
+    
+    def _wait_for_ready_state(self):
+        """전환한 탭이 page_load_strategy 에 해당하는 로드 상태가 될 때까지 기다립니다. (driver.get 과 같은 시점에 반환)"""
+        if self.page_load_strategy == "none":
+            return
+        ready_states = ("complete",) if self.page_load_strategy == "normal" else ("interactive" , "complete")
+        try:
+            WebDriverWait(self.driver, PREFETCH_READY_TIMEOUT, poll_frequency=0.05).until(
+                lambda driver: driver.execute_script("return document.readyState") in ready_states
+            )
+        except UnexpectedAlertPresentException as e:
+            # 드라이버가 경고창을 자동으로 닫은 경우 handle_alert 에서 처리할 수 있도록 텍스트를 보관
+            self._dismissed_alert_text = e.alert_text or ""
+    
+    def get_section_element(self, css_selector:str):
+        """
+        섹션 요소(WebElement)를 기다려 찾은 뒤 현재 페이지 동안 셀렉터 단위로 캐시합니다.
+        찾지 못한 경우도 캐시하여 같은 셀렉터를 쓰는 다른 섹션이 timeout 을 다시 기다리지 않도록 합니다.
+        """
+        cached = self._section_cache.get(css_selector)
+        if cached is not None and cached[0] is not None:
+            return cached[0]
+        element = self.wait_for_element_by_css_selector(css_selector)
+        self._section_cache[css_selector] = (element , cached[1] if cached else None)
+        return element
+    
+    def get_section_soup(self, css_selector:str) -> BeautifulSoup | str:
+        """
+        섹션 요소를 파싱한 BeautifulSoup 을 반환하며 , 현재 페이지 동안 셀렉터 단위로 캐시합니다.
+        페이지 스냅샷(self.page_soup)에 요소가 있으면 그대로 재사용하고 , 없으면 요소를 기다린 뒤 innerHTML 을 파싱합니다.
+        요소를 찾지 못하면 self.error_message 를 반환합니다.
+        """
+        cached = self._section_cache.get(css_selector)
+        if cached is not None and cached[1] is not None:
+            return cached[1]
+        element = cached[0] if cached else None
+        if self.page_soup is not None:
+            section = self.page_soup.select_one(css_selector)
+            if section is not None:
+                self._section_cache[css_selector] = (element , section)
+                return section
+        element = self.get_section_element(css_selector)
+        if element == self.error_message:
+            return self.error_message
+        soup = BeautifulSoup(element.get_attribute("innerHTML") , "html.parser")
+        self._section_cache[css_selector] = (element , soup)
+        return soup
+    
+    def get_option_data(self, product_id:str) -> Dict | None:
+        """
+        클릭 없이 한 번의 스크립트 호출로 상품의 전체 옵션 데이터(basic 옵션 그룹 + optionItems 조합/품절 정보)를 가져옵니다.
+        가져오지 못하면 None 을 반환합니다. (option_api_url 이 None 이면 페이지 내장 상태에서만 찾음)
+        """
+        api_url = self.option_api_url.format(product_id=product_id) if self.option_api_url else None
+        try:
+            self.driver.set_script_timeout(self.time_out + 1)
+            result = self.driver.execute_async_script(_OPTION_DATA_SCRIPT, api_url, int(self.time_out * 1000))
+            # 스냅샷 아카이브에 함께 저장할 수 있도록 현재 페이지 동안 보관
+            self.option_data = result["data"] if result else None
+            return self.option_data
+        except Exception as e:
+            print(f"옵션 데이터 조회 중 오류 발생: {e}")
+            return None
+    
+    def clear_network_responses(self):
+        """지금까지 쌓인 performance 로그와 대기 중인 응답 목록을 비웁니다."""
+        try:
+            self.driver.get_log("performance")
+        except Exception:
+            pass
+        self._pending_responses = {}
+    
+    def get_json_responses(self, url_pattern:str) -> List[Dict]:
+        """
+        performance 로그의 CDP Network 이벤트에서 url_pattern(정규식)에 맞는 JSON 응답 본문을 수집합니다.
+        아직 로딩이 끝나지 않아 본문을 가져오지 못한 응답은 다음 호출에서 다시 시도하며 ,
+        MAX_RESPONSE_BODY_ATTEMPTS 번 시도해도 가져오지 못하면(캐시에서 제거된 본문 등) 버립니다.
+        Crawler(capture_network=True) 로 생성해야 사용할 수 있습니다.
+        
+        Args:
+            url_pattern (str): 수집할 응답 URL 의 정규식
+        
+        Returns:
+            List[Dict]: 파싱된 JSON 응답 목록
+        """
+        if not self.capture_network:
+            raise RuntimeError("capture_network=True 로 생성된 Crawler 에서만 네트워크 응답을 수집할 수 있습니다.")
+        
+        pattern = re.compile(url_pattern)
+        for entry in self.driver.get_log("performance"):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, ValueError):
+                continue
+            if message.get("method") != "Network.responseReceived":
+                continue
+            response = message["params"]["response"]
+            if "json" in response.get("mimeType", "") and pattern.search(response.get("url", "")):
+                # 요청 id -> 본문 조회 시도 횟수
+                self._pending_responses.setdefault(message["params"]["requestId"] , 0)
+        
+        payloads = []
+        for request_id in list(self._pending_responses):
+            try:
+                body = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+                payloads.append(json.loads(body["body"]))
+                del self._pending_responses[request_id]
+            except ValueError:
+                # JSON 이 아닌 응답은 버림
+                del self._pending_responses[request_id]
+            except Exception:
+                # 아직 응답 본문이 준비되지 않은 경우 다음 호출에서 다시 시도
+                self._pending_responses[request_id] += 1
+                if self._pending_responses[request_id] >= MAX_RESPONSE_BODY_ATTEMPTS:
+                    print(f"응답 본문을 {MAX_RESPONSE_BODY_ATTEMPTS}번 가져오지 못해 버립니다: {request_id}")
+                    del self._pending_responses[request_id]
+        return payloads
+    
+    def take_page_snapshot(self) -> BeautifulSoup | None:
+        """
+        #root 하위 DOM 을 한 번의 JS 호출로 가져와 한 번만 파싱한 뒤 self.page_soup 에 저장합니다.
+        섹션마다 요소를 기다리고 innerHTML 을 가져와 다시 파싱하던 왕복을 하나로 줄이기 위해 사용합니다.
+        """
+        try:
+            html = self.driver.execute_script("const root = document.getElementById('root'); return root ? root.outerHTML : null;")
+            self.page_soup = BeautifulSoup(html , "html.parser") if html else None
+        except Exception as e:
+            print(f"페이지 스냅샷 생성 중 오류 발생: {e}")
+            self.page_soup = None
+        return self.page_soup
+    
     def click_element_by_css_selector(self, css_selector):
         """
         CSS 셀렉터를 사용하여 요소를 검색한 후 클릭합니다.
@@ -71,6 +536,8 @@ class Crawler:
         self.driver.execute_script(f"window.scrollTo({start}, {end});")
 
     def wait_for_element_by_css_selector(self, css_selector:str):
+        if self.adaptive_timeouts is not None:
+            return self._wait_for_element_adaptive(css_selector)
         try:
             element = self.wait.until(
                 EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
@@ -81,6 +548,72 @@ class Crawler:
             print(f"요소 로드 대기 중 오류 발생: {e}")
             return self.error_message
         
+    def _wait_for_element_adaptive(self, css_selector:str):
+        """
+        셀렉터별 관측 지연시간(p99 + 여유)을 실제 대기 시간으로 사용하여 짧은 폴링 간격으로 기다립니다.
+        나타나면 걸린 시간을 , 대기 시간 안에 나타나지 않으면 대기 시간을 censored 관측값으로 기록합니다.
+        (timeout 이 늘어나면 분위수가 커져 다음 대기 시간이 상한(max_timeout)까지 늘어남)
+        """
+        timeouts = self.adaptive_timeouts
+        timeout = timeouts.timeout_for(css_selector)
+        start = time.perf_counter()
+        try:
+            element = WebDriverWait(self.driver, timeout, poll_frequency=timeouts.poll_for(css_selector)).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
+            )
+            timeouts.record(css_selector, time.perf_counter() - start)
+            return element
+        except TimeoutException as e:
+            timeouts.record(css_selector, timeout, censored=True)
+            print(f"요소 로드 대기 중 오류 발생: {e}")
+            return self.error_message
+        except Exception as e:
+            print(f"요소 로드 대기 중 오류 발생: {e}")
+            return self.error_message
+        
+    def wait_for_element_by_mutation(self, container_selector:str, css_selector:str|None=None, time_out:float|None=None):
+        """
+        container_selector 요소에 MutationObserver 를 설치하고 css_selector 요소가 렌더링되는 즉시 반환합니다.
+        css_selector 가 None 이면 container 에 첫 DOM 변경이 생기는 즉시 True 를 반환합니다.
+        고정 sleep 없이 사이트의 렌더링 속도만큼만 기다리며 , time_out 은 안전장치로만 사용됩니다.
+        
+        Args:
+            container_selector (str): 관찰할 컨테이너의 CSS 셀렉터
+            css_selector (str, optional): container 내부에서 기다릴 요소의 CSS 셀렉터
+            time_out (float, optional): 최대 대기 시간(초). 기본값은 self.time_out
+        """
+        time_out = self.time_out if time_out is None else time_out
+        try:
+            self.driver.set_script_timeout(time_out + 1)
+            result = self.driver.execute_async_script(_WAIT_FOR_MUTATION_SCRIPT, container_selector, css_selector, int(time_out * 1000))
+            if result is None:
+                return self.error_message
+            return result
+        except Exception as e:
+            print(f"요소 렌더링 대기 중 오류 발생: {e}")
+            return self.error_message
+        
+    def probe_elements(self, selectors:Dict[str , str], settle_ms:int=300, time_out:float|None=None) -> Dict[str , bool]:
+        """
+        페이지가 안정(settle_ms 동안 DOM 변경 없음)될 때까지 기다린 뒤 , 한 번의 JS 호출로 셀렉터별 존재 여부를 반환합니다.
+        없는 섹션을 찾느라 WebDriverWait 의 전체 timeout 을 기다리지 않기 위해 사용합니다.
+        
+        Args:
+            selectors (Dict[str, str]): {이름: CSS 셀렉터}
+            settle_ms (int): DOM 변경이 없어야 하는 시간(ms)
+            time_out (float, optional): 최대 대기 시간(초). 기본값은 self.time_out
+        
+        Returns:
+            Dict[str, bool]: {이름: 존재 여부}. 확인에 실패하면 모든 값을 True 로 반환하여 기존 대기 방식으로 진행되도록 함
+        """
+        time_out = self.time_out if time_out is None else time_out
+        try:
+            self.driver.set_script_timeout(time_out + 1)
+            return self.driver.execute_async_script(_PROBE_ELEMENTS_SCRIPT, selectors, settle_ms, int(time_out * 1000))
+        except Exception as e:
+            print(f"요소 존재 여부 확인 중 오류 발생: {e}")
+            return {name: True for name in selectors}
+        
     def wait_for_element_by_xpath(self, xpath:str):
         try:
             element = self.wait.until(
@@ -148,6 +681,10 @@ class Crawler:
         페이지에 나타나는 경고창(alert)을 처리합니다.
         경고창이 있으면 텍스트를 반환하고 '확인'을 누르고, 없으면 None을 반환합니다.
         """
+        if self._dismissed_alert_text is not None:
+            alert_text , self._dismissed_alert_text = self._dismissed_alert_text , None
+            print(f"경고창 감지: '{alert_text}'")
+            return alert_text
         try:
             alert = self.driver.switch_to.alert
             alert_text = alert.text
@@ -160,9 +697,12 @@ class Crawler:
 
     def close(self):
         """웹드라이버를 안전하게 종료합니다."""
+        if self.adaptive_timeouts is not None:
+            # 다음 실행에서 이어서 사용하도록 관측값 저장
+            self.adaptive_timeouts.save()
         try:
             if self.driver:
-                self.driver.quit()
+                self._quit_driver()
                 print("웹드라이버가 안전하게 종료되었습니다.")
         except Exception as e:
             print(f"웹드라이버 종료 중 오류 발생: {e}")
@@ -204,6 +744,10 @@ def fill_value(product_data:Dict , **kwargs)->Dict:
 
 
 def get_one_product_info(item :BeautifulSoup ,  **params)->Dict :
+    """
+    목록의 상품 한 개의 요약 정보를 추출합니다.
+    가격/할인율은 int , 좋아요/리뷰 수는 int("1.2만" -> 12000 , "+" 는 *_is_lower_bound=True) , 평점은 float 로 변환합니다.
+    """
     product_data = {}
     product_data["crawling_status"] = {"image_section":"success" , "detail_section":"success"}
     try:
@@ -254,7 +798,7 @@ def get_one_product_info(item :BeautifulSoup ,  **params)->Dict :
         fill_default_value(product_data , ["product_name" , "num_likes" , "avg_rating" , "review_count"] , "failed")
         product_data["crawling_status"]["detail_section"] = "failed"
         product_data["success_status"] = "failed"
-    return product_data
+    return normalize_product_summary(product_data)
 
 def get_row_product_info(soup:BeautifulSoup  , **params) -> List[Dict]:
         # target_element = soup.select_one(f'div[data-index="{page_index}"]')
@@ -267,14 +811,24 @@ def get_row_product_info(soup:BeautifulSoup  , **params) -> List[Dict]:
         
         return product_list
     
-def crawl_product_list(crawler:Crawler, num_scrolls:int=None, infinite_scroll:bool=False, **params) -> Generator[Dict, None, None]:
+def crawl_product_list(crawler:Crawler, num_scrolls:int=None, infinite_scroll:bool=False, use_observer:bool=False, **params) -> Generator[Dict, None, None]:
+    """
+    카테고리 목록 페이지를 한 행(data-index)씩 스크롤하며 상품 정보를 반환합니다.
+    use_observer=True 이면 고정 sleep 대신 MutationObserver 로 다음 행이 렌더링되는 즉시 진행합니다.
+    """
     scroll_count = 0
+    container_selector = ".sc-k7xv49-0"
+    
+    def wait_for_row(index:int):
+        if use_observer:
+            return crawler.wait_for_element_by_mutation(container_selector, f"div[data-index='{index}']")
+        return crawler.wait_for_element_by_css_selector(f"{container_selector} div[data-index='{index}']")
     
     while True:
         # 1. Wait for the current row to be present
-        try:
-            target_element = crawler.wait_for_element_by_css_selector(f".sc-k7xv49-0 div[data-index='{scroll_count}']")
-        except:
+        # (대기 함수들은 예외 대신 crawler.error_message 를 반환)
+        target_element = wait_for_row(scroll_count)
+        if target_element == crawler.error_message:
             print(f"더 이상 크롤링할 상품이 없습니다. 총 {scroll_count}번의 스크롤 진행.")
             break
 
@@ -291,25 +845,37 @@ def crawl_product_list(crawler:Crawler, num_scrolls:int=None, infinite_scroll:bo
         # 3. Find the next element and scroll to it to trigger loading the next one
         try:
             # We look for scroll_count + 1 to scroll to it.
-            next_element_to_scroll = crawler.wait_for_element_by_css_selector(f".sc-k7xv49-0 div[data-index='{scroll_count + 1}']")
+            next_element_to_scroll = wait_for_row(scroll_count + 1)
+            if next_element_to_scroll == crawler.error_message:
+                raise TimeoutException(f"data-index {scroll_count + 1} 행 로드 실패")
             
             # Use scrollIntoView to bring the next element into the viewport.
+            crawler.throttle()
             crawler.driver.execute_script("arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});", next_element_to_scroll)
             
             # Give a brief moment for any JS to fire after scrolling
-            time.sleep(0.5) 
+            # (observer 모드에서는 다음 반복의 wait_for_row 가 렌더링 완료 시점까지만 기다리므로 sleep 불필요)
+            if not use_observer:
+                time.sleep(0.5) 
 
         except Exception:
             # This can happen if we've truly reached the end of the list.
             print(f"다음 상품 목록(data-index: {scroll_count + 1})을 찾을 수 없어 스크롤을 중단합니다.")
             
             # Before breaking, let's try one last scroll to the bottom of the page
-            last_height = crawler.driver.execute_script("return document.body.scrollHeight")
-            crawler.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(1) # Wait for content to load
-            new_height = crawler.driver.execute_script("return document.body.scrollHeight")
+            if use_observer:
+                # 가상화된 목록은 스크롤 시 행을 제거(unmount)하기도 하므로 DOM 변경이 아닌 다음 행의 렌더링 여부로 판단
+                crawler.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                next_row_selector = f"div[data-index='{scroll_count + 1}']"
+                is_new_content = crawler.wait_for_element_by_mutation(container_selector, next_row_selector) != crawler.error_message
+            else:
+                last_height = crawler.driver.execute_script("return document.body.scrollHeight")
+                crawler.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+                time.sleep(1) # Wait for content to load
+                new_height = crawler.driver.execute_script("return document.body.scrollHeight")
+                is_new_content = new_height != last_height
             
-            if new_height == last_height:
+            if not is_new_content:
                 print("페이지의 끝에 도달했습니다.")
                 break # Exit the loop
             else:
@@ -324,19 +890,381 @@ def crawl_product_list(crawler:Crawler, num_scrolls:int=None, infinite_scroll:bo
         
     
 
+# 현재 렌더링된 모든 행의 상품 정보를 브라우저에서 파싱하여 [위치 키("data-index:행 안의 순서") , 필드 순서대로의 배열] 목록으로 반환하는 스크립트
+# get_one_product_info 와 동일한 셀렉터를 사용하며 , 전송량을 줄이기 위해 dict 대신 배열로 반환
+_BULK_PRODUCT_FIELDS = ["product_id" , "product_href" , "product_price" , "product_original_price" , "product_discount_price" , "product_discount_rate" , "product_brand_name" , "product_name" , "num_likes" , "avg_rating" , "review_count"]
+_EXTRACT_RENDERED_PRODUCTS_SCRIPT = """
+const text = (root, selector) => {
+    const element = root ? root.querySelector(selector) : null;
+    return element ? element.textContent : null;
+};
+const items = [];
+const positions = {};
+document.querySelectorAll(arguments[0] + " div[data-index] .sc-igtioI").forEach(item => {
+    // 행(data-index) 안에서의 순서로 위치 키를 만들어 product_id 를 읽지 못한 상품도 구분할 수 있도록 함
+    const dataIndex = item.closest("div[data-index]").getAttribute("data-index");
+    positions[dataIndex] = (positions[dataIndex] || 0) + 1;
+    const key = dataIndex + ":" + (positions[dataIndex] - 1);
+    const a = item.querySelector(".sc-bgpKpp a");
+    const detail = item.querySelector(".sc-oDVYc");
+    const image = a ? [a.getAttribute("data-item-id"), a.getAttribute("href"), a.getAttribute("data-price"),
+                       a.getAttribute("data-original-price"), a.getAttribute("data-discount"),
+                       a.getAttribute("data-discount-rate"), a.getAttribute("data-brand-id")] : null;
+    let reviewCount = text(detail, ".sc-iayzNI:nth-of-type(2) span:nth-child(2)");
+    reviewCount = reviewCount && reviewCount.length > 2 ? reviewCount.slice(1, -1) : null;
+    const info = detail ? [text(detail, "a:nth-child(2)"), text(detail, ".sc-iayzNI:nth-of-type(1) span"),
+                           text(detail, ".sc-iayzNI:nth-of-type(2) span:nth-child(1)"), reviewCount] : null;
+    items.push([key, image, info]);
+});
+return [items, window.innerHeight + window.scrollY >= document.body.scrollHeight - 2];
+"""
+
+def _bulk_item_to_product_info(image:List|None , info:List|None , **params) -> Dict:
+    """_EXTRACT_RENDERED_PRODUCTS_SCRIPT 의 배열 결과를 get_one_product_info 와 같은 형태의 dict 로 변환"""
+    product_data = {}
+    product_data["crawling_status"] = {"image_section":"success" , "detail_section":"success"}
+    image_columns , info_columns = _BULK_PRODUCT_FIELDS[:7] , _BULK_PRODUCT_FIELDS[7:]
+    if image:
+        fill_value(product_data , **dict(zip(image_columns , image)))
+    else:
+        fill_default_value(product_data , image_columns , "failed")
+        product_data["crawling_status"]["image_section"] = "failed"
+    if info:
+        fill_value(product_data , **dict(zip(info_columns , info)))
+    else:
+        fill_default_value(product_data , info_columns , "failed")
+        product_data["crawling_status"]["detail_section"] = "failed"
+    fill_value(product_data , **params)
+    product_data["success_status"] = "success" if image and info else "failed"
+    return normalize_product_summary(product_data)
+
+def crawl_product_list_bulk(crawler:Crawler, num_scrolls:int=None, infinite_scroll:bool=False, max_idle_scrolls:int=3, **params) -> Generator[List[Dict], None, None]:
+    """
+    카테고리 목록 페이지를 한 화면(viewport)씩 스크롤하며 , 한 번의 execute_script 호출로
+    현재 렌더링된 모든 행의 상품 정보를 브라우저에서 추출합니다.
+    이미 반환한 상품은 product_id 기준으로 제외하고 새로 나타난 상품 목록만 반환합니다.
+    product_id 를 읽지 못한(실패한) 상품은 목록에서의 위치(data-index , 행 안의 순서) 기준으로 한 번만 반환합니다.
+    
+    Args:
+        crawler (Crawler): 카테고리 페이지로 이동한 Crawler
+        num_scrolls (int, optional): 최대 스크롤(화면) 횟수
+        infinite_scroll (bool): True 이면 num_scrolls 를 무시하고 목록 끝까지 진행
+        max_idle_scrolls (int): 페이지 끝에서 새 상품 없이 허용할 연속 스크롤 횟수
+        **params: 각 상품 정보에 추가할 값 (category_main , category_sub , gender 등)
+    """
+    container_selector = ".sc-k7xv49-0"
+    seen_product_ids = set()
+    seen_failed_positions = set()
+    scroll_count = 0
+    idle_scrolls = 0
+    
+    while True:
+        items , is_bottom = crawler.driver.execute_script(_EXTRACT_RENDERED_PRODUCTS_SCRIPT , container_selector)
+        
+        product_list = []
+        for position , image , info in items:
+            product_id = image[0] if image else None
+            seen = seen_product_ids if product_id is not None else seen_failed_positions
+            key = product_id if product_id is not None else position
+            if key in seen:
+                continue
+            seen.add(key)
+            product_list.append(_bulk_item_to_product_info(image , info , **params))
+        if product_list:
+            yield product_list
+        
+        # 새 상품 없이 페이지 끝에 머무르는 횟수로 목록의 끝을 판단
+        idle_scrolls = idle_scrolls + 1 if (is_bottom and not product_list) else 0
+        if idle_scrolls >= max_idle_scrolls:
+            print(f"페이지의 끝에 도달했습니다. 총 {len(seen_product_ids)}개 상품 , {scroll_count}번의 스크롤 진행.")
+            break
+        if not infinite_scroll and num_scrolls is not None and scroll_count >= num_scrolls:
+            print(f"지정된 스크롤 횟수({num_scrolls})에 도달했습니다.")
+            break
+        
+        # 한 화면만큼 스크롤한 뒤 다음 행이 렌더링될 때까지(DOM 변경) 대기
+        crawler.throttle()
+        crawler.driver.execute_script("window.scrollBy(0, window.innerHeight);")
+        crawler.wait_for_element_by_mutation(container_selector)
+        
+        scroll_count += 1
+        if scroll_count % 10 == 0:
+            print(f"현재 scroll_count : {scroll_count} , 수집한 상품 수 : {len(seen_product_ids)}")
+
+# 카테고리 목록 페이지가 가상 스크롤 목록을 채우기 위해 호출하는 상품 목록 API
+LISTING_API_URL_PATTERN = r"/api2/dp/v\d+/plp/goods"
+
+def _find_listing_items(payload:Dict) -> Tuple[List[Dict] , bool]:
+    """목록 API 응답에서 (상품 목록 , 다음 페이지 존재 여부) 를 추출합니다."""
+    data = payload.get("data") if isinstance(payload.get("data") , dict) else payload
+    items = data.get("list") or []
+    pagination = data.get("pagination") or {}
+    has_next = pagination.get("hasNext" , True) if pagination else bool(items)
+    return [item for item in items if isinstance(item , dict) and "goodsNo" in item] , has_next
+
+def parse_listing_api_item(item:Dict , **params) -> Dict:
+    """
+    목록 API 의 상품 한 개를 COLUMNS 스키마(get_one_product_info 와 같은 형태 , 숫자 필드는 타입이 있는 값)로 변환합니다.
+    목록 API 에는 좋아요 수가 없으므로 num_likes 는 None 으로 채웁니다.
+    """
+    def to_str(value):
+        return None if value is None else str(value)
+    
+    product_data = {}
+    product_data["crawling_status"] = {"image_section":"success" , "detail_section":"success"}
+    try:
+        price , original_price = item.get("price") , item.get("normalPrice")
+        discount_price = original_price - price if isinstance(price , (int , float)) and isinstance(original_price , (int , float)) else None
+        # 리뷰 점수는 100점 만점으로 내려오므로 화면 표시와 같은 5점 만점으로 변환
+        review_score = item.get("reviewScore")
+        avg_rating = round(review_score / 20 , 1) if isinstance(review_score , (int , float)) and review_score > 5 else review_score
+        fill_value(product_data ,
+                   product_id = to_str(item.get("goodsNo")) ,
+                   product_name = item.get("goodsName") ,
+                   product_href = item.get("goodsLinkUrl") ,
+                   product_price = price ,
+                   product_original_price = original_price ,
+                   product_discount_price = discount_price ,
+                   product_discount_rate = item.get("saleRate") ,
+                   product_brand_name = item.get("brand") ,
+                   num_likes = None ,
+                   avg_rating = avg_rating ,
+                   review_count = item.get("reviewCount"))
+        fill_value(product_data , **params)
+        product_data["success_status"] = "success"
+    except Exception as e:
+        print(f"목록 API 상품 정보 변환 중 오류 발생: {e}")
+        fill_default_value(product_data , [column for column in COLUMNS if column not in params] , "failed")
+        fill_value(product_data , **params)
+        product_data["crawling_status"] = {"image_section":"failed" , "detail_section":"failed"}
+        product_data["success_status"] = "failed"
+    return normalize_product_summary(product_data)
+
+def crawl_product_list_network(crawler:Crawler, num_scrolls:int=None, infinite_scroll:bool=False, api_url_pattern:str=LISTING_API_URL_PATTERN, max_idle_scrolls:int=3, **params) -> Generator[List[Dict], None, None]:
+    """
+    카테고리 목록 페이지가 호출하는 목록 API(XHR) 응답을 CDP Network 이벤트로 가로채 상품 정보를 반환합니다.
+    스크롤은 다음 페이지 요청을 발생시키는 용도로만 사용하며 , DOM 은 파싱하지 않습니다.
+    목록 API 응답을 하나도 수집하지 못한 경우에만 DOM 파싱(crawl_product_list_bulk)으로 대체합니다.
+    
+    Args:
+        crawler (Crawler): capture_network=True 로 생성되어 카테고리 페이지로 이동한 Crawler
+        num_scrolls (int, optional): 최대 스크롤 횟수
+        infinite_scroll (bool): True 이면 num_scrolls 를 무시하고 목록 끝까지 진행
+        api_url_pattern (str): 목록 API URL 정규식
+        max_idle_scrolls (int): 새 응답 없이 허용할 연속 스크롤 횟수
+        **params: 각 상품 정보에 추가할 값 (category_main , category_sub , gender 등)
+    """
+    if not crawler.capture_network:
+        print("네트워크 응답 수집이 비활성화되어 있어 DOM 파싱으로 진행합니다.")
+        yield from crawl_product_list_bulk(crawler, num_scrolls=num_scrolls, infinite_scroll=infinite_scroll, **params)
+        return
+    
+    container_selector = ".sc-k7xv49-0"
+    seen_product_ids = set()
+    scroll_count = 0
+    idle_scrolls = 0
+    has_next = True
+    
+    while True:
+        product_list = []
+        for payload in crawler.get_json_responses(api_url_pattern):
+            items , page_has_next = _find_listing_items(payload)
+            if items and not page_has_next:
+                has_next = False
+            for item in items:
+                product_data = parse_listing_api_item(item , **params)
+                if product_data["product_id"] in seen_product_ids:
+                    continue
+                seen_product_ids.add(product_data["product_id"])
+                product_list.append(product_data)
+        if product_list:
+            yield product_list
+        
+        idle_scrolls = 0 if product_list else idle_scrolls + 1
+        if idle_scrolls >= max_idle_scrolls:
+            if not seen_product_ids:
+                print("목록 API 응답을 찾지 못해 DOM 파싱으로 진행합니다.")
+                # 가상 스크롤 목록은 화면 밖의 행을 DOM 에서 제거하므로 맨 위로 돌아가 첫 행부터 다시 렌더링
+                crawler.driver.execute_script("window.scrollTo(0, 0);")
+                crawler.wait_for_element_by_mutation(container_selector, "div[data-index='0']")
+                yield from crawl_product_list_bulk(crawler, num_scrolls=num_scrolls, infinite_scroll=infinite_scroll, **params)
+                return
+            print(f"새로운 목록 응답이 없어 종료합니다. 총 {len(seen_product_ids)}개 상품 , {scroll_count}번의 스크롤 진행.")
+            break
+        if not has_next:
+            print(f"목록의 마지막 페이지에 도달했습니다. 총 {len(seen_product_ids)}개 상품")
+            break
+        if not infinite_scroll and num_scrolls is not None and scroll_count >= num_scrolls:
+            print(f"지정된 스크롤 횟수({num_scrolls})에 도달했습니다.")
+            break
+        
+        # 페이지 끝으로 스크롤하여 다음 목록 요청을 발생시키고 렌더링(DOM 변경)까지 대기
+        crawler.throttle()
+        crawler.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        crawler.wait_for_element_by_mutation(container_selector)
+        scroll_count += 1
+
+# 상품 상세 페이지의 섹션별 CSS 셀렉터
+SECTION_SELECTORS = {
+    "summary_images": "#root .sc-366fl4-1",
+    "detail_text": "#root .sc-g3hx4t-4 .sc-2ll6b5-0",
+    "detail_images": ".sc-g3hx4t-4 .sc-1ikk4lv-4",
+    "review_texts": "#root > div.sc-3weaze-0 .goods-reviewpage__Container-sc-1iio9o6-0",
+    "size_detail_info": "#root > .sc-3weaze-0 > .sc-4n9q35-0 > .sc-g3hx4t-4[data-index='1']",
+    "fit_info": "#root > .sc-3weaze-0 > .sc-4n9q35-0 > .sc-g3hx4t-4[data-index='1']",
+    "color_size_info": ".sc-1puoja0-0 .gtm-impression-content .pt-1.pb-2",
+}
+
+# 상품에 따라 아예 없을 수 있는 섹션 : 페이지 안정 후 한 번에 존재 여부를 확인하여 없으면 대기 없이 not_exist 처리
+OPTIONAL_SECTIONS = ["review_texts" , "size_detail_info" , "fit_info" , "color_size_info"]
+
+# 선택 섹션의 존재 여부 확인 : 섹션 내용(SECTION_PROBES)이 없고 그 내용을 담는 부모 요소(SECTION_ANCHORS)는 렌더링되었을 때에만 not_exist 로 처리하고 ,
+# 부모까지 없으면(클래스명 변경 , 늦은 렌더링) 기존처럼 섹션을 기다려 failed 로 기록되도록 함 (서킷 브레이커에도 기록)
+# 리뷰 / 사이즈 / 핏 정보는 섹션 요소 자체가 부모이며 , 내용 셀렉터는 각 파서가 not_exist 를 판단하는 조건과 동일
+# (형제 탭 패널은 섹션이 늦게 렌더링되어도 먼저 렌더링되므로 기준으로 사용하지 않음)
+SECTION_ANCHORS = {
+    "review_texts": SECTION_SELECTORS["review_texts"],
+    "size_detail_info": SECTION_SELECTORS["size_detail_info"],
+    "fit_info": SECTION_SELECTORS["fit_info"],
+    # 옵션 선택 영역이 없을 때 품절/옵션 없음으로 판단하던 기존 부모 요소 확인과 동일
+    "color_size_info": ".sc-1puoja0-0 .gtm-impression-content",
+}
+SECTION_PROBES = {
+    # parse_reviews_text : 리뷰 영역의 자식 div 가 3개 이상이어야 리뷰가 있음
+    "review_texts": f"{SECTION_SELECTORS['review_texts']} > div:nth-of-type(3)",
+    "size_detail_info": f"{SECTION_SELECTORS['size_detail_info']} div.sc-1jg999i-0",
+    "fit_info": f"{SECTION_SELECTORS['fit_info']} .sc-36xiah-0.gtm-impression-content .sc-36xiah-2",
+    "color_size_info": SECTION_SELECTORS["color_size_info"],
+}
+_ANCHOR_SUFFIX = ":anchor"
+
+def build_presence_selectors() -> Dict[str , str]:
+    """probe_elements 로 한 번에 확인할 선택 섹션 내용과 부모 요소의 셀렉터"""
+    selectors = {}
+    for name in OPTIONAL_SECTIONS:
+        selectors[name] = SECTION_PROBES[name]
+        selectors[name + _ANCHOR_SUFFIX] = SECTION_ANCHORS[name]
+    return selectors
+
+def get_absent_sections(presence:Dict[str , bool]) -> List[str]:
+    """부모 요소는 있는데 섹션 내용만 없는 선택 섹션 목록 (대기 없이 not_exist 로 처리해도 되는 섹션)"""
+    return [name for name in OPTIONAL_SECTIONS if presence.get(name) is False and presence.get(name + _ANCHOR_SUFFIX) is True]
+
+# 섹션별 결과의 기본값 (섹션이 없거나 건너뛴 경우 사용)
+SECTION_DEFAULT_VALUES = {
+    "summary_images": list ,
+    "detail_text": dict ,
+    "detail_images": list ,
+    "review_texts": list ,
+    "size_detail_info": list ,
+    "fit_info": dict ,
+    "color_size_info": dict ,
+}
+
+def is_exist_section(crawler:Crawler , css_selector:str) -> bool:
+    """스냅샷이 있으면 스냅샷에서 , 없으면 현재 페이지에서 요소 존재 여부를 확인합니다."""
+    if crawler.page_soup is not None:
+        return crawler.page_soup.select_one(css_selector) is not None
+    return crawler.is_exist_element(css_selector)
+
+# 섹션별 파서 : 섹션 요소(BeautifulSoup)만 받아 (status , value) 를 반환하며 , 드라이버에 의존하지 않음
+def parse_summary_images(section:BeautifulSoup) -> Tuple[str , List[str]]:
+    return "success" , [image.get("src") for image in section.select("img")]
+
+def parse_detail_text(section:BeautifulSoup) -> Tuple[str , Dict[str , str]]:
+    detail_text = {}
+    for e in section.select(".sc-2ll6b5-1")[1:]:
+        key = e.dt.text
+        value = e.dd
+        detail_text[key]= value.text.strip() if not value.find("ol") else ", ".join([li.text.strip() for li in value.find_all("li")])
+    return "success" , detail_text
+
+def parse_detail_images(section:BeautifulSoup) -> Tuple[str , List[str]]:
+    return "success" , [image.get("src") for image in section.select("img")]
+
+def parse_reviews_text(section:BeautifulSoup , num_reviews:int=10) -> Tuple[str , List[str]]:
+    review_texts = []
+    is_review_exist = len(section.find_all("div", recursive=False)) >= 3
+    if not is_review_exist:
+        return "not_exist" , review_texts
+
+    review_items = section.select(".GoodsReviewListSection__Container-sc-1x35scp-0 .review-list-item__Container-sc-13zantg-0")
+    max_reviews_to_crawl = min(num_reviews, len(review_items))
+
+    for idx, review in enumerate(review_items):
+        if idx >= max_reviews_to_crawl:
+            break
+        review_text_area = review.select_one(".ReviewImageContentSection__Container-sc-1lff2fc-0 > .ExpandableContent__Container-sc-gj5b23-0 .Truncate__MeasureContainer-sc-5dnpga-0")
+        if review_text_area:
+            first_span = review_text_area.select_one("span:first-child")
+            
+            # 리뷰 내용 중 한달 사용 후기 인 경우 존재 
+            if first_span and "class" in first_span.attrs:
+                is_month_label = "MonthLabel" in first_span["class"][0]
+            else:
+                is_month_label = False # Default if structure is unexpected
+
+            if is_month_label:
+                review_text = []
+                spans = review_text_area.find_all("span", recursive=False)
+                for span_idx, span in enumerate(spans):
+                    review_text.append(span.text.strip())
+                    if span_idx >= 1: # Get first two spans (month label + review)
+                        break
+                review_texts.append(" ".join(review_text))
+            
+            elif first_span: # Regular review text
+                review_texts.append(first_span.text.strip())
+            # else: Skip if structure doesn't match
+        # else: Skip review if text area not found
+    return "success" , review_texts
+
+def parse_size_detail_info(section:BeautifulSoup) -> Tuple[str , List[dict]]:
+    size_detail_info = []
+    if not len(section.select("div.sc-1jg999i-0")):
+        return "not_exist" , size_detail_info
+
+    size_element = section.select_one(".sc-1jg999i-0 > .sc-1jg999i-1")
+    first_column = [ li.text.strip() for li in size_element.select("ul > li")[2:] ]
+        
+    size_table = size_element.select_one("table")
+    title = [ th.text.strip() for th in size_table.select("thead >tr> th ")]
+
+    for idx , tr in enumerate(size_table.select("tbody > tr ")[1:]):
+        row = {}
+        row[first_column[idx]] = {}
+        for col_idx , td in enumerate(tr.select("td")):
+            row[first_column[idx]][title[col_idx]] = td.text.strip()
+        size_detail_info.append(row)
+    return "success" , size_detail_info
+
+def parse_fit_info(section:BeautifulSoup) -> Tuple[str , Dict[str , List[str]]]:
+    fit_info = {}
+    if not len(section.select(".sc-36xiah-0.gtm-impression-content .sc-36xiah-2")):
+        return "not_exist" , fit_info
+
+    fit_element = section.select_one(".sc-36xiah-0.gtm-impression-content .sc-36xiah-2")
+    first_column = [ li.text.strip() for li in fit_element.select("ul > li") ]
+    fit_table = fit_element.select_one("table > tbody")
+
+    for idx , tr in enumerate(fit_table.select("tr")):
+        fit_info[first_column[idx]] = []
+        for col_idx , td in enumerate(tr.select("td")):
+            #REVIEW : 해당 제품의 핏/계절성 정보 클래스인 eviTcu가 변하지 않는지 확인 필요
+            if "eviTcu" in td["class"]:
+                fit_info[first_column[idx]].append(td.text.strip())
+    return "success" , fit_info
+
 # 1. 제품 preview 이미지 url 추출
 def get_product_preview_image_url(crawler:Crawler , product_id:str , logger:logging.Logger) -> Tuple[str , List[str]]:
     status = "failed"
     summary_images = []
     try:
         # product_summary = crawler.wait_for_element_by_xpath("//*[@id='root']/div[1]/div[1]/div[1]/div[1]/div[1]/div")
-        product_summary = crawler.wait_for_element_by_css_selector("#root .sc-366fl4-1")
+        product_summary_soup = crawler.get_section_soup(SECTION_SELECTORS["summary_images"])
         
-        if product_summary != crawler.error_message:
-            product_summary_soup = BeautifulSoup(product_summary.get_attribute("innerHTML") , "html.parser")
-            for image in product_summary_soup.select("img"):
-                summary_images.append(image.get("src"))
-            status = "success"
+        if product_summary_soup != crawler.error_message:
+            status , summary_images = parse_summary_images(product_summary_soup)
         else:
             logger.error(f"[Section 1] 제품 preview 이미지 url 요소 p탐색 실패 (wait_for_element) : {product_id} ")
             # if crawler.recommend_commercial_flag:
@@ -355,14 +1283,9 @@ def get_product_detail_text(crawler:Crawler , product_id:str , logger:logging.Lo
     detail_text = {}
     try:
         # product_details_element = crawler.wait_for_element_by_xpath("//*[@id='root']/div[1]/div[1]/div[3]/div[1]/div[1]/div")
-        product_details_element = crawler.wait_for_element_by_css_selector("#root .sc-g3hx4t-4 .sc-2ll6b5-0")
-        if product_details_element != crawler.error_message:
-            product_details_soup = BeautifulSoup(product_details_element.get_attribute("innerHTML") , "html.parser")
-            for e in product_details_soup.select(".sc-2ll6b5-1")[1:]:
-                key = e.dt.text
-                value = e.dd
-                detail_text[key]= value.text.strip() if not value.find("ol") else ", ".join([li.text.strip() for li in value.find_all("li")])
-            status = "success"
+        product_details_soup = crawler.get_section_soup(SECTION_SELECTORS["detail_text"])
+        if product_details_soup != crawler.error_message:
+            status , detail_text = parse_detail_text(product_details_soup)
         else:
             logger.error(f"[Section 2] 제품 detail 영역 요소 탐색 실패 (wait_for_element) : {product_id} ")
     except Exception as e:
@@ -376,22 +1299,16 @@ def get_product_detail_images_url(crawler:Crawler , product_id:str , logger:logg
     status = "failed"
     detail_images = []
     try:
-        # Reuse product_details_soup if available and Section 2 succeeded
         # product_details_element = crawler.wait_for_element_by_xpath("//*[@id='root']/div[1]/div[1]/div[3]/div[1]/div[1]/div")
         
         # 제품의 상세 이미지가 없는 경우 확인 
-        if not crawler.is_exist_element(".sc-g3hx4t-4 .sc-1ikk4lv-4"):
+        if not is_exist_section(crawler , SECTION_SELECTORS["detail_images"]):
             status = "not_exist"
             return status , detail_images
         
-        product_details_element = crawler.wait_for_element_by_css_selector(".sc-g3hx4t-4 .sc-1ikk4lv-4")
-        if product_details_element != crawler.error_message:
-            product_details_soup = BeautifulSoup(product_details_element.get_attribute("innerHTML") , "html.parser")
-            for image in product_details_soup.select("img"):
-                    image_url = image.get("src")
-                    detail_images.append(image_url)
-            status = "success"
-            # print(len(detail_images))
+        product_details_soup = crawler.get_section_soup(SECTION_SELECTORS["detail_images"])
+        if product_details_soup != crawler.error_message:
+            status , detail_images = parse_detail_images(product_details_soup)
         else:
             logger.error(f"크롤링 실패 [Section 3] 제품 상세 이미지 요소 탐색 실패 (wait_for_element) : {product_id} ")
     except Exception as e:
@@ -404,44 +1321,9 @@ def get_product_reviews_text(crawler:Crawler , product_id:str,logger:logging.Log
     status = "failed"
     review_texts = []
     try:
-        product_reviews = crawler.wait_for_element_by_css_selector("#root > div.sc-3weaze-0 .goods-reviewpage__Container-sc-1iio9o6-0")
-        if product_reviews != crawler.error_message:
-            product_reviews_soup = BeautifulSoup(product_reviews.get_attribute("innerHTML") , "html.parser")
-            is_review_exist = len(product_reviews_soup.find_all("div", recursive=False)) >= 3
-
-            if is_review_exist:
-                review_items = product_reviews_soup.select(".GoodsReviewListSection__Container-sc-1x35scp-0 .review-list-item__Container-sc-13zantg-0")
-                max_reviews_to_crawl = min(num_reviews, len(review_items))
-
-                for idx, review in enumerate(review_items):
-                    if idx >= max_reviews_to_crawl:
-                        break
-                    review_text_area = review.select_one(".ReviewImageContentSection__Container-sc-1lff2fc-0 > .ExpandableContent__Container-sc-gj5b23-0 .Truncate__MeasureContainer-sc-5dnpga-0")
-                    if review_text_area:
-                        first_span = review_text_area.select_one("span:first-child")
-                        
-                        # 리뷰 내용 중 한달 사용 후기 인 경우 존재 
-                        if first_span and "class" in first_span.attrs:
-                            is_month_label = "MonthLabel" in first_span["class"][0]
-                        else:
-                            is_month_label = False # Default if structure is unexpected
-
-                        if is_month_label:
-                            review_text = []
-                            spans = review_text_area.find_all("span", recursive=False)
-                            for span_idx, span in enumerate(spans):
-                                review_text.append(span.text.strip())
-                                if span_idx >= 1: # Get first two spans (month label + review)
-                                    break
-                            review_texts.append(" ".join(review_text))
-                        
-                        elif first_span: # Regular review text
-                            review_texts.append(first_span.text.strip())
-                        # else: Skip if structure doesn't match
-                    # else: Skip review if text area not found
-                status = "success"
-            else:
-                status = "not_exist" 
+        product_reviews_soup = crawler.get_section_soup(SECTION_SELECTORS["review_texts"])
+        if product_reviews_soup != crawler.error_message:
+            status , review_texts = parse_reviews_text(product_reviews_soup , num_reviews)
         else:
             logger.error(f"크롤링 실패 [Section 4] 제품 리뷰 영역 요소 탐색 실패 (wait_for_element) : {product_id} ")
     except Exception as e:
@@ -456,27 +1338,11 @@ def get_product_size_detail_info(crawler:Crawler , product_id:str , logger:loggi
     size_detail_info = []
     try:    
         # size_section = crawler.wait_for_element_by_xpath("//*[@id='root']/div[1]/div[1]/div[4]")
-        size_section = crawler.wait_for_element_by_css_selector("#root > .sc-3weaze-0 > .sc-4n9q35-0 > .sc-g3hx4t-4[data-index='1']")
+        size_soup = crawler.get_section_soup(SECTION_SELECTORS["size_detail_info"])
         #root > div.sc-3weaze-0.cBNetp > div.sc-4n9q35-0.cAlKzU > div:nth-child(5)
         # size_section = crawler.wait_for_element_by_css_selector("#root .sc-g3hx4t-4 .sc-1ikk4lv-4")
-        if size_section != crawler.error_message:
-            size_soup = BeautifulSoup(size_section.get_attribute("innerHTML") , "html.parser")
-            if len(size_soup.select("div.sc-1jg999i-0")):
-                size_element = size_soup.select_one(".sc-1jg999i-0 > .sc-1jg999i-1")
-                first_column = [ li.text.strip() for li in size_element.select("ul > li")[2:] ]
-                    
-                size_table = size_element.select_one("table")
-                title = [ th.text.strip() for th in size_table.select("thead >tr> th ")]
-
-                for idx , tr in enumerate(size_table.select("tbody > tr ")[1:]):
-                    row = {}
-                    row[first_column[idx]] = {}
-                    for col_idx , td in enumerate(tr.select("td")):
-                        row[first_column[idx]][title[col_idx]] = td.text.strip()
-                    size_detail_info.append(row)
-                status = "success"
-            else:
-                status = "not_exist"
+        if size_soup != crawler.error_message:
+            status , size_detail_info = parse_size_detail_info(size_soup)
         else:
             logger.error(f"크롤링 실패 [Section 5] 세부 사이즈 정보 영역 요소 탐색 실패 (wait_for_element): {product_id} ")
     except Exception as e:  
@@ -490,23 +1356,9 @@ def get_product_fit_info(crawler:Crawler , product_id:str , logger:logging.Logge
     fit_info = {}
     try:
         # size_section = crawler.wait_for_element_by_xpath("//*[@id='root']/div[1]/div[1]/div[4]")
-        size_section = crawler.wait_for_element_by_css_selector("#root > .sc-3weaze-0 > .sc-4n9q35-0 > .sc-g3hx4t-4[data-index='1']")
-        if size_section != crawler.error_message:
-            size_soup = BeautifulSoup(size_section.get_attribute("innerHTML") , "html.parser")
-            if len(size_soup.select(".sc-36xiah-0.gtm-impression-content .sc-36xiah-2")):
-                fit_element = size_soup.select_one(".sc-36xiah-0.gtm-impression-content .sc-36xiah-2")
-                first_column = [ li.text.strip() for li in fit_element.select("ul > li") ]
-                fit_table = fit_element.select_one("table > tbody")
-
-                for idx , tr in enumerate(fit_table.select("tr")):
-                    fit_info[first_column[idx]] = []
-                    for col_idx , td in enumerate(tr.select("td")):
-                        #REVIEW : 해당 제품의 핏/계절성 정보 클래스인 eviTcu가 변하지 않는지 확인 필요
-                        if "eviTcu" in td["class"]:
-                            fit_info[first_column[idx]].append(td.text.strip())
-                status = "success"
-            else:
-                status = "not_exist"
+        size_soup = crawler.get_section_soup(SECTION_SELECTORS["fit_info"])
+        if size_soup != crawler.error_message:
+            status , fit_info = parse_fit_info(size_soup)
         else:
             logger.error(f"크롤링 실패 [Section 6] 제품 핏/계절성 정보 영역 요소 탐색 실패 (wait_for_element) : {product_id} ")
     except Exception as e:
@@ -514,9 +1366,67 @@ def get_product_fit_info(crawler:Crawler , product_id:str , logger:logging.Logge
 
     return status , fit_info
 
+def _is_option_item_available(option_item:Dict) -> bool:
+    """옵션 조합(optionItem)의 구매 가능 여부 (활성화 되어 있고 품절/삭제가 아닌 경우)"""
+    if option_item.get("isDeleted") or option_item.get("activated") is False:
+        return False
+    return not any(option_item.get(key) for key in ("outOfStock" , "isOutOfStock" , "soldOut" , "isSoldOut"))
+
+def parse_option_data(option_data:Dict) -> Tuple[str , Dict]:
+    """
+    옵션 데이터(basic 옵션 그룹 + optionItems)를 color_size_info 형태로 변환합니다.
+    옵션 그룹이 2개 이상이면 첫 번째를 색상 , 두 번째를 사이즈로 , 1개이면 사이즈만 있는 단일 색상(one_color) 제품으로 봅니다.
+    
+    Returns:
+        Tuple[str, Dict]: (status , {"color": 색상 목록 | "one_color" , "size": 사이즈 목록 , "availability": {색상: {사이즈: 구매 가능 여부}}})
+    """
+    groups = [[value.get("name" , "").strip() for value in group.get("optionValues" , [])] for group in option_data.get("basic" , [])]
+    groups = [group for group in groups if group]
+    if not groups:
+        return "not_exist" , {}
+    
+    is_one_color = len(groups) == 1
+    color_info = ["one_color"] if is_one_color else groups[0]
+    size_info = groups[0] if is_one_color else groups[1]
+    availability = {color: {size: False for size in size_info} for color in color_info}
+    
+    for option_item in option_data.get("optionItems" , []):
+        names = [value.get("name" , "").strip() for value in option_item.get("optionValues" , [])]
+        if is_one_color and len(names) >= 1:
+            color , size = "one_color" , names[0]
+        elif len(names) >= 2:
+            color , size = names[0] , names[1]
+        else:
+            continue
+        if color in availability and size in availability[color]:
+            availability[color][size] = _is_option_item_available(option_item)
+    
+    color_size_info = {
+        "color": "one_color" if is_one_color else color_info ,
+        "size": size_info ,
+        "availability": availability ,
+    }
+    # 모든 옵션이 품절인 경우 기존 클릭 방식(선택 영역 없음)과 같이 not_exist 로 처리하여 품절 상품으로 분류되도록 함
+    if option_data.get("optionItems") and not any(any(sizes.values()) for sizes in availability.values()):
+        return "not_exist" , color_size_info
+    return "success" , color_size_info
+
 #7. 제품 색상 및 색상별 사이즈 정보 추출
-#TODO : 제품 선택 버튼이 없는 건지(Free 사이즈), 재고가 없어서 선택 버튼이 없는 건지 확인 필요 
 def get_product_color_size_info(crawler:Crawler , product_id:str , logger:logging.Logger) -> Tuple[str , dict[str , list[str]]]:
+    """
+    클릭 없이 한 번의 스크립트 호출로 전체 색상 x 사이즈 옵션(품절 여부 포함)을 추출하고 ,
+    옵션 데이터를 가져오지 못한 경우에만 드롭다운을 클릭하는 기존 방식으로 추출합니다.
+    """
+    try:
+        option_data = crawler.get_option_data(product_id)
+        if option_data is not None:
+            return parse_option_data(option_data)
+    except Exception as e:
+        logger.error(f"크롤링 실패 [Section 7] 옵션 데이터 변환 중 오류 발생 , 클릭 방식으로 재시도 : {product_id} ")
+    return get_product_color_size_info_by_click(crawler , product_id , logger)
+
+#TODO : 제품 선택 버튼이 없는 건지(Free 사이즈), 재고가 없어서 선택 버튼이 없는 건지 확인 필요 
+def get_product_color_size_info_by_click(crawler:Crawler , product_id:str , logger:logging.Logger) -> Tuple[str , dict[str , list[str]]]:
     #REVIEW : 팝업 창이 잘 닫히는지 확인 필요 
     crawler.click_popup_window()
     status = "failed"
@@ -524,7 +1434,7 @@ def get_product_color_size_info(crawler:Crawler , product_id:str , logger:loggin
     color_info = []
     size_info = []
     try:
-        select_area = crawler.wait_for_element_by_css_selector(".sc-1puoja0-0 .gtm-impression-content .pt-1.pb-2")
+        select_area = crawler.get_section_element(SECTION_SELECTORS["color_size_info"])
         if select_area != crawler.error_message:
             # Use find_elements which returns a list, empty if not found
             child_divs = select_area.find_elements(By.CSS_SELECTOR, ":scope > div")
@@ -609,20 +1519,9 @@ def get_product_color_size_info(crawler:Crawler , product_id:str , logger:loggin
     return status , color_size_info
 
 #REVIEW : 각 크롤링 함수에서 클래스명이 바뀌어 오류 날 수 있느니 주의!
-def get_product_detail_info(crawler:Crawler , product_id:str, logger:logging.Logger , is_process:bool = False ):
-    test_url = f"{crawler.base_url}/{product_id}"
-    crawler.go(test_url)
-    
-    # 유효하지 않은 상품 처리
-    if crawler.handle_alert() != None:
-        logger.error(f"크롤링 실패 유효하지 않은 상품 id : {product_id} ")
-        return {
-            "success_status" : "error_product_id"
-        }
-        
-    
-    # 각 기능별 크롤링 함수 정의 
-    crawling_functions = {
+def build_crawling_functions(crawler:Crawler , product_id:str , logger:logging.Logger) -> Dict[str , Callable[[] , Tuple[str , object]]]:
+    """섹션 이름별 크롤링 함수 목록을 반환합니다. (get_product_detail_info 와 섹션 재시도에서 공통으로 사용)"""
+    return {
         "summary_images": lambda : get_product_preview_image_url(crawler , product_id, logger),
         "detail_text": lambda : get_product_detail_text(crawler , product_id, logger),
         "detail_images": lambda : get_product_detail_images_url(crawler , product_id, logger),
@@ -631,20 +1530,154 @@ def get_product_detail_info(crawler:Crawler , product_id:str, logger:logging.Log
         "fit_info": lambda : get_product_fit_info(crawler , product_id, logger),
         "color_size_info": lambda : get_product_color_size_info(crawler , product_id, logger),
     }
-    
-    result = {k: f() for k , f in crawling_functions.items()}
+
+def get_failed_sections(record:Dict) -> List[str]:
+    """상세 정보 결과에서 success / not_exist 가 아닌 섹션 목록을 반환합니다."""
+    return [k for k , status in record.get("crawling_status" , {}).items() if status not in ("success", "not_exist")]
+
+def merge_section_results(record:Dict , retry_result:Dict) -> Dict:
+    """
+    일부 섹션만 다시 크롤링한 결과(retry_result)를 기존 상세 정보(record)에 병합하고 success_status 를 다시 계산합니다.
+    재시도에서도 실패한 섹션은 기존 값을 유지합니다.
+    """
+    merged = {**record , "crawling_status": dict(record.get("crawling_status" , {}))}
+    for k , status in retry_result.get("crawling_status" , {}).items():
+        merged["crawling_status"][k] = status
+        if status in ("success", "not_exist"):
+            merged[k] = retry_result[k]
+    merged["success_status"] = "success" if not get_failed_sections(merged) else "failed"
+    return merged
+
+@contextmanager
+def _step(crawler:Crawler , step:str , timings:Dict[str , float]|None):
+    """단계의 소요 시간을 crawler.metrics(span) 와 timings 에 기록합니다."""
+    start = time.perf_counter()
+    with crawler.span(step):
+        yield
+    if timings is not None:
+        timings[step] = time.perf_counter() - start
+
+def plan_detail_sections(product_id:str , presence:Dict[str , bool] , sections:List[str]|None = None ,
+                         breaker:SectionCircuitBreaker|None = None) -> Generator[str , Tuple[str , object] , Dict]:
+    """
+    상세 정보 크롤링의 섹션 처리 순서와 결과 조합을 담당하는 공통 로직으로 , 동기(get_product_detail_info)와
+    비동기(get_product_detail_info_async) 엔진이 함께 사용합니다. 페이지 조작은 하지 않습니다.
+    크롤링해야 하는 섹션 이름을 yield 하고 , 호출한 쪽이 크롤링한 (status , value) 를 send() 로 돌려주면
+    모든 섹션을 처리한 뒤 결과 dict 를 반환(StopIteration.value)합니다.
+    부모 요소는 있고 섹션만 없는 경우(presence) 바로 not_exist , 서킷 브레이커가 차단한 섹션은 skipped_breaker 로 처리합니다.
+    """
+    absent_sections = get_absent_sections(presence)
     crawling_status = {}
     data = {}
-    for k , (status , value) in result.items():
-        crawling_status[k] = status
-        data[k] = value
+    for section in SECTION_DEFAULT_VALUES:
+        if sections is not None and section not in sections:
+            continue
+        if section in absent_sections:
+            status , value = "not_exist" , SECTION_DEFAULT_VALUES[section]()
+        elif breaker is not None and not breaker.allow(section):
+            status , value = "skipped_breaker" , SECTION_DEFAULT_VALUES[section]()
+        else:
+            status , value = yield section
+            if breaker is not None:
+                breaker.record(section , status)
+        crawling_status[section] = status
+        data[section] = value
 
     success_status = "success" if all([status in ("success", "not_exist") for status in crawling_status.values()]) else "failed"
-    result = {
+    return {
         "product_id": product_id,
         **data,
         "crawling_status": crawling_status,
         "success_status": success_status
     }
 
+def archive_page_snapshot(crawler:Crawler , product_id:str , archive:SnapshotArchive ,
+                          crawling_status:Dict[str , str]|None = None) -> str | None:
+    """
+    섹션 파서가 실제로 사용한 섹션 HTML(innerHTML)과 옵션 데이터 , 섹션별 크롤링 상태를 아카이브에 저장하고 blob_hash 를 반환합니다.
+    스냅샷 이후 현재 페이지에서 읽은 섹션(get_section_soup 캐시)을 우선 사용하고 , 파싱하지 않은 섹션은 페이지 스냅샷에서 가져옵니다.
+    저장할 섹션이 하나도 없으면 저장하지 않습니다. (color_size_info 는 HTML 대신 옵션 데이터로 다시 파싱)
+    """
+    section_html = {}
+    for name , css_selector in SECTION_SELECTORS.items():
+        if name == "color_size_info":
+            continue
+        cached = crawler._section_cache.get(css_selector)
+        section = cached[1] if cached is not None else None
+        if section is None and crawler.page_soup is not None:
+            section = crawler.page_soup.select_one(css_selector)
+        # 스냅샷의 요소(Tag)와 현재 페이지에서 읽은 innerHTML(BeautifulSoup) 모두 자식 HTML 만 저장
+        section_html[name] = section.decode_contents() if section is not None else None
+    if all(html is None for html in section_html.values()):
+        return None
+    try:
+        return archive.put(product_id , section_html , crawler.option_data , crawling_status=crawling_status)
+    except Exception as e:
+        print(f"스냅샷 아카이브 저장 중 오류 발생: {e}")
+        return None
+
+def get_product_detail_info(crawler:Crawler , product_id:str, logger:logging.Logger , is_process:bool = False , sections:List[str]|None = None , breaker:SectionCircuitBreaker|None = None ,
+                            next_product_id:str|None = None , timings:Dict[str , float]|None = None , archive:SnapshotArchive|None = None):
+    """
+    상품 상세 페이지의 섹션별 정보를 크롤링합니다.
+    timings 에 dict 를 넘기면 단계별 소요 시간(초)을 기록합니다. (go , handle_alert , snapshot , 섹션 이름별)
+    archive 를 넘기면 섹션 HTML 을 압축 저장하여 나중에 브라우저 없이 다시 파싱(crawler.reparse)할 수 있습니다.
+    """
+    test_url = f"{crawler.base_url}/{product_id}"
+    with _step(crawler , "go" , timings):
+        crawler.go(test_url)
+    
+    # 유효하지 않은 상품 처리
+    with _step(crawler , "handle_alert" , timings):
+        alert_text = crawler.handle_alert()
+    if alert_text != None:
+        logger.error(f"크롤링 실패 유효하지 않은 상품 id : {product_id} ")
+        return {
+            "success_status" : "error_product_id"
+        }
+        
+    
+    # 페이지 로드 확인 후 한 번의 JS 호출로 DOM 스냅샷을 떠서 모든 섹션 파서가 같은 트리를 공유
+    # (선택 섹션은 페이지가 안정된 뒤 한 번의 JS 호출로 존재 여부를 먼저 확인)
+    presence = {}
+    with _step(crawler , "snapshot" , timings):
+        is_loaded = crawler.get_section_element(SECTION_SELECTORS["summary_images"]) != crawler.error_message
+        if is_loaded:
+            presence = crawler.probe_elements(build_presence_selectors())
+            crawler.take_page_snapshot()
+    if is_loaded:
+        # 이 상품의 섹션을 파싱하는 동안 다음 상품을 여분의 탭에서 미리 로드 (crawler.num_tabs >= 2)
+        if next_product_id is not None:
+            crawler.prefetch(f"{crawler.base_url}/{next_product_id}")
+    elif crawler.handle_alert() != None:
+        # page_load_strategy="eager" 에서는 go() 가 반환된 뒤에 경고창이 뜰 수 있으므로 한 번 더 확인
+        logger.error(f"크롤링 실패 유효하지 않은 상품 id : {product_id} ")
+        return {
+            "success_status" : "error_product_id"
+        }
+    
+    # 각 기능별 크롤링 함수 정의 후 , 공통 로직(plan_detail_sections)이 요청하는 섹션만 실행 (sections 가 주어지면 해당 섹션만)
+    crawling_functions = build_crawling_functions(crawler , product_id , logger)
+    plan = plan_detail_sections(product_id , presence , sections , breaker)
+    try:
+        section = next(plan)
+        while True:
+            with _step(crawler , section , timings):
+                section_result = crawling_functions[section]()
+            section = plan.send(section_result)
+    except StopIteration as stop:
+        result = stop.value
+
+    success_status = result["success_status"]
+    crawler.record_navigation_timing()
+    if archive is not None and sections is None:
+        with _step(crawler , "archive" , timings):
+            archive_page_snapshot(crawler , product_id , archive , result["crawling_status"])
+    # 섹션 크롤링 중 드라이버가 죽었다면 재시작하고 , 호출한 쪽에서 이 상품을 다시 처리하도록 알림
+    if success_status != "success" and crawler.restart_if_dead():
+        logger.error(f"크롤링 중 드라이버 종료로 재시작 , 다시 처리 필요 : {product_id} ")
+        return {
+            "product_id": product_id,
+            "success_status": DRIVER_RESTARTED
+        }
     return result
\ No newline at end of file
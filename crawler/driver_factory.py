@@ -0,0 +1,177 @@
+import queue
+import shutil
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
+
+# 템플릿 프로필 복사 시 제외할 크롬 프로필 잠금 파일
+_PROFILE_LOCK_FILES = ("SingletonLock", "SingletonSocket", "SingletonCookie", "lockfile")
+
+
+def build_chrome_options(headless: bool = False, capture_network: bool = False, page_load_strategy: str = "normal",
+                         block_resources: bool = False, user_data_dir: str | Path | None = None) -> Options:
+    """Crawler 와 DriverFactory 가 공통으로 사용하는 크롬 옵션을 만듭니다."""
+    chrome_options = Options()
+
+    if headless:
+        chrome_options.add_argument("--headless")
+
+    # chrome_options.add_argument("--no-sandbox")
+    # chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--window-size=1600,1080")
+    chrome_options.add_argument("--disable-notifications")
+
+    # 자동화 감지 방지
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    chrome_options.add_experimental_option("useAutomationExtension", False)
+    chrome_options.add_argument("disable-blink-features=AutomationControlled")
+
+    # User-Agent 설정
+    chrome_options.add_argument(f"user-agent={USER_AGENT}")
+
+    # 네트워크 응답 수집을 위한 performance 로그(CDP Network 이벤트) 활성화
+    if capture_network:
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    chrome_options.page_load_strategy = page_load_strategy
+    if block_resources:
+        # 이미지 로드/디코딩 비활성화 (src 속성은 그대로 남음)
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+
+    if user_data_dir is not None:
+        chrome_options.add_argument(f"--user-data-dir={user_data_dir}")
+    return chrome_options
+
+
+class DriverFactory:
+    """
+    크롬 드라이버를 백그라운드에서 미리 num_spares 개 띄워 두고 acquire() 시 바로 넘겨주는 드라이버 팩토리.
+    template_dir 이 있으면 각 드라이버는 템플릿 프로필(HTTP 캐시 등)을 복사한 user-data-dir 로 시작하므로
+    첫 페이지부터 캐시된 정적 리소스를 사용합니다. (template_dir 이 없고 warmup_urls 가 있으면 시작 시 build_template 으로 생성)
+
+    워커 풀(스레드)과 드라이버 재시작에서 Crawler(driver_factory=...) 로 공유하여 사용하며 ,
+    드라이버는 팩토리의 옵션으로 시작되므로 Crawler 의 옵션이 다르면 Crawler 생성 시 ValueError 가 발생합니다. (check_options)
+
+    Args:
+        num_spares (int): 미리 띄워 둘 드라이버 수
+        template_dir (str | Path, optional): 복사해서 사용할 템플릿 user-data-dir
+        warmup_urls (List[str], optional): 템플릿을 새로 만들 때 방문하여 HTTP 캐시를 채울 url 목록
+        headless , capture_network , page_load_strategy , block_resources : build_chrome_options 인자
+    """
+    def __init__(self, num_spares: int = 1, template_dir: str | Path | None = None, warmup_urls: List[str] | None = None,
+                 headless: bool = True, capture_network: bool = False, page_load_strategy: str = "eager", block_resources: bool = True):
+        self.num_spares = num_spares
+        self.template_dir = Path(template_dir) if template_dir else None
+        self.option_kwargs = {
+            "headless": headless,
+            "capture_network": capture_network,
+            "page_load_strategy": page_load_strategy,
+            "block_resources": block_resources,
+        }
+        self._spares = queue.Queue()
+        self._profile_dirs: Dict[int, Path] = {}
+        self._lock = threading.Lock()
+        self._refilling = 0
+        self._closed = False
+        self.launch_times: List[float] = []
+        if warmup_urls and (self.template_dir is None or not self.template_dir.exists()):
+            self.build_template(warmup_urls)
+        self.fill()
+
+    def check_options(self, **option_kwargs) -> None:
+        """드라이버를 사용할 쪽의 크롬 옵션이 팩토리의 옵션과 다르면 ValueError 를 발생시킵니다."""
+        conflicts = {name: (value, self.option_kwargs[name]) for name, value in option_kwargs.items() if self.option_kwargs[name] != value}
+        if conflicts:
+            detail = " , ".join(f"{name}={value!r} (팩토리 : {factory_value!r})" for name, (value, factory_value) in conflicts.items())
+            raise ValueError(f"driver_factory 의 옵션과 다른 옵션으로 Crawler 를 만들 수 없습니다 : {detail}")
+
+    def build_template(self, warmup_urls: List[str], template_dir: str | Path | None = None) -> Path:
+        """warmup_urls 를 방문하여 HTTP 캐시를 채운 템플릿 user-data-dir 을 만들고 , 이후 드라이버가 사용하도록 설정합니다."""
+        template_dir = Path(template_dir) if template_dir else (self.template_dir or Path(tempfile.mkdtemp(prefix="chrome_template_")))
+        template_dir.mkdir(parents=True, exist_ok=True)
+        driver = webdriver.Chrome(options=build_chrome_options(**self.option_kwargs, user_data_dir=template_dir))
+        try:
+            for url in warmup_urls:
+                driver.get(url)
+        finally:
+            driver.quit()
+        self.template_dir = template_dir
+        return template_dir
+
+    def _launch(self):
+        start = time.perf_counter()
+        profile_dir = None
+        if self.template_dir is not None and self.template_dir.exists():
+            profile_dir = Path(tempfile.mkdtemp(prefix="chrome_profile_"))
+            shutil.copytree(self.template_dir, profile_dir, dirs_exist_ok=True, ignore=shutil.ignore_patterns(*_PROFILE_LOCK_FILES))
+        driver = webdriver.Chrome(options=build_chrome_options(**self.option_kwargs, user_data_dir=profile_dir))
+        with self._lock:
+            if profile_dir is not None:
+                self._profile_dirs[id(driver)] = profile_dir
+            self.launch_times.append(time.perf_counter() - start)
+        return driver
+
+    def _refill(self) -> None:
+        try:
+            driver = self._launch()
+            if self._closed:
+                self.dispose(driver)
+            else:
+                self._spares.put(driver)
+        except Exception as e:
+            print(f"예비 드라이버 생성 중 오류 발생: {e}")
+        finally:
+            with self._lock:
+                self._refilling -= 1
+
+    def fill(self) -> None:
+        """예비 드라이버가 num_spares 개가 되도록 백그라운드에서 추가로 띄웁니다."""
+        with self._lock:
+            missing = self.num_spares - self._spares.qsize() - self._refilling
+            if self._closed or missing <= 0:
+                return
+            self._refilling += missing
+        for _ in range(missing):
+            threading.Thread(target=self._refill, daemon=True).start()
+
+    def acquire(self):
+        """예비 드라이버가 있으면 바로 반환하고 , 없으면 새로 띄웁니다. (반환 후 예비 드라이버를 다시 채움)"""
+        try:
+            driver = self._spares.get_nowait()
+        except queue.Empty:
+            driver = self._launch()
+        self.fill()
+        return driver
+
+    def dispose(self, driver) -> None:
+        """드라이버를 종료하고 복사해 둔 프로필 디렉터리를 삭제합니다."""
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        with self._lock:
+            profile_dir = self._profile_dirs.pop(id(driver), None)
+        if profile_dir is not None:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+
+    def close(self) -> None:
+        self._closed = True
+        while True:
+            try:
+                self.dispose(self._spares.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
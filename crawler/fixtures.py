@@ -0,0 +1,270 @@
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List
+from urllib.parse import parse_qs, urlsplit
+
+from bs4 import BeautifulSoup
+
+from .crawler import LISTING_API_URL_PATTERN, Crawler
+
+# 렌더링된 DOM 전체를 가져오는 스크립트
+_OUTER_HTML_SCRIPT = "return document.documentElement.outerHTML;"
+
+# 목록 페이지의 가상 스크롤 컨테이너
+_LISTING_CONTAINER_SELECTOR = ".sc-k7xv49-0"
+
+# 현재 렌더링된 목록 행(최상위 div[data-index])의 outerHTML 을 {data-index: outerHTML} 로 반환하는 스크립트
+_RENDERED_ROWS_SCRIPT = """
+const rows = {};
+document.querySelectorAll(arguments[0] + " div[data-index]").forEach(row => {
+    if (row.parentElement.closest("div[data-index]") === null) rows[row.getAttribute("data-index")] = row.outerHTML;
+});
+return rows;
+"""
+
+# 재생 시 목록 페이지에 넣는 스크립트 : 녹화한 목록 API 응답을 페이지 로드 시 한 번 , 이후 페이지 끝까지 스크롤할 때마다 한 페이지씩 요청
+# (요청마다 컨테이너에 빈 공간을 추가하여 다음 스크롤이 실제로 위치를 바꾸고 MutationObserver 가 DOM 변경을 감지하도록 함)
+_LISTING_REPLAY_SCRIPT = """
+(() => {
+    const name = %s, numPages = %d, containerSelector = %s;
+    let page = 0, loading = false;
+    const loadNext = () => {
+        if (loading || page >= numPages) return;
+        loading = true;
+        fetch(`/api2/dp/v1/plp/goods?fixture=${encodeURIComponent(name)}&page=${page}`)
+            .then(response => response.json())
+            .catch(() => null)
+            .then(() => {
+                page += 1;
+                loading = false;
+                const spacer = document.createElement("div");
+                spacer.style.height = window.innerHeight + "px";
+                (document.querySelector(containerSelector) || document.body).appendChild(spacer);
+            });
+    };
+    window.addEventListener("scroll", () => {
+        if (window.innerHeight + window.scrollY >= document.body.scrollHeight - 10) loadNext();
+    });
+    loadNext();
+})();
+"""
+
+
+class FixtureRecorder:
+    """
+    실제 사이트의 목록/상품 페이지를 렌더링된 상태 그대로(스크립트 제거) fixture_dir 에 저장합니다.
+    상품 페이지에는 옵션 데이터를 window.__MSS__ 로 함께 넣어 두어 , 재생 시에도 옵션 추출 스크립트가 네트워크 없이 동작합니다.
+    (재생 시에는 Crawler(option_api_url=None) 으로 옵션 API 를 호출하지 않도록 해야 함)
+    목록 페이지는 스크롤하며 렌더링된 행을 모두 모아 저장하고 , capture_network=True 인 Crawler 로 녹화하면 목록 API 응답도 함께 저장합니다.
+
+    저장 구조:
+        fixture_dir/products/{product_id}.html
+        fixture_dir/listing/{name}.html
+        fixture_dir/listing/{name}.api.json  (목록 API 응답 목록)
+        fixture_dir/manifest.json  ({"products": [...] , "listings": {name: params} , "listing_api": {name: 응답 수}})
+    """
+    def __init__(self, fixture_dir: str | Path):
+        self.fixture_dir = Path(fixture_dir)
+        (self.fixture_dir / "products").mkdir(parents=True, exist_ok=True)
+        (self.fixture_dir / "listing").mkdir(parents=True, exist_ok=True)
+        self.manifest_path = self.fixture_dir / "manifest.json"
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+        else:
+            self.manifest = {"products": [], "listings": {}}
+        self.manifest.setdefault("listing_api", {})
+
+    @staticmethod
+    def _static_html(html: str, option_data: Dict | None = None, rows: Dict[str, str] | None = None, replay_script: str | None = None) -> str:
+        """
+        스크립트를 제거하여 재생 시 DOM 이 바뀌지 않도록 하고 , 옵션 데이터가 있으면 인라인 스크립트로 넣습니다.
+        rows 가 있으면 목록 컨테이너의 행을 rows(data-index 순서)로 바꾸고 , replay_script 가 있으면 body 끝에 넣습니다.
+        """
+        soup = BeautifulSoup(html, "html.parser")
+        for script in soup.find_all("script"):
+            script.decompose()
+        # 외부 스타일시트/프리로드 요청이 재생 중 실제 사이트로 나가지 않도록 제거 (인라인 <style> 은 유지)
+        for link in soup.find_all("link"):
+            if set(link.get("rel") or []) & {"stylesheet", "preload", "prefetch", "modulepreload", "preconnect", "dns-prefetch"}:
+                link.decompose()
+        if option_data is not None and soup.head is not None:
+            state = soup.new_tag("script")
+            state.string = f"window.__MSS__ = {json.dumps({'option': option_data}, ensure_ascii=False)};"
+            soup.head.append(state)
+        container = soup.select_one(_LISTING_CONTAINER_SELECTOR) if rows else None
+        if container is not None:
+            for row in container.select("div[data-index]"):
+                row.decompose()
+            for index in sorted(rows, key=int):
+                container.append(BeautifulSoup(rows[index], "html.parser"))
+        if replay_script is not None and soup.body is not None:
+            script = soup.new_tag("script")
+            script.string = replay_script
+            soup.body.append(script)
+        return str(soup)
+
+    def _save_manifest(self) -> None:
+        self.manifest_path.write_text(json.dumps(self.manifest, ensure_ascii=False, indent=4), encoding="utf-8")
+
+    def record_product(self, crawler: Crawler, product_id: str, settle_selectors: List[str] | None = None) -> bool:
+        """상품 상세 페이지를 열어 섹션이 렌더링된 뒤의 DOM 과 옵션 데이터를 저장합니다."""
+        crawler.go(f"{crawler.base_url}/{product_id}")
+        if crawler.handle_alert() is not None:
+            print(f"유효하지 않은 상품이라 저장하지 않습니다: {product_id}")
+            return False
+        for selector in settle_selectors or []:
+            crawler.wait_for_element_by_css_selector(selector)
+        option_data = crawler.get_option_data(product_id)
+        self.save_product(product_id, crawler.driver.execute_script(_OUTER_HTML_SCRIPT), option_data)
+        return True
+
+    def save_product(self, product_id: str, html: str, option_data: Dict | None = None) -> None:
+        """
+        상품 상세 페이지 HTML(과 옵션 데이터)을 fixture 로 저장합니다.
+        실제 사이트 없이 만든 상품 페이지로 섹션 확인 로직을 점검할 때도 사용합니다. (test/probe_sections_fixture.py)
+        """
+        html = self._static_html(html, option_data)
+        (self.fixture_dir / "products" / f"{product_id}.html").write_text(html, encoding="utf-8")
+        if product_id not in self.manifest["products"]:
+            self.manifest["products"].append(product_id)
+        self._save_manifest()
+
+    def record_listing(self, crawler: Crawler, url: str, name: str, num_scrolls: int = 10,
+                       api_url_pattern: str = LISTING_API_URL_PATTERN, **params) -> None:
+        """
+        목록 페이지를 열어 num_scrolls 번 스크롤하며 렌더링된 행을 모두 모아 저장합니다. (params 는 재생 시 목록 크롤링 인자)
+        가상 스크롤 목록은 화면 밖의 행을 DOM 에서 제거하므로 스크롤마다 행을 모아 data-index 0 부터 모두 남깁니다.
+        crawler.capture_network 가 True 이면 api_url_pattern 에 맞는 목록 API 응답도 저장하여 crawl_product_list_network 를 재생할 수 있게 합니다.
+        """
+        crawler.go(url)
+        crawler.wait_for_element_by_css_selector(f"{_LISTING_CONTAINER_SELECTOR} div[data-index='0']")
+        rows = crawler.driver.execute_script(_RENDERED_ROWS_SCRIPT, _LISTING_CONTAINER_SELECTOR) or {}
+        payloads = []
+        for _ in range(num_scrolls):
+            if crawler.capture_network:
+                payloads.extend(crawler.get_json_responses(api_url_pattern))
+            crawler.driver.execute_script("window.scrollBy(0, window.innerHeight);")
+            crawler.wait_for_element_by_mutation(_LISTING_CONTAINER_SELECTOR)
+            rows.update(crawler.driver.execute_script(_RENDERED_ROWS_SCRIPT, _LISTING_CONTAINER_SELECTOR) or {})
+        if crawler.capture_network:
+            payloads.extend(crawler.get_json_responses(api_url_pattern))
+        self.save_listing(name, crawler.driver.execute_script(_OUTER_HTML_SCRIPT), payloads if crawler.capture_network else None, rows, **params)
+
+    def save_listing(self, name: str, html: str, payloads: List[Dict] | None = None, rows: Dict[str, str] | None = None, **params) -> None:
+        """
+        목록 페이지 HTML 과 목록 API 응답 목록(payloads)을 fixture 로 저장합니다.
+        payloads 가 있으면 재생 시 페이지가 스크롤마다 목록 API 를 한 페이지씩 요청하도록 스크립트를 넣습니다.
+        실제 사이트 없이 만든 목록 페이지/응답으로 목록 크롤링을 확인할 때도 사용합니다. (test/crawling_listing_fixture.py)
+        """
+        replay_script = None
+        if payloads is not None:
+            (self.fixture_dir / "listing" / f"{name}.api.json").write_text(json.dumps(payloads, ensure_ascii=False), encoding="utf-8")
+            self.manifest["listing_api"][name] = len(payloads)
+            if payloads:
+                replay_script = _LISTING_REPLAY_SCRIPT % (json.dumps(name), len(payloads), json.dumps(_LISTING_CONTAINER_SELECTOR))
+        html = self._static_html(html, rows=rows, replay_script=replay_script)
+        (self.fixture_dir / "listing" / f"{name}.html").write_text(html, encoding="utf-8")
+        self.manifest["listings"][name] = params
+        self._save_manifest()
+
+
+class FixtureServer:
+    """
+    FixtureRecorder 로 저장한 페이지를 로컬 HTTP 서버로 재생합니다.
+    응답마다 latency ± jitter 초를 기다려 실제 사이트의 응답 지연을 흉내 냅니다.
+
+        /products/{product_id} -> fixture_dir/products/{product_id}.html
+        /listing/{name}        -> fixture_dir/listing/{name}.html
+        /api2/dp/v1/plp/goods?fixture={name}&page={n} -> fixture_dir/listing/{name}.api.json 의 n 번째 응답 (JSON)
+
+    Args:
+        fixture_dir (str | Path): fixture 디렉터리
+        latency (float): 평균 응답 지연(초)
+        jitter (float): 응답 지연의 최대 편차(초)
+        host (str): 바인딩할 주소
+        port (int): 포트 (0 이면 빈 포트 사용)
+    """
+    def __init__(self, fixture_dir: str | Path, latency: float = 0.0, jitter: float = 0.0, host: str = "127.0.0.1", port: int = 0):
+        self.fixture_dir = Path(fixture_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.manifest = json.loads((self.fixture_dir / "manifest.json").read_text(encoding="utf-8"))
+        self.manifest.setdefault("listing_api", {})
+        self._listing_payloads: Dict[str, List] = {}
+        self._server = ThreadingHTTPServer((host, port), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def listing_payload(self, name: str, page: int) -> Dict | None:
+        """녹화한 목록 API 응답 중 page 번째 응답을 반환합니다. (없으면 None)"""
+        if name not in self._listing_payloads:
+            file_path = self.fixture_dir / "listing" / f"{name}.api.json"
+            self._listing_payloads[name] = json.loads(file_path.read_text(encoding="utf-8")) if file_path.exists() else []
+        payloads = self._listing_payloads[name]
+        return payloads[page] if 0 <= page < len(payloads) else None
+
+    def _make_handler(self):
+        server = self
+
+        class FixtureHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                delay = server.latency + random.uniform(-server.jitter, server.jitter)
+                if delay > 0:
+                    time.sleep(delay)
+                url = urlsplit(self.path)
+                if re.search(LISTING_API_URL_PATTERN, url.path):
+                    query = parse_qs(url.query)
+                    try:
+                        payload = server.listing_payload(query["fixture"][0], int(query["page"][0]))
+                    except (KeyError, ValueError):
+                        payload = None
+                    if payload is None:
+                        self.send_error(404)
+                        return
+                    self._send(json.dumps(payload, ensure_ascii=False).encode("utf-8"), "application/json; charset=utf-8")
+                    return
+                parts = url.path.strip("/").split("/")
+                file_path = None
+                if len(parts) == 2 and parts[0] in ("products", "listing"):
+                    file_path = server.fixture_dir / parts[0] / f"{parts[1]}.html"
+                if file_path is None or not file_path.exists():
+                    self.send_error(404)
+                    return
+                self._send(file_path.read_bytes(), "text/html; charset=utf-8")
+
+            def _send(self, body: bytes, content_type: str) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return FixtureHandler
+
+    def start(self) -> "FixtureServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
@@ -0,0 +1,166 @@
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# 기본 히스토그램 구간(초) : WebDriver 호출(수 ms) ~ 페이지 이동(수 초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+class Histogram:
+    """누적 구간(le)별 관측 수 , 합계 , 개수를 유지하는 Prometheus 방식의 히스토그램"""
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float | None:
+        """구간 안에서 선형 보간한 분위수 추정값"""
+        if not self.count:
+            return None
+        target = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= target and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (target - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "sum": round(self.sum, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else None,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": dict(zip([str(bucket) for bucket in self.buckets] + ["+Inf"], self.counts)),
+        }
+
+
+class MetricsRegistry:
+    """
+    크롤러 단계별 소요 시간을 히스토그램으로 모으는 저장소.
+
+    - span(step) : with 블록의 소요 시간을 crawler_step_seconds{step=...} 에 기록
+    - instrument_driver(driver) : 모든 WebDriver 명령의 소요 시간을 webdriver_command_seconds{command , step} 에 기록
+      (step 은 명령이 실행된 시점의 가장 안쪽 span)
+    - dump_json(path) / to_prometheus() / serve(port) 로 내보내기
+    """
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.default_buckets = buckets
+        self._histograms: Dict[str, Dict[Tuple[Tuple[str, str], ...], Histogram]] = {}
+        self._help: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def observe(self, name: str, value: float, help_text: str = "", **labels) -> None:
+        key = tuple(sorted((k, str(v)) for k, v in labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            if key not in series:
+                series[key] = Histogram(self.default_buckets)
+            series[key].observe(value)
+            if help_text:
+                self._help.setdefault(name, help_text)
+
+    def current_step(self) -> str:
+        stack = getattr(self._local, "steps", None)
+        return stack[-1] if stack else "none"
+
+    @contextmanager
+    def span(self, step: str):
+        stack = self._local.__dict__.setdefault("steps", [])
+        stack.append(step)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stack.pop()
+            self.observe("crawler_step_seconds", time.perf_counter() - start, "크롤링 단계별 소요 시간(초)", step=step)
+
+    def instrument_driver(self, driver) -> None:
+        """driver.execute 를 감싸 WebElement 호출을 포함한 모든 WebDriver 명령의 소요 시간을 기록합니다."""
+        execute = driver.execute
+
+        def timed_execute(driver_command, params=None):
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.observe("webdriver_command_seconds", time.perf_counter() - start, "WebDriver 명령별 소요 시간(초)",
+                             command=driver_command, step=self.current_step())
+        driver.execute = timed_execute
+
+    def to_dict(self) -> Dict[str, List[Dict]]:
+        with self._lock:
+            return {
+                name: [{"labels": dict(key), **histogram.to_dict()} for key, histogram in series.items()]
+                for name, series in self._histograms.items()
+            }
+
+    def dump_json(self, file_path: str | Path) -> None:
+        file_path = Path(file_path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(json.dumps(self.to_dict(), ensure_ascii=False, indent=4), encoding="utf-8")
+
+    @staticmethod
+    def _format_labels(labels: Tuple[Tuple[str, str], ...], extra: Tuple[str, str] | None = None) -> str:
+        items = list(labels) + ([extra] if extra else [])
+        if not items:
+            return ""
+        escaped = [f'{k}="{v.replace(chr(92), chr(92) * 2).replace(chr(34), chr(92) + chr(34))}"' for k, v in items]
+        return "{" + ",".join(escaped) + "}"
+
+    def to_prometheus(self) -> str:
+        """Prometheus text exposition format 으로 변환합니다."""
+        lines = []
+        with self._lock:
+            for name, series in self._histograms.items():
+                if name in self._help:
+                    lines.append(f"# HELP {name} {self._help[name]}")
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in series.items():
+                    cumulative = 0
+                    for bucket, bucket_count in zip(list(histogram.buckets) + ["+Inf"], histogram.counts):
+                        cumulative += bucket_count
+                        lines.append(f"{name}_bucket{self._format_labels(key, ('le', str(bucket)))} {cumulative}")
+                    lines.append(f"{name}_sum{self._format_labels(key)} {histogram.sum}")
+                    lines.append(f"{name}_count{self._format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def serve(self, port: int = 9100, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """http://host:port/metrics 로 Prometheus 형식의 지표를 제공하는 서버를 백그라운드에서 실행합니다."""
+        registry = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), MetricsHandler)
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
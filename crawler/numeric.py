@@ -0,0 +1,121 @@
+import re
+from typing import Dict, List, Tuple
+
+import pandas as pd
+
+# "1.2만" , "1천+" , "999+" , "(1,234)" 처럼 화면에 표시되는 개수 문자열 (단위 : 만 , 천 / "+" 는 하한값 표시)
+_COUNT_PATTERN = r"^\(?\s*([\d.,]+)\s*(만|천)?\s*(\+)?\s*\)?$"
+_COUNT_REGEX = re.compile(_COUNT_PATTERN)
+_COUNT_UNITS = {"만": 10000, "천": 1000}
+
+# 정수로 저장할 가격/할인 컬럼 , 개수 컬럼(하한값 여부 컬럼이 함께 생성됨) , 실수로 저장할 평점 컬럼
+PRICE_COLUMNS = ["product_price", "product_original_price", "product_discount_price", "product_discount_rate"]
+COUNT_COLUMNS = ["num_likes", "review_count"]
+RATING_COLUMNS = ["avg_rating"]
+
+
+def lower_bound_column(column: str) -> str:
+    """개수 컬럼의 하한값 여부 컬럼 이름 (예: num_likes -> num_likes_is_lower_bound)"""
+    return f"{column}_is_lower_bound"
+
+
+def parse_count(value) -> Tuple[int | None, bool]:
+    """
+    화면에 표시된 개수를 (정수 , 하한값 여부) 로 변환합니다. 변환할 수 없으면 (None , False) 를 반환합니다.
+        "1.2만" -> (12000 , False) , "1천+" -> (1000 , True) , "(1,234)" -> (1234 , False)
+    """
+    if value is None or isinstance(value, bool):
+        return None, False
+    if isinstance(value, (int, float)):
+        return (None, False) if value != value else (int(value), False)
+    match = _COUNT_REGEX.match(str(value).strip())
+    if match is None:
+        return None, False
+    number, unit, plus = match.groups()
+    try:
+        count = float(number.replace(",", "")) * _COUNT_UNITS.get(unit, 1)
+    except ValueError:
+        return None, False
+    return int(round(count)), plus is not None
+
+
+def parse_int(value) -> int | None:
+    """가격/할인율 문자열("12,900" , "12900원" , "30%")을 정수로 변환합니다. 변환할 수 없으면 None 을 반환합니다."""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return None if value != value else int(round(value))
+    digits = re.sub(r"[^\d.\-]", "", str(value))
+    try:
+        return int(round(float(digits)))
+    except ValueError:
+        return None
+
+
+def parse_rating(value) -> float | None:
+    """평점 문자열("4.8")을 실수로 변환합니다. 변환할 수 없으면 None 을 반환합니다."""
+    if value is None or isinstance(value, bool):
+        return None
+    try:
+        rating = float(str(value).strip())
+    except ValueError:
+        return None
+    return None if rating != rating else rating
+
+
+def normalize_product_summary(product_data: Dict) -> Dict:
+    """
+    목록에서 추출한 상품 요약 정보의 숫자 필드를 타입이 있는 값으로 바꿉니다. (product_data 를 직접 수정하여 반환)
+    추출에 실패한 필드("failed")는 None 이 되며 , 실패 여부는 crawling_status / success_status 로 확인합니다.
+    """
+    for column in PRICE_COLUMNS:
+        if column in product_data:
+            product_data[column] = parse_int(product_data[column])
+    for column in COUNT_COLUMNS:
+        if column in product_data:
+            product_data[column], product_data[lower_bound_column(column)] = parse_count(product_data[column])
+    for column in RATING_COLUMNS:
+        if column in product_data:
+            product_data[column] = parse_rating(product_data[column])
+    return product_data
+
+
+def _normalize_count_series(series: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    if pd.api.types.is_numeric_dtype(series):
+        return series.round().astype("Int64"), pd.Series(False, index=series.index)
+    parts = series.astype("string").str.strip().str.extract(_COUNT_PATTERN)
+    number = pd.to_numeric(parts[0].str.replace(",", "", regex=False), errors="coerce")
+    multiplier = parts[1].map(_COUNT_UNITS).fillna(1).astype(float)
+    return (number * multiplier).round().astype("Int64"), parts[2].notna()
+
+
+def normalize_summary_dataframe(df: pd.DataFrame, columns: List[str] | None = None) -> pd.DataFrame:
+    """
+    기존 CSV 처럼 숫자 필드가 문자열로 저장된 요약 DataFrame 을 벡터 연산으로 변환합니다. (행 단위 apply 없이 처리)
+    가격/할인율/개수는 Int64 (변환 불가 값은 <NA>) , 평점은 float64 , 개수 컬럼마다 하한값 여부(bool) 컬럼을 추가합니다.
+    이미 하한값 여부 컬럼이 있으면(새로 크롤링한 CSV) 그대로 유지합니다.
+
+    Args:
+        df (pd.DataFrame): 요약 정보 DataFrame
+        columns (List[str], optional): 변환할 컬럼 (기본값 : PRICE_COLUMNS + COUNT_COLUMNS + RATING_COLUMNS 중 존재하는 컬럼)
+
+    Returns:
+        pd.DataFrame: 변환된 복사본
+    """
+    df = df.copy()
+    targets = columns or PRICE_COLUMNS + COUNT_COLUMNS + RATING_COLUMNS
+    for column in [column for column in targets if column in df.columns]:
+        series = df[column]
+        if column in COUNT_COLUMNS:
+            values, is_lower_bound = _normalize_count_series(series)
+            df[column] = values
+            flag_column = lower_bound_column(column)
+            df[flag_column] = (df[flag_column].fillna(False).astype(bool) | is_lower_bound) if flag_column in df.columns else is_lower_bound
+        elif column in RATING_COLUMNS:
+            df[column] = pd.to_numeric(series, errors="coerce").astype("float64")
+        elif pd.api.types.is_numeric_dtype(series):
+            df[column] = series.round().astype("Int64")
+        else:
+            digits = series.astype("string").str.replace(r"[^\d.\-]", "", regex=True)
+            df[column] = pd.to_numeric(digits, errors="coerce").round().astype("Int64")
+    return df
@@ -0,0 +1,210 @@
+import logging
+import multiprocessing
+import pickle
+import queue
+import threading
+import time
+from typing import Dict, Generator, List, Tuple
+
+import pandas as pd
+
+from .archive import SnapshotArchive
+from .crawler import DRIVER_RESTARTED, Crawler, get_product_detail_info
+from .utils import set_error_logger
+
+# 워커가 결과 큐로 보내는 메세지 종류
+_RESULT = "result"
+_DONE = "done"
+# 결과 큐를 기다리다가 죽은 워커가 있는지 확인하는 간격(초)
+_POLL_INTERVAL = 5
+
+
+def _is_picklable(value) -> bool:
+    """프로세스 워커로 전달할 수 있는 값인지 확인합니다. (threading.Lock 등을 가진 객체는 전달 , 공유할 수 없음)"""
+    try:
+        pickle.dumps(value)
+        return True
+    except Exception:
+        return False
+
+
+def _run_shard(worker_id: int, shard: List[Dict], crawler_kwargs: Dict, logger_name: str, result_queue, stop_event,
+               archive: SnapshotArchive | None = None, log_file: str | None = None) -> None:
+    """
+    하나의 워커가 자신의 Crawler 를 생성하여 할당받은 shard 의 상품 상세정보를 크롤링합니다.
+    스레드/프로세스 어느 쪽에서 실행되어도 동일하게 동작하도록 모듈 최상위 함수로 정의합니다.
+    프로세스 모드(spawn)에서는 부모의 로거 핸들러가 전달되지 않으므로 log_file 로 로거를 다시 설정합니다.
+    """
+    logger = set_error_logger(logger_name, log_file) if log_file is not None else logging.getLogger(logger_name)
+    crawler = None
+    processed = 0
+    try:
+        crawler = Crawler(**crawler_kwargs)
+        shard = list(shard)
+        requeued = set()
+        while processed < len(shard):
+            if stop_event.is_set():
+                break
+            summary = shard[processed]
+            product_id = summary["product_id"]
+            next_product_id = shard[processed + 1]["product_id"] if processed + 1 < len(shard) else None
+            try:
+                detail_info = get_product_detail_info(crawler, product_id, logger, next_product_id=next_product_id, archive=archive)
+            except Exception as e:
+                # 한 상품의 예외가 워커 전체를 멈추지 않도록 격리
+                logger.error(f"[worker {worker_id}] 상세 정보 크롤링 간 예기치 못한 예외 발생 {product_id} , 에러 : {e}")
+                detail_info = {"product_id": product_id, "success_status": "failed"}
+            if detail_info.get("success_status") == DRIVER_RESTARTED and product_id not in requeued:
+                # 처리 중 드라이버가 죽어 재시작된 상품은 shard 끝에 한 번 다시 넣음
+                requeued.add(product_id)
+                shard.append(summary)
+            else:
+                result_queue.put((_RESULT, worker_id, (summary, detail_info)))
+            processed += 1
+    except Exception as e:
+        # 드라이버 생성 실패 등 워커 자체가 죽은 경우 : 남은 상품은 worker_failed 로 돌려보냄
+        logger.error(f"[worker {worker_id}] 워커 비정상 종료 , 에러 : {e}")
+        for summary in shard[processed:]:
+            detail_info = {"product_id": summary["product_id"], "success_status": "worker_failed"}
+            result_queue.put((_RESULT, worker_id, (summary, detail_info)))
+    finally:
+        if crawler is not None:
+            crawler.close()
+        result_queue.put((_DONE, worker_id, None))
+
+
+class CrawlerPool:
+    """
+    N 개의 headless Crawler(드라이버)를 소유하고 summary DataFrame 을 워커별로 나누어
+    상품 상세정보를 병렬로 크롤링하는 워커 풀.
+
+    결과는 완료되는 순서대로(순서 무관) 스트리밍되며 , 한 워커의 실패는 다른 워커에 영향을 주지 않습니다.
+
+    Args:
+        num_workers (int): 동시에 띄울 드라이버(워커) 수
+        use_process (bool): True 이면 워커별 프로세스 , False 이면 워커별 스레드로 실행
+        logger_name (str): 워커에서 사용할 로거 이름
+        archive (SnapshotArchive, optional): 섹션 HTML 을 저장할 스냅샷 아카이브 (워커가 공유)
+        log_file (str, optional): 프로세스 모드에서 워커 로거가 기록할 파일 경로 (프로세스 모드에서는 필수)
+        join_timeout (float): close() 시 워커가 현재 상품을 마치고 종료되기를 기다리는 최대 시간(초).
+            초과하면 프로세스는 강제 종료(terminate)하고 , 스레드는 강제 종료할 수 없으므로 경고 로그를 남기고 버림(daemon)
+        **crawler_kwargs: 각 워커의 Crawler 생성 인자 (base_url , time_out 등).
+            프로세스 모드에서는 워커 프로세스로 전달(pickle)할 수 있는 값만 넘길 수 있으며 , 그렇지 않으면 ValueError 발생
+            스레드 모드에서는 driver_factory(DriverFactory) , rate_limiter(HostRateLimiter) , adaptive_timeouts(AdaptiveTimeouts) , metrics(MetricsRegistry)를 넘겨 여러 워커가 공유할 수 있음
+    """
+    def __init__(self, num_workers: int = 4, use_process: bool = False, logger_name: str = "crawler_pool",
+                 archive: SnapshotArchive | None = None, log_file: str | None = None, join_timeout: float = 60,
+                 **crawler_kwargs):
+        if use_process:
+            unpicklable = [name for name, value in crawler_kwargs.items() if not _is_picklable(value)]
+            if unpicklable:
+                raise ValueError(f"프로세스 모드에서는 {' , '.join(unpicklable)} 를 워커에 전달(공유)할 수 없습니다. use_process=False 로 실행하세요.")
+            if log_file is None:
+                raise ValueError("프로세스 모드에서는 워커 로거에 핸들러가 없으므로 log_file 을 지정해야 합니다.")
+        self.num_workers = max(1, num_workers)
+        self.use_process = use_process
+        self.logger_name = logger_name
+        self.archive = archive
+        # 스레드 모드에서는 부모의 로거를 그대로 사용하므로 핸들러를 다시 붙이지 않음 (중복 기록 방지)
+        self.log_file = log_file if use_process else None
+        self.join_timeout = join_timeout
+        crawler_kwargs.setdefault("headless", True)
+        crawler_kwargs.setdefault("page_load_strategy", "eager")
+        crawler_kwargs.setdefault("block_resources", True)
+        crawler_kwargs.setdefault("num_tabs", 2)
+        self.crawler_kwargs = crawler_kwargs
+        self._workers = []
+        self._stop_event = None
+        self._result_queue = None
+
+    def shard(self, summary_df: pd.DataFrame) -> List[List[Dict]]:
+        """DataFrame 을 워커 수만큼 round-robin 으로 분할합니다."""
+        records = summary_df.to_dict("records")
+        return [records[i::self.num_workers] for i in range(self.num_workers)]
+
+    def run(self, summary_df: pd.DataFrame) -> Generator[Tuple[Dict, Dict], None, None]:
+        """
+        summary_df 의 상품들을 워커에 분배하여 크롤링하고 (요약 정보 , 상세 정보) 를 완료 순서대로 반환합니다.
+        """
+        shards = [s for s in self.shard(summary_df) if s]
+        if not shards:
+            return
+
+        if self.use_process:
+            context = multiprocessing.get_context("spawn")
+            result_queue, self._stop_event, worker_cls = context.Queue(), context.Event(), context.Process
+        else:
+            result_queue, self._stop_event, worker_cls = queue.Queue(), threading.Event(), threading.Thread
+        self._result_queue = result_queue
+
+        self._workers = [
+            worker_cls(target=_run_shard, args=(worker_id, shard, self.crawler_kwargs, self.logger_name, result_queue, self._stop_event,
+                                                self.archive, self.log_file),
+                       daemon=True)
+            for worker_id, shard in enumerate(shards)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+        reported = {worker_id: set() for worker_id in range(len(shards))}
+        running = set(reported)
+        try:
+            while running:
+                try:
+                    kind, worker_id, payload = result_queue.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    # 크롬 OOM-kill , segfault 등으로 _DONE 을 보내지 못하고 죽은 워커 : 남은 상품은 worker_failed 로 돌려보냄
+                    for worker_id in [worker_id for worker_id in running if not self._workers[worker_id].is_alive()]:
+                        running.discard(worker_id)
+                        logging.getLogger(self.logger_name).error(
+                            f"[worker {worker_id}] 워커가 종료 신호 없이 죽음 (exitcode : {getattr(self._workers[worker_id], 'exitcode', None)})")
+                        for summary in shards[worker_id]:
+                            if summary["product_id"] not in reported[worker_id]:
+                                reported[worker_id].add(summary["product_id"])
+                                yield summary, {"product_id": summary["product_id"], "success_status": "worker_failed"}
+                    continue
+                if worker_id not in running:
+                    # 죽은 것으로 처리한 뒤 늦게 도착한 메세지는 이미 worker_failed 로 보냈으므로 버림
+                    continue
+                if kind == _DONE:
+                    running.discard(worker_id)
+                    continue
+                reported[worker_id].add(payload[0]["product_id"])
+                yield payload
+        finally:
+            # 중간에 순회를 멈춘 경우(Ctrl+C 등)에도 워커들이 현재 상품까지만 처리하고 종료되도록 함
+            self.close()
+
+    def close(self) -> None:
+        """워커들에게 중단 신호를 보내고 최대 join_timeout 초 동안 종료를 기다립니다."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+        deadline = time.monotonic() + self.join_timeout
+        for worker in self._workers:
+            while worker.is_alive() and time.monotonic() < deadline:
+                # 프로세스 모드에서는 큐가 비워지지 않으면 워커가 종료되지 않으므로 남은 메세지를 버림
+                self._drain_queue()
+                worker.join(timeout=0.5)
+            if not worker.is_alive():
+                continue
+            # 드라이버 호출에서 멈춘 워커 : 프로세스는 강제 종료 , 스레드는 daemon 이므로 메인 종료 시 함께 정리됨
+            if self.use_process:
+                logging.getLogger(self.logger_name).error(f"워커 {worker.name} 가 {self.join_timeout}초 안에 종료되지 않아 강제 종료합니다.")
+                worker.terminate()
+                worker.join(timeout=5)
+            else:
+                logging.getLogger(self.logger_name).error(f"워커 {worker.name} 가 {self.join_timeout}초 안에 종료되지 않아 대기를 중단합니다.")
+        self._workers = []
+
+    def _drain_queue(self) -> None:
+        try:
+            while True:
+                self._result_queue.get_nowait()
+        except (queue.Empty, AttributeError):
+            pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
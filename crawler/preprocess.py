@@ -13,6 +13,7 @@ from dataclasses import dataclass , field
 import asyncio
 import aiohttp
 from .utils import make_dir , save_image_as_jpg , set_error_logger
+from .rate_limit import HostRateLimiter
 from typing import Tuple
 
 logger = logging.getLogger(__name__)
@@ -136,33 +137,44 @@ def move_files(image_paths: list[str]| str, output_dirs:str) -> None:
 #         print(f"이미지 다운로드 실패: {url}, 에러: {str(e)}")
 #         return False
 
-async def get_pil_image_from_url_async(session: aiohttp.ClientSession, url: str , headers:dict) -> Image.Image | None:
+async def get_pil_image_from_url_async(session: aiohttp.ClientSession, url: str , headers:dict , rate_limiter:HostRateLimiter|None = None) -> Image.Image | None:
     """
     Asynchronously downloads an image from a URL and returns a PIL image object.
+    rate_limiter 가 있으면 호스트별 속도 제한을 통과한 뒤 요청하고 , 응답 상태/timeout 으로 속도를 조절합니다.
     """
     if url.startswith("//"):
         url = "https:" + url
     try:
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async(url)
         async with session.get(url, headers=headers, timeout=30) as response:
+            if rate_limiter is not None:
+                rate_limiter.record_status(url, response.status)
             response.raise_for_status()
             content = await response.read()
             image_stream = BytesIO(content)
             pil_image = Image.open(image_stream).convert("RGB")
             return pil_image
+    except asyncio.TimeoutError:
+        if rate_limiter is not None:
+            rate_limiter.record(url, throttled=True)
+        logger_error.error(f"Async 이미지 다운로드 실패 : {url} , 에러: timeout")
+        return None
     except Exception as e:
         logger_error.error(f"Async 이미지 다운로드 실패 : {url} , 에러: {str(e)}")
         return None
     
-async def _download_images_async(image_urls:list[str])->list[Image.Image | None]:
+async def _download_images_async(image_urls:list[str] , rate_limiter:HostRateLimiter|None = None)->list[Image.Image | None]:
     headers = {
         "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/96.0.4664.110 Safari/537.36"
     }
     async with aiohttp.ClientSession() as session:
-        tasks = [get_pil_image_from_url_async(session, url, headers) for url in image_urls]
+        tasks = [get_pil_image_from_url_async(session, url, headers, rate_limiter) for url in image_urls]
         return await asyncio.gather(*tasks)
 
 async def save_summary_images_async(
    process:ImageData,
+   rate_limiter:HostRateLimiter|None = None,
 ) -> tuple[int, int]:
     
     urls=process.summary_images_url
@@ -171,7 +183,7 @@ async def save_summary_images_async(
     product_id=process.product_id
 
     total_images = len(urls)
-    downloaded_images = await _download_images_async(urls)
+    downloaded_images = await _download_images_async(urls, rate_limiter)
     success_count = sum(1 for img in downloaded_images if img is not None)
 
     for idx, image in enumerate(downloaded_images):
@@ -524,14 +536,15 @@ def get_white_rows(image:Image.Image , mean_threshold = 230, dark_threshold = 20
 async def image_segmentation_async(process : ImageData ,
                          min_content_height: int = 20,
                          min_white_gap: int = 3,
-                         padding: int = 5
+                         padding: int = 5,
+                         rate_limiter: HostRateLimiter | None = None
                       ):
     """
     Downloads and segments detail images. 
     Uses asyncio internally to download images concurrently.
     """
     
-    downloaded_images = await _download_images_async(process.detail_images_url)
+    downloaded_images = await _download_images_async(process.detail_images_url, rate_limiter)
     
     success_count = sum(1 for img in downloaded_images if img is not None)
     total_count = len(process.detail_images_url)
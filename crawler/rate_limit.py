@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+from typing import Dict
+from urllib.parse import urlparse
+
+# 처리율 제한/서버 과부하로 판단하는 HTTP 상태 코드
+THROTTLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class AIMDTokenBucket:
+    """
+    초당 rate 개의 토큰이 채워지는 토큰 버킷(최대 burst 개)으로 요청을 허용하고 ,
+    요청이 성공할 때마다 rate 를 additive_increase 만큼 올리다가(AI) 처리율 제한 신호(429/5xx , timeout)를 받으면
+    multiplicative_decrease 배로 줄입니다(MD). 동시에 실패한 요청들로 여러 번 줄어들지 않도록 cooldown 초 동안은 한 번만 줄입니다.
+    """
+    def __init__(self, rate: float = 2.0, burst: float = 5, min_rate: float = 0.2, max_rate: float = 20.0,
+                 additive_increase: float = 0.05, multiplicative_decrease: float = 0.5, cooldown: float = 5.0):
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.additive_increase = additive_increase
+        self.multiplicative_decrease = multiplicative_decrease
+        self.cooldown = cooldown
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """토큰 하나를 예약하고 , 토큰이 생길 때까지 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def on_success(self) -> None:
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.additive_increase)
+
+    def on_throttle(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self.rate = max(self.min_rate, self.rate * self.multiplicative_decrease)
+
+
+class HostRateLimiter:
+    """
+    호스트별 AIMDTokenBucket 을 관리하는 rate limiter. Crawler.go , 목록 스크롤 , 이미지 다운로드가 같은 인스턴스를 공유하여
+    호스트마다 감당 가능한 최대 속도를 스스로 찾아가도록 합니다.
+
+    Args:
+        host_overrides (Dict[str, Dict], optional): 호스트별 AIMDTokenBucket 설정 (예: 이미지 CDN 은 더 높은 rate)
+        **bucket_kwargs: 나머지 호스트의 AIMDTokenBucket 기본 설정
+    """
+    def __init__(self, host_overrides: Dict[str, Dict] | None = None, **bucket_kwargs):
+        self.host_overrides = host_overrides or {}
+        self.bucket_kwargs = bucket_kwargs
+        self._buckets: Dict[str, AIMDTokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        if url.startswith("//"):
+            url = "https:" + url
+        return urlparse(url).netloc or url
+
+    def bucket(self, url: str) -> AIMDTokenBucket:
+        host = self.host_of(url)
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = AIMDTokenBucket(**{**self.bucket_kwargs, **self.host_overrides.get(host, {})})
+            return self._buckets[host]
+
+    def acquire(self, url: str) -> None:
+        """url 의 호스트에 요청을 보내도 될 때까지 기다립니다."""
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url: str) -> None:
+        await self.bucket(url).acquire_async()
+
+    def record(self, url: str, throttled: bool) -> None:
+        """요청 결과를 기록합니다. throttled=True 이면 해당 호스트의 rate 를 줄이고 , 아니면 조금씩 올립니다."""
+        bucket = self.bucket(url)
+        if throttled:
+            bucket.on_throttle()
+        else:
+            bucket.on_success()
+
+    def record_status(self, url: str, status_code: int | None) -> None:
+        """HTTP 상태 코드로 결과를 기록합니다. (상태 코드를 모르면 성공으로 간주)"""
+        self.record(url, status_code in THROTTLE_STATUS_CODES)
+
+    def rates(self) -> Dict[str, float]:
+        """호스트별 현재 허용 속도(초당 요청 수)를 반환합니다."""
+        with self._lock:
+            return {host: round(bucket.rate, 3) for host, bucket in self._buckets.items()}
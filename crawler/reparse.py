@@ -0,0 +1,107 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from bs4 import BeautifulSoup
+
+from .archive import SnapshotArchive
+from .checkpoint import JsonlWriter
+from .crawler import (
+    OPTIONAL_SECTIONS, SECTION_DEFAULT_VALUES,
+    parse_detail_images, parse_detail_text, parse_fit_info, parse_option_data, parse_reviews_text,
+    parse_size_detail_info, parse_summary_images,
+)
+
+# 섹션 HTML 을 받아 (status , value) 를 반환하는 파서 (color_size_info 는 옵션 데이터로 파싱)
+SECTION_HTML_PARSERS: Dict[str, Callable[[BeautifulSoup], Tuple[str, object]]] = {
+    "summary_images": parse_summary_images,
+    "detail_text": parse_detail_text,
+    "detail_images": parse_detail_images,
+    "review_texts": lambda section: parse_reviews_text(section, num_reviews=10),
+    "size_detail_info": parse_size_detail_info,
+    "fit_info": parse_fit_info,
+}
+
+
+
+def parse_snapshot(snapshot: Dict, sections: List[str] | None = None) -> Dict:
+    """
+    아카이브 스냅샷을 get_product_detail_info 와 같은 형식의 결과로 파싱합니다.
+    sections 가 주어지면 해당 섹션만 파싱합니다.
+    HTML(옵션 데이터)이 없는 섹션은 다시 파싱할 수 없으므로 저장된 실시간 크롤링 상태를 그대로 사용합니다.
+    """
+    section_names = sections or list(SECTION_DEFAULT_VALUES)
+    section_html = snapshot.get("sections", {})
+    live_status = snapshot.get("crawling_status") or {}
+    data, crawling_status = {}, {}
+    for name in section_names:
+        status, value = "failed", SECTION_DEFAULT_VALUES[name]()
+        try:
+            if name == "color_size_info":
+                if snapshot.get("option_data") is not None:
+                    status, value = parse_option_data(snapshot["option_data"])
+                else:
+                    # 옵션 데이터 없이 클릭 방식으로 크롤링한 결과는 다시 파싱할 수 없으므로 실시간 상태를 사용
+                    status = live_status.get(name, "failed")
+            elif section_html.get(name) is None:
+                # 섹션이 없었던 이유(not_exist , 부모 요소 미렌더링 failed 등)는 실시간 결과로만 알 수 있음
+                # (crawling_status 를 저장하기 전의 스냅샷은 선택 섹션(OPTIONAL_SECTIONS)만 없을 수 있다고 가정)
+                status = live_status.get(name) or ("not_exist" if name in OPTIONAL_SECTIONS else "failed")
+            else:
+                # 섹션의 innerHTML 을 저장했으므로 실시간 크롤링의 get_section_soup 와 같이 문서 전체를 섹션으로 파싱
+                status, value = SECTION_HTML_PARSERS[name](BeautifulSoup(section_html[name], "html.parser"))
+        except Exception as e:
+            print(f"[{snapshot.get('product_id')}] {name} 다시 파싱 중 오류 발생: {e}")
+        crawling_status[name] = status
+        data[name] = value
+
+    success_status = "success" if all(status in ("success", "not_exist") for status in crawling_status.values()) else "failed"
+    return {
+        "product_id": snapshot.get("product_id"),
+        **data,
+        "crawling_status": crawling_status,
+        "success_status": success_status,
+    }
+
+
+def _reparse_blob(task: Tuple[str, float, str, str, List[str] | None]) -> Dict:
+    """프로세스 워커 : blob 파일 하나를 읽어 파싱합니다."""
+    blob_path, crawled_at, codec, product_id, sections = task
+    try:
+        result = parse_snapshot(SnapshotArchive.read_blob(blob_path, codec), sections)
+    except Exception as e:
+        print(f"[{product_id}] 스냅샷 읽기 중 오류 발생: {e}")
+        result = {"product_id": product_id, "success_status": "failed"}
+    result["crawled_at"] = crawled_at
+    return result
+
+
+def reparse_archive(archive: SnapshotArchive, output_path: str | Path, num_workers: int | None = None,
+                    sections: List[str] | None = None, chunksize: int = 64) -> Dict[str, int]:
+    """
+    아카이브에 저장된 상품별 최신 스냅샷을 브라우저 없이 여러 프로세스에서 다시 파싱하여 output_path(JSONL)에 저장합니다.
+
+    Args:
+        archive (SnapshotArchive): 스냅샷 아카이브
+        output_path (str | Path): 결과를 저장할 .jsonl 파일 (덮어씀)
+        num_workers (int, optional): 프로세스 수 (기본값 : CPU 코어 수)
+        sections (List[str], optional): 다시 파싱할 섹션 목록 (기본값 : 전체)
+        chunksize (int): 워커에 한 번에 넘길 스냅샷 수
+
+    Returns:
+        Dict[str, int]: success_status 별 상품 수
+    """
+    output_path = Path(output_path)
+    if output_path.exists():
+        output_path.unlink()
+    tasks = [
+        (str(archive.blob_path(blob_hash)), crawled_at, codec, product_id, sections)
+        for product_id, crawled_at, blob_hash, codec in archive.iter_latest()
+    ]
+    counts: Dict[str, int] = {}
+    with JsonlWriter(output_path, fsync=False) as writer, ProcessPoolExecutor(max_workers=num_workers or os.cpu_count()) as executor:
+        for result in executor.map(_reparse_blob, tasks, chunksize=chunksize):
+            writer.write(result)
+            counts[result["success_status"]] = counts.get(result["success_status"], 0) + 1
+    return counts
@@ -0,0 +1,108 @@
+import json
+import math
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Dict
+
+
+class AdaptiveTimeouts:
+    """
+    셀렉터별로 요소가 나타나기까지 걸린 시간을 기록하고 , 최근 window 개의 관측값으로
+    셀렉터별 대기 시간(p{percentile} x (1 + margin))과 폴링 간격을 계산합니다.
+    대기 시간 안에 나타나지 않은 경우는 "대기 시간보다 오래 걸림"(censored)으로 기록하여 분위수가 낮게 치우치지 않도록 하며 ,
+    분위수가 censored 관측값에 걸리면 실제 지연을 알 수 없으므로 max_timeout 을 사용합니다.
+    관측값은 file_path 에 저장하여 다음 실행에서 이어서 사용합니다.
+
+    Args:
+        max_timeout (float, optional): 대기 시간의 상한이자 관측값이 부족할 때 사용하는 기본 대기 시간(초).
+            None 이면 Crawler 의 time_out 을 사용
+        min_timeout (float): 대기 시간의 하한(초)
+        percentile (float): 대기 시간 계산에 사용할 분위수 (0 ~ 1)
+        margin (float): 분위수에 더할 여유 비율
+        window (int): 셀렉터별로 유지할 최근 관측값 수
+        min_samples (int): 관측값이 이보다 적으면 max_timeout 을 사용
+        min_poll (float): 폴링 간격의 하한(초)
+        file_path (str | Path, optional): 관측값을 저장/불러올 JSON 파일 경로
+    """
+    def __init__(self, max_timeout: float | None = None, min_timeout: float = 0.5, percentile: float = 0.99, margin: float = 0.5,
+                 window: int = 500, min_samples: int = 20, min_poll: float = 0.05, file_path: str | Path | None = None):
+        self.max_timeout = max_timeout
+        self.min_timeout = min_timeout
+        self.percentile = percentile
+        self.margin = margin
+        self.window = window
+        self.min_samples = min_samples
+        self.min_poll = min_poll
+        self.file_path = Path(file_path) if file_path else None
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, deque] = {}
+        if self.file_path and self.file_path.exists():
+            self.load(self.file_path)
+
+    @staticmethod
+    def _quantile(values, q: float) -> float:
+        # censored 관측값(elapsed , True)은 실제 지연이 그보다 크다는 것만 알 수 있으므로 가장 큰 값(inf)으로 취급
+        ordered = sorted(math.inf if censored else elapsed for elapsed, censored in values)
+        index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+        return ordered[index]
+
+    def record(self, selector: str, elapsed: float, censored: bool = False) -> None:
+        """
+        요소가 나타나기까지 걸린 시간(초)을 기록합니다.
+        censored=True 이면 elapsed 초 동안 기다렸지만 나타나지 않았음(timeout)을 의미합니다.
+        """
+        with self._lock:
+            self._latencies.setdefault(selector, deque(maxlen=self.window)).append((elapsed, censored))
+
+    def timeout_for(self, selector: str) -> float:
+        """셀렉터의 대기 시간(초)을 반환합니다."""
+        with self._lock:
+            latencies = self._latencies.get(selector)
+            if not latencies or len(latencies) < self.min_samples:
+                return self.max_timeout
+            timeout = self._quantile(latencies, self.percentile) * (1 + self.margin)
+        return min(self.max_timeout, max(self.min_timeout, timeout))
+
+    def poll_for(self, selector: str) -> float:
+        """셀렉터의 폴링 간격(초)을 반환합니다. (중앙값의 1/4 , 대기 시간의 1/10 중 작은 값)"""
+        timeout = self.timeout_for(selector)
+        with self._lock:
+            latencies = self._latencies.get(selector)
+            median = self._quantile(latencies, 0.5) if latencies else timeout
+        return max(self.min_poll, min(median / 4, timeout / 10))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """셀렉터별 관측 수 , p50 , p99 , 현재 대기 시간 , 폴링 간격을 반환합니다."""
+        with self._lock:
+            selectors = {selector: list(latencies) for selector, latencies in self._latencies.items()}
+        return {
+            selector: {
+                "count": len(latencies),
+                "censored": sum(censored for _, censored in latencies),
+                "p50": self._quantile(latencies, 0.5),
+                "p99": self._quantile(latencies, 0.99),
+                "timeout": self.timeout_for(selector),
+                "poll": self.poll_for(selector),
+            }
+            for selector, latencies in selectors.items() if latencies
+        }
+
+    def save(self, file_path: str | Path | None = None) -> None:
+        file_path = Path(file_path) if file_path else self.file_path
+        if file_path is None:
+            return
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {selector: [list(observation) for observation in latencies] for selector, latencies in self._latencies.items()}
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+
+    def load(self, file_path: str | Path) -> None:
+        with open(file_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        with self._lock:
+            for selector, latencies in data.items():
+                # 이전 형식(지연 시간만 저장)도 그대로 읽음
+                observations = [(value, False) if isinstance(value, (int, float)) else (value[0], bool(value[1])) for value in latencies]
+                self._latencies[selector] = deque(observations, maxlen=self.window)
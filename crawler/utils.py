@@ -169,6 +169,49 @@ def save_dataframe_to_csv(df: pd.DataFrame, file_path: Path, mode: str = 'w'):
 def load_dataframe_from_csv(csv_path:str)->pd.DataFrame:
     return pd.read_csv(csv_path,encoding="utf-8")
 
+def _chunk_order(chunk_file:Path) -> Tuple:
+    """청크 파일 정렬 기준 : 파일 이름이 숫자면 숫자 순서(2.csv 가 10.csv 보다 먼저) , 아니면 이름 순서"""
+    return (0 , int(chunk_file.stem) , "") if chunk_file.stem.isdigit() else (1 , 0 , chunk_file.name)
+
+def merge_csv_chunks(chunk_files: List[Path], output_path: Path, dedup_column: Optional[str] = "product_id", failed_value: str = "failed") -> Tuple[int, int]:
+    """
+    청크 CSV 파일들을 순서대로 하나씩 읽어 output_path 에 이어 쓰며 병합합니다.
+    한 번에 하나의 청크만 메모리에 올리므로 전체 청크를 읽어 concat 하는 방식보다 최대 메모리가 청크 하나 크기로 제한됩니다.
+    dedup_column 이 있으면 앞에서 이미 쓴 값과 중복되는 행을 버립니다. (값이 없거나 failed_value 인 행은 모두 유지)
+    
+    Args:
+        chunk_files (List[Path]): 병합할 청크 파일 목록 (숫자 이름은 숫자 순서로 정렬)
+        output_path (Path): 저장할 CSV 파일 경로 (덮어씀)
+        dedup_column (str, optional): 중복 제거 기준 컬럼. None 이면 중복 제거 안 함
+        failed_value (str): 추출 실패로 채워진 값 (중복 제거 대상에서 제외)
+        
+    Returns:
+        Tuple[int, int]: (저장한 행 수 , 버린 중복 행 수)
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    seen = set()
+    columns = None
+    num_rows , num_duplicates = 0 , 0
+    # 파일을 한 번만 열어 BOM(utf-8-sig) 과 헤더가 맨 앞에 한 번만 쓰이도록 함
+    with open(output_path , "w" , encoding="utf-8-sig" , newline="") as f:
+        for chunk_file in sorted(map(Path , chunk_files) , key=_chunk_order):
+            chunk_df = pd.read_csv(chunk_file , dtype={dedup_column: str} if dedup_column else None , encoding="utf-8-sig")
+            if columns is None:
+                columns = list(chunk_df.columns)
+            else:
+                chunk_df = chunk_df.reindex(columns=columns)
+            if dedup_column:
+                ids = chunk_df[dedup_column]
+                keyed = ids.notna() & (ids != failed_value)
+                duplicated = keyed & (ids.isin(seen) | ids.duplicated())
+                seen.update(ids[keyed & ~duplicated])
+                num_duplicates += int(duplicated.sum())
+                chunk_df = chunk_df[~duplicated]
+            chunk_df.to_csv(f , index=False , header=f.tell() == 0)
+            num_rows += len(chunk_df)
+    return num_rows , num_duplicates
+
 #FIXME : 이미지 저장하는 코드 왜케 지저분 해보이지 
 def save_image_as_jpg(image: Image.Image, save_path: str|Path, target_size: int = None) -> None:
     """
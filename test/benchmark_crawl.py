@@ -0,0 +1,134 @@
+import _path_utils
+from crawler import Crawler, crawl_product_list, get_product_detail_info
+from crawler.fixtures import FixtureRecorder, FixtureServer
+from crawler.crawler import SECTION_SELECTORS, crawl_product_list_network
+from crawler.utils import set_error_logger
+from pathlib import Path
+import pandas as pd
+import numpy as np
+import argparse
+import json
+import time
+
+# musinsa.com 에 접속하지 않고 녹화해 둔 페이지(fixture)로 크롤러 처리량을 측정합니다.
+#   1) 녹화 : python test/benchmark_crawl.py record --summary-csv data/musinsa_product_summary_하의_데님팬츠.csv --limit 200 \
+#               --listing-url "https://www.musinsa.com/category/003002?gf=A" --listing-name denim --category-main 하의 --category-sub 데님팬츠
+#   2) 측정 : python test/benchmark_crawl.py run --latency 0.2 --jitter 0.1
+DEFAULT_FIXTURE_DIR = Path("./data/fixtures")
+
+
+def record(args):
+    recorder = FixtureRecorder(args.fixture_dir)
+    # 목록 API 응답도 함께 녹화하도록 네트워크 응답 수집 활성화
+    crawler = Crawler(base_url="https://www.musinsa.com/products", headless=True, time_out=10, capture_network=True)
+    try:
+        if args.listing_url:
+            recorder.record_listing(crawler, args.listing_url, args.listing_name, num_scrolls=args.num_scrolls,
+                                    category_main=args.category_main, category_sub=args.category_sub)
+            print(f"목록 페이지 저장 완료 : {args.listing_name}")
+        if args.summary_csv:
+            summary_df = pd.read_csv(args.summary_csv, dtype={"product_id": str})
+            product_ids = summary_df.loc[summary_df["success_status"] == "success", "product_id"].head(args.limit)
+            # 섹션이 모두 렌더링된 뒤 저장
+            settle_selectors = [SECTION_SELECTORS["summary_images"], SECTION_SELECTORS["detail_text"]]
+            saved = sum(recorder.record_product(crawler, product_id, settle_selectors) for product_id in product_ids)
+            print(f"상품 페이지 {saved}개 저장 완료 : {args.fixture_dir}")
+    finally:
+        crawler.close()
+
+
+def percentile_table(timings: list[dict]) -> pd.DataFrame:
+    """단계별 소요 시간의 p50 / p95 (ms)"""
+    df = pd.DataFrame(timings) * 1000
+    return pd.DataFrame({"count": df.count(), "p50_ms": df.quantile(0.5), "p95_ms": df.quantile(0.95)}).round(1)
+
+
+def run_benchmark(args):
+    logger = set_error_logger("benchmark", "logs/benchmark_crawl.log")
+    with FixtureServer(args.fixture_dir, latency=args.latency, jitter=args.jitter) as server:
+        report = {"latency": args.latency, "jitter": args.jitter, "page_load_strategy": args.page_load_strategy, "num_tabs": args.num_tabs}
+        # 1. 목록 크롤링 : DOM 파싱 , (목록 API 응답을 녹화한 경우) 네트워크 응답 수집
+        # 재생 중 실제 사이트로 요청이 나가지 않도록 옵션 API 는 호출하지 않음 (option_api_url=None)
+        listing_crawler = Crawler(headless=True, time_out=args.time_out, capture_network=True, option_api_url=None)
+        try:
+            for name, params in server.manifest["listings"].items():
+                listing_functions = {"dom": lambda params=params: crawl_product_list(listing_crawler, infinite_scroll=True, use_observer=True, **params)}
+                if server.manifest["listing_api"].get(name):
+                    listing_functions["network"] = lambda params=params: crawl_product_list_network(listing_crawler, infinite_scroll=True, **params)
+                for method, crawl in listing_functions.items():
+                    start = time.perf_counter()
+                    listing_crawler.go(f"{server.url}/listing/{name}")
+                    num_products = sum(len(rows) for rows in crawl())
+                    elapsed = time.perf_counter() - start
+                    report[f"listing_{name}_{method}"] = {"products": num_products, "seconds": round(elapsed, 2), "products_per_sec": round(num_products / elapsed, 2)}
+        finally:
+            listing_crawler.close()
+
+        crawler = Crawler(base_url=f"{server.url}/products", headless=True, time_out=args.time_out, option_api_url=None,
+                          page_load_strategy=args.page_load_strategy, block_resources=True, num_tabs=args.num_tabs)
+        try:
+            # 2. 상세 정보 크롤링
+            product_ids = server.manifest["products"][:args.limit]
+            timings, rss_samples, statuses = [], [], []
+            start = time.perf_counter()
+            for index, product_id in enumerate(product_ids):
+                product_timings = {}
+                next_product_id = product_ids[index + 1] if index + 1 < len(product_ids) else None
+                detail_info = get_product_detail_info(crawler, product_id, logger, next_product_id=next_product_id, timings=product_timings)
+                statuses.append(detail_info.get("success_status"))
+                timings.append(product_timings)
+                if index % 10 == 0:
+                    rss_samples.append(crawler.get_browser_rss_mb())
+            elapsed = time.perf_counter() - start
+            rss_samples = [rss for rss in rss_samples if rss is not None]
+            report["detail"] = {
+                "products": len(product_ids),
+                "success": statuses.count("success"),
+                "seconds": round(elapsed, 2),
+                "products_per_sec": round(len(product_ids) / elapsed, 2) if elapsed else None,
+                "chrome_rss_mb_mean": round(float(np.mean(rss_samples)), 1) if rss_samples else None,
+                "chrome_rss_mb_max": round(float(np.max(rss_samples)), 1) if rss_samples else None,
+            }
+        finally:
+            crawler.close()
+
+    table = percentile_table(timings) if timings else pd.DataFrame()
+    print(json.dumps(report, ensure_ascii=False, indent=4))
+    print(table.to_string())
+    if args.output:
+        report["sections"] = table.to_dict(orient="index")
+        Path(args.output).write_text(json.dumps(report, ensure_ascii=False, indent=4), encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fixture 기반 크롤러 처리량 측정")
+    parser.add_argument("--fixture-dir", type=Path, default=DEFAULT_FIXTURE_DIR)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    record_parser = subparsers.add_parser("record", help="실제 사이트의 페이지를 fixture 로 저장")
+    record_parser.add_argument("--summary-csv", type=Path)
+    record_parser.add_argument("--limit", type=int, default=200)
+    record_parser.add_argument("--listing-url")
+    record_parser.add_argument("--listing-name", default="listing")
+    record_parser.add_argument("--num-scrolls", type=int, default=10)
+    record_parser.add_argument("--category-main")
+    record_parser.add_argument("--category-sub")
+
+    run_parser = subparsers.add_parser("run", help="저장한 fixture 로 처리량 측정")
+    run_parser.add_argument("--latency", type=float, default=0.2, help="평균 응답 지연(초)")
+    run_parser.add_argument("--jitter", type=float, default=0.1, help="응답 지연 편차(초)")
+    run_parser.add_argument("--limit", type=int, default=None)
+    run_parser.add_argument("--time-out", type=float, default=3)
+    run_parser.add_argument("--page-load-strategy", default="eager")
+    run_parser.add_argument("--num-tabs", type=int, default=2)
+    run_parser.add_argument("--output", type=Path, help="결과를 저장할 JSON 파일")
+
+    args = parser.parse_args()
+    if args.command == "record":
+        record(args)
+    else:
+        run_benchmark(args)
+
+
+if __name__ == "__main__":
+    main()
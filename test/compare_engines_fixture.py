@@ -0,0 +1,75 @@
+import _path_utils
+from crawler import Crawler, get_product_detail_info
+from crawler.async_crawler import AsyncBrowser, get_product_detail_info_async
+from crawler.fixtures import FixtureServer
+from crawler.crawler import SECTION_DEFAULT_VALUES
+from crawler.utils import set_error_logger
+from pathlib import Path
+import argparse
+import asyncio
+import sys
+
+# 녹화해 둔 상품 페이지(fixture , test/benchmark_crawl.py record)를 로컬 서버로 재생하여
+# 동기(Selenium) 엔진과 비동기(Playwright) 엔진의 상세 정보 크롤링 결과(섹션별 상태/값)가 같은지 확인합니다.
+#   python test/compare_engines_fixture.py --fixture-dir data/fixtures --limit 50
+DEFAULT_FIXTURE_DIR = Path("./data/fixtures")
+
+
+def crawl_sync(base_url: str, product_ids: list[str], logger, time_out: float) -> dict:
+    # 재생 중 실제 사이트로 요청이 나가지 않도록 옵션 API 는 호출하지 않음
+    crawler = Crawler(base_url=base_url, headless=True, time_out=time_out, page_load_strategy="eager", block_resources=True, option_api_url=None)
+    try:
+        return {product_id: get_product_detail_info(crawler, product_id, logger) for product_id in product_ids}
+    finally:
+        crawler.close()
+
+
+async def crawl_async(base_url: str, product_ids: list[str], logger, time_out: float) -> dict:
+    async with AsyncBrowser(base_url=base_url, headless=True, time_out=time_out, option_api_url=None) as browser:
+        crawler = await browser.new_crawler()
+        try:
+            return {product_id: await get_product_detail_info_async(crawler, product_id, logger) for product_id in product_ids}
+        finally:
+            await crawler.close()
+
+
+def compare_results(sync_result: dict, async_result: dict) -> list[str]:
+    """두 엔진의 결과에서 다른 항목(success_status , 섹션별 상태/값)을 반환합니다."""
+    differences = []
+    if sync_result.get("success_status") != async_result.get("success_status"):
+        differences.append(f"success_status : {sync_result.get('success_status')} != {async_result.get('success_status')}")
+    sync_status, async_status = sync_result.get("crawling_status", {}), async_result.get("crawling_status", {})
+    for section in SECTION_DEFAULT_VALUES:
+        if sync_status.get(section) != async_status.get(section):
+            differences.append(f"{section} 상태 : {sync_status.get(section)} != {async_status.get(section)}")
+        elif sync_result.get(section) != async_result.get(section):
+            differences.append(f"{section} 값이 다름")
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fixture 로 동기/비동기 엔진의 결과 비교")
+    parser.add_argument("--fixture-dir", type=Path, default=DEFAULT_FIXTURE_DIR)
+    parser.add_argument("--limit", type=int, default=None)
+    parser.add_argument("--time-out", type=float, default=3)
+    args = parser.parse_args()
+
+    logger = set_error_logger("compare_engines", "logs/compare_engines_fixture.log")
+    with FixtureServer(args.fixture_dir) as server:
+        product_ids = server.manifest["products"][:args.limit]
+        base_url = f"{server.url}/products"
+        sync_results = crawl_sync(base_url, product_ids, logger, args.time_out)
+        async_results = asyncio.run(crawl_async(base_url, product_ids, logger, args.time_out))
+
+    num_mismatches = 0
+    for product_id in product_ids:
+        differences = compare_results(sync_results[product_id], async_results[product_id])
+        if differences:
+            num_mismatches += 1
+            print(f"[{product_id}] " + " , ".join(differences))
+    print(f"{len(product_ids)}개 상품 중 {num_mismatches}개 상품의 결과가 다릅니다.")
+    sys.exit(1 if num_mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+import _path_utils
+from crawler import Crawler
+from crawler.crawler import crawl_product_list_network
+from crawler.fixtures import FixtureRecorder, FixtureServer
+import tempfile
+
+# 실제 사이트 대신 목록 API(XHR)를 같은 경로로 호출하는 로컬 목록 페이지를 만들어 crawl_product_list_network 를 확인합니다.
+# 페이지는 로드 시 첫 페이지를 , 이후 페이지 끝까지 스크롤할 때마다 다음 페이지를 요청합니다. (crawler.fixtures 의 재생 스크립트)
+NUM_PAGES = 3
+ITEMS_PER_PAGE = 10
+LISTING_HTML = '<html><head></head><body><div id="root"><div class="sc-k7xv49-0"></div></div></body></html>'
+
+
+def make_listing_payloads(num_pages: int, items_per_page: int) -> list[dict]:
+    """목록 API 와 같은 형식({"data": {"list": [...] , "pagination": {...}}})의 응답 목록을 만듭니다."""
+    payloads = []
+    for page in range(num_pages):
+        items = []
+        for index in range(items_per_page):
+            goods_no = page * items_per_page + index + 1
+            items.append({
+                "goodsNo": goods_no,
+                "goodsName": f"테스트 상품 {goods_no}",
+                "goodsLinkUrl": f"https://www.musinsa.com/products/{goods_no}",
+                "price": 9000,
+                "normalPrice": 10000,
+                "saleRate": 10,
+                "brand": "test",
+                "reviewScore": 96,
+                "reviewCount": goods_no,
+            })
+        payloads.append({"data": {"list": items, "pagination": {"page": page + 1, "hasNext": page + 1 < num_pages}}})
+    return payloads
+
+
+def main():
+    fixture_dir = tempfile.mkdtemp(prefix="listing_fixture_")
+    FixtureRecorder(fixture_dir).save_listing("network", LISTING_HTML, make_listing_payloads(NUM_PAGES, ITEMS_PER_PAGE),
+                                              category_main="하의", category_sub="데님팬츠")
+    with FixtureServer(fixture_dir) as server:
+        crawler = Crawler(headless=True, capture_network=True, option_api_url=None)
+        try:
+            crawler.go(f"{server.url}/listing/network")
+            params = server.manifest["listings"]["network"]
+            products = [product for product_list in crawl_product_list_network(crawler, infinite_scroll=True, **params) for product in product_list]
+        finally:
+            crawler.close()
+
+    product_ids = [product["product_id"] for product in products]
+    expected_ids = [str(goods_no) for goods_no in range(1, NUM_PAGES * ITEMS_PER_PAGE + 1)]
+    assert product_ids == expected_ids, f"수집한 상품이 다릅니다: {product_ids}"
+    assert all(product["success_status"] == "success" for product in products)
+    print(f"목록 API 응답에서 {len(products)}개 상품 수집 완료 (fixture : {fixture_dir})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 # import _path_utils  
-# from crawler import get_product_detail_info, Crawler
+# from crawler import get_product_detail_info, Crawler, CrawlerPool
 # import pandas as pd
 # from pymongo import MongoClient, UpdateOne , InsertOne
 # from datetime import datetime
@@ -190,32 +190,73 @@
 
  
 import _path_utils
-from crawler import get_product_detail_info, Crawler
-from crawler.utils import setup_logger
+from crawler import get_product_detail_info, Crawler, CrawlerPool
+from crawler.crawler import DRIVER_RESTARTED, get_failed_sections, merge_section_results
+from crawler.breaker import SectionCircuitBreaker
+from crawler.timeouts import AdaptiveTimeouts
+from crawler.driver_factory import DriverFactory
+from crawler.rate_limit import HostRateLimiter
+from crawler.metrics import MetricsRegistry
+from crawler.archive import SnapshotArchive
+from crawler.columnar import load_summary_parquet
+from crawler.utils import set_error_logger
+from crawler.checkpoint import (JsonlWriter, RetryQueue, SUMMARY_KEYS_TO_MERGE, load_product_ids, convert_jsonl_to_json,
+                                merge_summary_into_detail, store_detail_result)
 import pandas as pd
 from pathlib import Path
-import json
 from tqdm import tqdm
 
+def retry_failed_sections(crawler: Crawler, retry_queue: RetryQueue, logger, success_writer: JsonlWriter, unavailable_writer: JsonlWriter, max_attempts: int = 3):
+    """
+    재시도 큐의 상품들을 실패한 섹션 조합별로 묶어 , 상품마다 한 번만 페이지를 이동하여 실패한 섹션만 다시 크롤링합니다.
+    결과는 기존 결과에 병합하여 저장하며 , max_attempts 번 실패한 상품은 포기합니다.
+    """
+    for failed_sections, entries in retry_queue.load_grouped().items():
+        logger.info(f"섹션 재시도 {failed_sections} : {len(entries)}개")
+        for entry in tqdm(entries, desc=f"섹션 재시도 {','.join(failed_sections)}", unit="개"):
+            product_id = entry["product_id"]
+            try:
+                retry_result = get_product_detail_info(crawler, product_id, logger, sections=list(failed_sections))
+            except Exception as e:
+                logger.error(f"섹션 재시도 간 예기치 못한 예외 발생 {product_id} , 에러 : {e}")
+                continue
+            if retry_result.get("success_status") == "error_product_id":
+                retry_queue.mark_done(product_id)
+                continue
+            if retry_result.get("success_status") == DRIVER_RESTARTED:
+                # 재시도 중에도 드라이버가 죽은 경우 : 결과가 없으므로 같은 섹션으로 다시 넣음
+                attempts = entry["attempts"] + 1
+                if attempts >= max_attempts:
+                    logger.error(f"섹션 재시도 {attempts}회 실패로 포기 (드라이버 재시작) : {product_id}")
+                    retry_queue.mark_done(product_id)
+                else:
+                    retry_queue.add(entry["record"], list(failed_sections), attempts)
+                continue
 
-def merge_summary_into_detail(detail_info: dict, product_summary: tuple) -> dict:
-    """제품 요약 정보를 상세 정보 딕셔너리에 병합합니다."""
-    summary_keys_to_merge = [
-        "product_id", "product_price", "product_original_price", "product_discount_price",
-        "product_discount_rate", "product_brand_name", "product_name",
-        "num_likes", "avg_rating", "review_count", "category_main",
-        "category_sub", "gender"
-    ]
-    product_summary_dict = product_summary._asdict()
-    for key in summary_keys_to_merge:
-        detail_info[key] = product_summary_dict[key]
-    return detail_info
+            merged = merge_section_results(entry["record"], retry_result)
+            remaining_sections = get_failed_sections(merged)
+            attempts = entry["attempts"] + 1
+            if not remaining_sections or merged["crawling_status"].get("color_size_info") == "not_exist":
+                store_detail_result(merged, success_writer, unavailable_writer, logger)
+                retry_queue.mark_done(product_id)
+            elif attempts >= max_attempts:
+                logger.error(f"섹션 재시도 {attempts}회 실패로 포기 : {product_id} , 실패 섹션 : {remaining_sections}")
+                retry_queue.mark_done(product_id)
+            else:
+                retry_queue.add(merged, remaining_sections, attempts)
+    retry_queue.compact()
 
 
-def crawl_product_details(summary_df: pd.DataFrame, crawler: Crawler, logger):
-    """요약 정보를 기반으로 제품 상세 정보를 크롤링합니다."""
-    crawled_details = []
-    unavailable_products = []
+def crawl_product_details(summary_df: pd.DataFrame, crawler: Crawler, logger, success_writer: JsonlWriter, unavailable_writer: JsonlWriter, retry_queue: RetryQueue = None, breaker: SectionCircuitBreaker = None,
+                          archive: SnapshotArchive = None):
+    """
+    요약 정보를 기반으로 제품 상세 정보를 크롤링하고 , 상품마다 결과를 JSONL 파일에 바로 기록합니다.
+    breaker 가 차단한 섹션(skipped_breaker)은 실패 섹션으로 재시도 큐에 들어갑니다.
+    crawler.num_tabs >= 2 이면 현재 상품을 파싱하는 동안 다음 상품을 미리 로드합니다.
+    archive 가 있으면 섹션 HTML 을 저장하여 나중에 test/reparse_archive.py 로 다시 파싱할 수 있습니다.
+    """
+    success_ids = summary_df.loc[summary_df["success_status"] == "success", "product_id"].tolist()
+    next_product_ids = dict(zip(success_ids, success_ids[1:]))
 
     # tqdm을 사용하여 진행상황 표시
     for product_summary in tqdm(summary_df.itertuples(), 
@@ -230,47 +271,53 @@ def crawl_product_details(summary_df: pd.DataFrame, crawler: Crawler, logger):
 
             product_id = product_summary.product_id
             
-            # 상세 정보 크롤링
-            detail_info = get_product_detail_info(crawler, product_id, logger)
+            # 상세 정보 크롤링 (처리 중 드라이버가 죽어 재시작된 경우 한 번 더 시도하고 , 또 재시작되면 재시도 큐로 보냄)
+            detail_info = get_product_detail_info(crawler, product_id, logger, breaker=breaker, next_product_id=next_product_ids.get(product_id), archive=archive)
+            if detail_info.get("success_status") == DRIVER_RESTARTED:
+                detail_info = get_product_detail_info(crawler, product_id, logger, breaker=breaker, next_product_id=next_product_ids.get(product_id), archive=archive)
             
             # 기존의 요약 정보로 부터 상세 정보 크롤링 결과 병합
             detail_info = merge_summary_into_detail(detail_info, product_summary)
-
-            if detail_info.get("success_status") == "success":
-                crawled_details.append(detail_info)
-            elif detail_info.get("crawling_status", {}).get("color_size_info") == "not_exist":
-                unavailable_products.append(detail_info)
-            else:
-                logger.warning(f"크롤링 결과 상태를 알 수 없습니다: {product_id}")
+            store_detail_result(detail_info, success_writer, unavailable_writer, logger, retry_queue)
                 
         except KeyboardInterrupt:
-            # Ctrl+C로 강제 종료한 경우 지금까지 수집한 데이터를 반환
-            logger.info(f"사용자에 의해 크롤링이 중단되었습니다. 지금까지 수집된 데이터: 성공 {len(crawled_details)}개, 품절/정보없음 {len(unavailable_products)}개")
-            return crawled_details, unavailable_products
+            # Ctrl+C로 강제 종료한 경우 : 지금까지의 결과는 이미 파일에 기록되어 있음
+            logger.info(f"사용자에 의해 크롤링이 중단되었습니다. 지금까지 저장된 데이터: 성공 {success_writer.count}개, 품절/정보없음 {unavailable_writer.count}개")
+            return
         except Exception as e:
             # 다른 예외는 로그에 기록 후 계속 진행
             logger.error(f"상세 정보 크롤링 간 예기치 못한 예외 발생  {product_summary.product_id} , 에러 : {e}")
             continue
-        
 
-    return crawled_details, unavailable_products
 
+def crawl_product_details_parallel(summary_df: pd.DataFrame, pool: CrawlerPool, logger, success_writer: JsonlWriter, unavailable_writer: JsonlWriter, retry_queue: RetryQueue = None):
+    """CrawlerPool 을 사용하여 여러 드라이버로 제품 상세 정보를 병렬 크롤링하고 , 결과를 JSONL 파일에 바로 기록합니다."""
+    failed_summary = summary_df[summary_df["success_status"] != "success"]
+    for product_id in failed_summary["product_id"]:
+        logger.error(f"summary 크롤링 실패 : {product_id}")
+    target_df = summary_df[summary_df["success_status"] == "success"]
+
+    try:
+        for product_summary, detail_info in tqdm(pool.run(target_df),
+                                                 total=len(target_df),
+                                                 desc="제품 상세정보 크롤링",
+                                                 unit="개"):
+            detail_info = merge_summary_into_detail(detail_info, product_summary)
+            store_detail_result(detail_info, success_writer, unavailable_writer, logger, retry_queue)
+    except KeyboardInterrupt:
+        logger.info(f"사용자에 의해 크롤링이 중단되었습니다. 지금까지 저장된 데이터: 성공 {success_writer.count}개, 품절/정보없음 {unavailable_writer.count}개")
 
-def save_results_to_json(save_dir: Path, file_name_prefix: str, crawled_details: list, unavailable_products: list):
-    """크롤링된 데이터를 JSON 파일로 저장합니다."""
-    if crawled_details:
-        output_path = save_dir / f"{file_name_prefix}.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(crawled_details, f, ensure_ascii=False, indent=4)
-        print(f"성공한 상품 {len(crawled_details)}개를 {output_path}에 저장했습니다.")
-    else:
-        print("저장할 크롤링 성공 결과가 없습니다.")
 
-    if unavailable_products:
-        output_path = save_dir / f"{file_name_prefix}_unavailable.json"
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(unavailable_products, f, ensure_ascii=False, indent=4)
-        print(f"품절/정보 없는 상품 {len(unavailable_products)}개를 {output_path}에 저장했습니다.")
+def save_results_to_json(save_dir: Path, file_name_prefix: str):
+    """JSONL 로 기록된 크롤링 결과를 후처리 코드가 읽는 JSON 파일로 변환합니다."""
+    for suffix, description in (("", "성공한 상품"), ("_unavailable", "품절/정보 없는 상품")):
+        jsonl_path = save_dir / f"{file_name_prefix}{suffix}.jsonl"
+        if not jsonl_path.exists():
+            print(f"저장할 {description} 결과가 없습니다.")
+            continue
+        output_path = save_dir / f"{file_name_prefix}{suffix}.json"
+        count = convert_jsonl_to_json(jsonl_path, output_path)
+        print(f"{description} {count}개를 {output_path}에 저장했습니다.")
 
 CATEGORY = [
     {"category_main": "TOP", "category_sub": "001001"}, # 반소매티셔츠 
@@ -294,30 +341,87 @@ CATEGORY = [
 
 def main():
     """메인 실행 함수"""
-    logger = setup_logger(file_name="crawling_product_detail.log")
-    crawler = Crawler(base_url="https://www.musinsa.com/products", headless=True)
+    logger = set_error_logger("crawling_product_detail", "logs/crawling_product_detail.log")
+    NUM_WORKERS = 1  # 2 이상이면 CrawlerPool 로 여러 드라이버를 병렬 실행
+    RESUME = True  # 이미 JSONL 에 기록된 상품은 건너뛰고 이어서 크롤링
+    CHROME_OPTIONS = {"headless": True, "page_load_strategy": "eager", "block_resources": True}  # DriverFactory 와 Crawler 가 공유하는 크롬 옵션
+    METRICS_PORT = None  # 실행 중 http://127.0.0.1:{METRICS_PORT}/metrics 로 지표 제공 (None 이면 서버 미실행 , 0 이면 빈 포트 사용)
     
     BASE_DIR = Path("./")
     DATA_DIR = BASE_DIR / "data"
     main_category , sub_category = "하의" , "데님팬츠"
     CSV_FILE_NAME = f"musinsa_product_summary_{main_category}_{sub_category}.csv"
     INPUT_CSV_FILE_NAME = DATA_DIR / CSV_FILE_NAME
+    INPUT_PARQUET_FILE_NAME = INPUT_CSV_FILE_NAME.with_suffix(".parquet")
     OUTPUT_FILE_PREFIX = f"musinsa_product_detail_{main_category}_{sub_category}_1"
     
-    #TODO : 디테일 크롤링도 청크단위로 파일 만들고 합치는게 좋아보임 
     try:
-        summary_df = pd.read_csv(INPUT_CSV_FILE_NAME, dtype={'product_id': str})
+        # Parquet 요약 파일이 있으면 병합에 필요한 컬럼만 읽음
+        if INPUT_PARQUET_FILE_NAME.exists():
+            summary_df = load_summary_parquet(INPUT_PARQUET_FILE_NAME, columns=SUMMARY_KEYS_TO_MERGE + ["success_status"])
+        else:
+            summary_df = pd.read_csv(INPUT_CSV_FILE_NAME, dtype={'product_id': str})
     except FileNotFoundError:
         logger.error(f"입력 파일을 찾을 수 없습니다: {INPUT_CSV_FILE_NAME}")
         return
 
-    crawled_details, unavailable_products = [], []
+    success_path = DATA_DIR / f"{OUTPUT_FILE_PREFIX}.jsonl"
+    unavailable_path = DATA_DIR / f"{OUTPUT_FILE_PREFIX}_unavailable.jsonl"
+    retry_queue = RetryQueue(DATA_DIR / f"{OUTPUT_FILE_PREFIX}_retry.jsonl")
+    if RESUME:
+        # 재시도 큐에 있는 상품은 전체를 다시 크롤링하지 않고 아래의 섹션 재시도로 처리
+        done_product_ids = load_product_ids(success_path, unavailable_path) | retry_queue.product_ids()
+        summary_df = summary_df[~summary_df["product_id"].isin(done_product_ids)]
+        print(f"이미 저장된 {len(done_product_ids)}개 상품을 건너뛰고 {len(summary_df)}개 상품을 크롤링합니다.")
     
-    summary_df = summary_df.iloc[15000:]
-    crawled_details, unavailable_products = crawl_product_details(summary_df, crawler, logger)
+    # 워커 생성/드라이버 재시작 시 바로 사용할 예비 드라이버를 백그라운드에서 미리 띄워 둠 (워커가 1개이면 예비 드라이버 없이 템플릿만 사용)
+    # 템플릿 프로필은 처음 한 번 상품 페이지를 방문해 만들어 두고(HTTP 캐시) , 이후 실행에서는 복사해서 사용
+    # 팩토리와 Crawler 의 크롬 옵션이 다르면 Crawler 생성 시 에러가 나므로 같은 옵션(CHROME_OPTIONS)을 사용
+    driver_factory = DriverFactory(num_spares=NUM_WORKERS // 2, template_dir=DATA_DIR / "chrome_template",
+                                   warmup_urls=[f"https://www.musinsa.com/products/{product_id}" for product_id in summary_df["product_id"].head(3)],
+                                   **CHROME_OPTIONS)
+    # 모든 워커/드라이버가 공유하는 호스트별 요청 속도 제한 (429/5xx , timeout 이 나기 전까지 속도를 올림)
+    rate_limiter = HostRateLimiter(rate=2.0, max_rate=20.0)
+    # 단계/WebDriver 명령별 소요 시간 : 실행 중에는 METRICS_PORT 의 /metrics , 종료 후(예외 포함)에는 JSON 파일로 확인
+    metrics = MetricsRegistry()
+    metrics_server = metrics.serve(port=METRICS_PORT) if METRICS_PORT is not None else None
+    if metrics_server is not None:
+        print(f"실행 중 지표 : http://127.0.0.1:{metrics_server.server_address[1]}/metrics")
+    # 상품별 섹션 HTML 을 압축 저장 (셀렉터 변경/새 필드 추가 시 다시 크롤링하지 않고 test/reparse_archive.py 로 다시 파싱)
+    archive = SnapshotArchive(DATA_DIR / "snapshot_archive")
+    try:
+        with JsonlWriter(success_path) as success_writer, JsonlWriter(unavailable_path) as unavailable_writer, retry_queue, driver_factory:
+            if NUM_WORKERS > 1:
+                with CrawlerPool(num_workers=NUM_WORKERS, logger_name=logger.name, base_url="https://www.musinsa.com/products", **CHROME_OPTIONS,
+                                 max_products_per_driver=2000, max_rss_mb=2048, driver_factory=driver_factory, rate_limiter=rate_limiter,
+                                 metrics=metrics, archive=archive) as pool:
+                    crawl_product_details_parallel(summary_df, pool, logger, success_writer, unavailable_writer, retry_queue)
+        
+            # 셀렉터별 대기 시간은 이전 실행의 관측값에서 이어서 학습 (crawler.close() 시 저장)
+            adaptive_timeouts = AdaptiveTimeouts(file_path=DATA_DIR / "selector_latencies.json")
+            crawler = Crawler(base_url="https://www.musinsa.com/products", **CHROME_OPTIONS,
+                              time_out=3, adaptive_timeouts=adaptive_timeouts, num_tabs=2,
+                              max_products_per_driver=2000, max_rss_mb=2048, driver_factory=driver_factory, rate_limiter=rate_limiter,
+                              metrics=metrics)
+            try:
+                if NUM_WORKERS <= 1:
+                    breaker = SectionCircuitBreaker(failure_threshold=5, probe_interval=50, logger=logger)
+                    crawl_product_details(summary_df, crawler, logger, success_writer, unavailable_writer, retry_queue, breaker, archive)
+                # 일부 섹션만 실패한 상품은 실패한 섹션만 다시 크롤링
+                retry_failed_sections(crawler, retry_queue, logger, success_writer, unavailable_writer)
+                print(f"셀렉터별 대기 시간 : {adaptive_timeouts.summary()}")
+                print(f"호스트별 요청 속도(초당 요청 수) : {rate_limiter.rates()}")
+            finally:
+                # 예외/Ctrl+C 로 중단되어도 그때까지 학습한 대기 시간을 저장
+                crawler.close()
+    finally:
+        metrics.dump_json(DATA_DIR / f"{OUTPUT_FILE_PREFIX}_metrics.json")
+        if metrics_server is not None:
+            metrics_server.shutdown()
+            metrics_server.server_close()
+        archive.close()
 
-    crawler.close()
-    save_results_to_json(DATA_DIR, OUTPUT_FILE_PREFIX, crawled_details, unavailable_products)
+    save_results_to_json(DATA_DIR, OUTPUT_FILE_PREFIX)
 
 
 if __name__ == "__main__":
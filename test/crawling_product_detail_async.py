@@ -0,0 +1,53 @@
+import _path_utils
+from crawler.async_crawler import AsyncBrowser, crawl_product_details_async
+from crawler.breaker import SectionCircuitBreaker
+from crawler.checkpoint import JsonlWriter, SUMMARY_KEYS_TO_MERGE, load_product_ids, merge_summary_into_detail, store_detail_result
+from crawler.columnar import load_summary_parquet
+from crawler.utils import set_error_logger
+from pathlib import Path
+from tqdm import tqdm
+import pandas as pd
+import asyncio
+
+# 하나의 Playwright 브라우저에서 CONCURRENCY 개의 페이지로 상품 상세정보를 동시에 크롤링합니다.
+DATA_DIR = Path("./data")
+MAIN_CATEGORY, SUB_CATEGORY = "하의", "데님팬츠"
+INPUT_CSV_FILE = DATA_DIR / f"musinsa_product_summary_{MAIN_CATEGORY}_{SUB_CATEGORY}.csv"
+OUTPUT_FILE_PREFIX = f"musinsa_product_detail_{MAIN_CATEGORY}_{SUB_CATEGORY}_async"
+CONCURRENCY = 20
+
+
+async def run(summaries, logger, success_writer: JsonlWriter, unavailable_writer: JsonlWriter):
+    breaker = SectionCircuitBreaker(failure_threshold=5, probe_interval=50, logger=logger)
+    async with AsyncBrowser(base_url="https://www.musinsa.com/products", headless=True) as browser:
+        progress = tqdm(total=len(summaries), desc=f"제품 상세정보 크롤링 (동시 {CONCURRENCY}개)", unit="개")
+        async for product_summary, detail_info in crawl_product_details_async(browser, summaries, logger, concurrency=CONCURRENCY, breaker=breaker):
+            progress.update(1)
+            # 동기 엔진(test/crawling_product_detail.py)과 같은 기준으로 결과를 기록
+            store_detail_result(merge_summary_into_detail(detail_info, product_summary), success_writer, unavailable_writer, logger)
+        progress.close()
+
+
+def main():
+    logger = set_error_logger("detail_async", "logs/crawling_product_detail_async.log")
+    input_parquet_file = INPUT_CSV_FILE.with_suffix(".parquet")
+    if input_parquet_file.exists():
+        # 병합에 필요한 컬럼 , 성공한 상품만 읽음
+        summary_df = load_summary_parquet(input_parquet_file, columns=SUMMARY_KEYS_TO_MERGE, filters=[("success_status", "==", "success")])
+    else:
+        summary_df = pd.read_csv(INPUT_CSV_FILE, dtype={"product_id": str})
+        summary_df = summary_df[summary_df["success_status"] == "success"]
+
+    success_path = DATA_DIR / f"{OUTPUT_FILE_PREFIX}.jsonl"
+    unavailable_path = DATA_DIR / f"{OUTPUT_FILE_PREFIX}_unavailable.jsonl"
+    done_product_ids = load_product_ids(success_path, unavailable_path)
+    summaries = summary_df[~summary_df["product_id"].isin(done_product_ids)].to_dict("records")
+    print(f"이미 저장된 {len(done_product_ids)}개 상품을 건너뛰고 {len(summaries)}개 상품을 크롤링합니다.")
+
+    with JsonlWriter(success_path) as success_writer, JsonlWriter(unavailable_path) as unavailable_writer:
+        asyncio.run(run(summaries, logger, success_writer, unavailable_writer))
+    print(f"저장 완료 : 성공 {success_writer.count}개 , 품절/정보없음 {unavailable_writer.count}개")
+
+
+if __name__ == "__main__":
+    main()
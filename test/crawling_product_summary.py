@@ -2,7 +2,7 @@ import _path_utils
 from urllib.parse import urlencode
 import pandas as pd
 from crawler import Crawler, crawl_product_list
-from crawler.utils import save_dataframe_to_csv
+from crawler.utils import save_dataframe_to_csv, merge_csv_chunks
 from pathlib import Path
 import shutil
 
@@ -48,7 +48,7 @@ GENDER = {
     "공용": "U",
 }
 
-columns = ["category_main", "category_sub", "gender", "product_id", "product_name", "product_href", "product_price", "product_original_price", "product_discount_price", "product_discount_rate", "product_brand_name", "num_likes", "avg_rating", "review_count", "crawling_status", "success_status"]
+columns = ["category_main", "category_sub", "gender", "product_id", "product_name", "product_href", "product_price", "product_original_price", "product_discount_price", "product_discount_rate", "product_brand_name", "num_likes", "avg_rating", "review_count", "num_likes_is_lower_bound", "review_count_is_lower_bound", "crawling_status", "success_status"]
 
 crawler = Crawler(headless=False, time_out=10)
 
@@ -91,18 +91,15 @@ try:
 
             # 3. 청크 파일들 병합
             print(f"Merging chunks for {main_key}/{sub_key}...")
-            chunk_files = sorted(chunk_dir.glob("*.csv"))
+            chunk_files = list(chunk_dir.glob("*.csv"))
             if not chunk_files:
                 print(f"No data crawled for {main_key}/{sub_key}. Skipping merge.")
                 continue
 
-            dfs = [pd.read_csv(f) for f in chunk_files]
-            merged_df = pd.concat(dfs, ignore_index=True)
-            
-            # 4. 최종 파일 저장 및 임시 폴더 삭제
+            # 4. 청크를 하나씩 읽어 최종 파일에 이어 쓰며 병합 (product_id 중복 제거) 후 임시 폴더 삭제
             final_output_file = SAVE_DIR / f"musinsa_product_summary_{main_key}_{sub_key}_.csv"
-            save_dataframe_to_csv(merged_df, final_output_file)
-            print(f"Successfully merged and saved data to {final_output_file}")
+            num_rows, num_duplicates = merge_csv_chunks(chunk_files, final_output_file)
+            print(f"Successfully merged and saved {num_rows} rows to {final_output_file} (중복 {num_duplicates}개 제거)")
 
             shutil.rmtree(chunk_dir)
             print(f"Removed temporary directory: {chunk_dir}")
@@ -2,9 +2,8 @@ import _path_utils
 from urllib.parse import urlencode
 import pandas as pd
 from crawler import Crawler, crawl_product_list
-from crawler.utils import save_dataframe_to_csv
+from crawler.columnar import SummaryParquetWriter
 from pathlib import Path
-import shutil
 
 MUSINSA_BASE_URL = "https://www.musinsa.com"
 params = {
@@ -64,7 +63,7 @@ GENDER = {
     "공용": "U",
 }
 
-columns = ["category_main", "category_sub", "gender", "product_id", "product_name", "product_href", "product_price", "product_original_price", "product_discount_price", "product_discount_rate", "product_brand_name", "num_likes", "avg_rating", "review_count", "crawling_status", "success_status"]
+columns = ["category_main", "category_sub", "gender", "product_id", "product_name", "product_href", "product_price", "product_original_price", "product_discount_price", "product_discount_rate", "product_brand_name", "num_likes", "avg_rating", "review_count", "num_likes_is_lower_bound", "review_count_is_lower_bound", "crawling_status", "success_status"]
 
 crawler = Crawler(headless=False, time_out=15)
 
@@ -74,57 +73,33 @@ CHUNK_SIZE = 100  # 한 번에 처리할 데이터 수
 try:
     category = CATEGORY[9]
     main_code , sub_code = category.get("category_main") , category.get("category_sub")
-    
-            
-    # 1. 임시 청크 폴더 생성
-    chunk_dir = SAVE_DIR / "temp_chunks" / f"{main_code}_{sub_code}"
-    chunk_dir.mkdir(parents=True, exist_ok=True)
 
     url = f"{MUSINSA_BASE_URL}/category/{sub_code}?{urlencode(params)}"
     crawler.go(url)
     _ = crawler.wait_for_element_by_css_selector(".sc-k7xv49-0")
 
-    product_generator = crawl_product_list(crawler, infinite_scroll=True, **{"category_main": main_code, "category_sub": sub_code, "gender": GENDER["남성"]})
-
-    chunk_data = []
-    chunk_count = 1
-    for product_data in product_generator:
-        chunk_data.extend(product_data)
-        if len(chunk_data) >= CHUNK_SIZE*6:
-            chunk_df = pd.DataFrame(chunk_data)
-            chunk_file = chunk_dir / f"{chunk_count}.csv"
-            save_dataframe_to_csv(chunk_df, chunk_file)
-            print(f"Saved chunk {chunk_count} for {main_code}/{sub_code}")
-            chunk_data = []
-            chunk_count += 1
-    
-    # 2. 마지막 남은 데이터 저장
-    if chunk_data:
-        chunk_df = pd.DataFrame(chunk_data)
-        chunk_file = chunk_dir / f"{chunk_count}.csv"
-        save_dataframe_to_csv(chunk_df, chunk_file)
-        print(f"Saved final chunk {chunk_count} for {main_code}/{sub_code}")
-
-    # 3. 청크 파일들 병합
-    print(f"Merging chunks for {main_code}/{sub_code}...")
-    chunk_files = sorted(chunk_dir.glob("*.csv"))
-    if not chunk_files:
-        raise Exception(f"No data crawled for {main_code}/{sub_code}. Skipping merge.")
-
-    dfs = [pd.read_csv(f) for f in chunk_files]
-    merged_df = pd.concat(dfs, ignore_index=True)
-    
-    # 4. 최종 파일 저장 및 임시 폴더 삭제
-    final_output_file = SAVE_DIR / f"musinsa_product_summary_{CATEGORY_MAIN_TO_STR[main_code]}_{CATEGORY_SUB_CODE_TO_STR[sub_code]}.csv"
-    save_dataframe_to_csv(merged_df, final_output_file)
-    print(f"Successfully merged and saved data to {final_output_file}")
-
-    shutil.rmtree(chunk_dir)
-    print(f"Removed temporary directory: {chunk_dir}")
+    product_generator = crawl_product_list(crawler, infinite_scroll=True, use_observer=True, **{"category_main": main_code, "category_sub": sub_code, "gender": GENDER["남성"]})
+
+    # 청크(CHUNK_SIZE*6 개)가 모일 때마다 Parquet row group 으로 바로 추가 (임시 CSV 청크 저장/병합 없음 , product_id 중복은 쓰면서 제거)
+    final_output_file = SAVE_DIR / f"musinsa_product_summary_{CATEGORY_MAIN_TO_STR[main_code]}_{CATEGORY_SUB_CODE_TO_STR[sub_code]}.parquet"
+    with SummaryParquetWriter(final_output_file) as writer:
+        chunk_data = []
+        for product_data in product_generator:
+            chunk_data.extend(product_data)
+            if len(chunk_data) >= CHUNK_SIZE*6:
+                writer.write(chunk_data)
+                print(f"Saved row group {writer.num_row_groups} for {main_code}/{sub_code} (총 {writer.count}개)")
+                chunk_data = []
+
+        # 마지막 남은 데이터 저장
+        writer.write(chunk_data)
+    if not writer.count:
+        raise Exception(f"No data crawled for {main_code}/{sub_code}.")
+    print(f"Successfully saved {writer.count} products to {final_output_file} (중복 {writer.num_duplicates}개 제거)")
 
 except Exception as e:
     print(f"크롤링 중 오류 발생: {e}")
-    print("오류 발생 지점까지의 데이터는 개별 CSV 또는 임시 청크 파일로 저장되어 있을 수 있습니다.")
+    print("오류 발생 지점까지의 데이터는 Parquet 파일에 저장되어 있습니다.")
 
 finally:
     crawler.close()
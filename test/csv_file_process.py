@@ -1,32 +1,20 @@
 import _path_utils
+from crawler.numeric import normalize_summary_dataframe
+from pathlib import Path
 import pandas as pd
-df = pd.read_csv("musinsa_product_summary_final_.csv")
 
-def convert_num_likes_to_number(num_str):
-    num_str = num_str.strip() # 앞뒤 공백 제거
-    if '만' in num_str and num_str[-1] == "만":
-        value_str = num_str[:-1]
-        try:
-            value = int(float(value_str) * 10000)
-        except ValueError:
-            print(f"경고: '{num_str}'는 유효한 숫자 형식이 아닙니다.")
-            return num_str
-        return value
-    elif '천' in num_str and num_str[-1]=="천":
-        value_str = num_str[:-1]
-        try:
-            value = int(float(value_str) * 1000)
-        except ValueError:
-             print(f"경고: '{num_str}'는 유효한 숫자 형식이 아닙니다.")
-             return num_str
-        return value
-    else:
-        try:
-            value = int(num_str)
-        except ValueError:
-             print(f"경고: '{num_str}'는 유효한 숫자 형식이 아닙니다.")
-             return num_str
-        return value
-    
-df["num_likes"].apply(convert_num_likes_to_number)
-df["review_count"].apply(lambda x : x[1:-1] if isinstance(x , str) else x)
\ No newline at end of file
+# 숫자 필드가 문자열("1.2만" , "1천+" , "12,900")로 저장된 기존 요약 CSV 를 타입이 있는 컬럼으로 변환합니다.
+# 행 단위 apply 대신 벡터 연산으로 처리하며 , 좋아요/리뷰 수의 "+" 는 *_is_lower_bound 컬럼으로 남깁니다.
+# 원본 CSV 는 그대로 두고 변환 결과는 같은 이름 뒤에 NORMALIZED_SUFFIX 를 붙인 새 파일로 저장합니다.
+DATA_DIR = Path("./data")
+NORMALIZED_SUFFIX = "_normalized"
+
+for csv_path in sorted(DATA_DIR.glob("musinsa_product_summary_*.csv")):
+    if csv_path.stem.endswith(NORMALIZED_SUFFIX):
+        continue
+    df = pd.read_csv(csv_path, dtype={"product_id": str})
+    normalized_df = normalize_summary_dataframe(df)
+    output_path = csv_path.with_name(f"{csv_path.stem}{NORMALIZED_SUFFIX}.csv")
+    normalized_df.to_csv(output_path, index=False)
+    print(f"{csv_path} : {len(normalized_df)}개 상품 변환 완료 -> {output_path}")
+    print(normalized_df[["num_likes", "num_likes_is_lower_bound", "review_count", "review_count_is_lower_bound", "avg_rating", "product_price"]].dtypes.to_string())
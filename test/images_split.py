@@ -3,6 +3,7 @@ from crawler.preprocess import save_summary_images_async , ImageData , image_seg
 import json
 from crawler.constants import MIN_CONTENT_HEIGHT , MIN_WHITE_GAP , PADDING
 from crawler.utils import set_error_logger
+from crawler.rate_limit import HostRateLimiter
 from tqdm import tqdm
 import os
 import asyncio
@@ -19,6 +20,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 이미지 CDN 호스트별로 429/5xx , timeout 이 나기 전까지 다운로드 속도를 스스로 올림 (동시 처리 수는 상한으로만 사용)
+rate_limiter = HostRateLimiter(rate=20.0, burst=20, max_rate=200.0, additive_increase=0.5)
+
 async def process_single_product(product_data,  idx ):
     try:
         product_name = product_data["product_name"]
@@ -38,10 +42,10 @@ async def process_single_product(product_data,  idx ):
         await process.create_all_directories()
         
         # 요약 이미지 처리
-        await save_summary_images_async(process)
+        await save_summary_images_async(process, rate_limiter)
 
         # 상세 이미지 처리
-        await image_segmentation_async(process, min_content_height=MIN_CONTENT_HEIGHT, min_white_gap=MIN_WHITE_GAP, padding=PADDING)
+        await image_segmentation_async(process, min_content_height=MIN_CONTENT_HEIGHT, min_white_gap=MIN_WHITE_GAP, padding=PADDING, rate_limiter=rate_limiter)
         await save_detail_images_async(process)
         
         # text merged 
@@ -107,7 +111,7 @@ async def main():
     logger.info(f"총 데이터 개수: {len(data)}")
     
     # 설정
-    max_concurrent = 10  # 동시 처리 수
+    max_concurrent = 50  # 동시 처리 수 상한 (실제 요청 속도는 rate_limiter 가 조절)
     batch_size = 100      # 배치 크기
     semaphore = asyncio.Semaphore(max_concurrent)
     
@@ -140,6 +144,7 @@ async def main():
     print(f"총 처리된 제품: {len(all_results)}개")
     print(f"성공: {success_count}개")
     print(f"실패: {failed_count}개")
+    print(f"호스트별 최종 다운로드 속도(초당 요청 수): {rate_limiter.rates()}")
     # print(f"처리 시간: {elapsed_time:.2f}초")
     
     if failed_count > 0:
@@ -0,0 +1,91 @@
+import _path_utils
+from crawler.crawler import OPTIONAL_SECTIONS, build_presence_selectors, get_absent_sections
+from crawler.fixtures import FixtureRecorder, FixtureServer
+from bs4 import BeautifulSoup
+import argparse
+import tempfile
+
+# 선택 섹션을 대기 없이 not_exist 로 처리하는 조건(get_absent_sections)을 직접 만든 상품 페이지로 확인합니다.
+# 기본은 브라우저 없이 BeautifulSoup 으로 , --browser 를 주면 로컬 fixture 서버와 Crawler.probe_elements 로 확인합니다.
+#   python test/probe_sections_fixture.py --browser
+PANEL = '<div class="sc-g3hx4t-4" data-index="{index}">{content}</div>'
+REVIEW_CONTAINER = '<div class="goods-reviewpage__Container-sc-1iio9o6-0">{content}</div>'
+OPTION_AREA = '<div class="sc-1puoja0-0"><div class="gtm-impression-content">{content}</div></div>'
+
+
+def make_product_html(panels: str, reviews: str = "", options: str = "") -> str:
+    return (
+        '<html><head></head><body><div id="root">'
+        f'<div class="sc-3weaze-0"><div class="sc-366fl4-1"><img src="summary.jpg"></div>'
+        f'<div class="sc-4n9q35-0">{panels}</div>{reviews}</div>{options}'
+        '</div></body></html>'
+    )
+
+
+# (페이지 , 대기 없이 not_exist 로 처리되어야 하는 섹션)
+CASES = {
+    # 형제 탭 패널(data-index 0)만 렌더링되고 사이즈/핏 패널 , 리뷰 영역은 아직 없음 (늦은 렌더링 , 클래스명 변경) : 기다려서 확인해야 함
+    "sibling_panel_only": (
+        make_product_html(PANEL.format(index=0, content='<div class="sc-2ll6b5-0"></div>')),
+        [],
+    ),
+    # 사이즈/핏 패널과 리뷰 영역은 렌더링되었지만 사이즈표 , 핏 정보 , 리뷰 , 옵션 선택 영역이 없음 : 바로 not_exist
+    "sections_without_content": (
+        make_product_html(PANEL.format(index=0, content="") + PANEL.format(index=1, content="<div></div>"),
+                          REVIEW_CONTAINER.format(content="<div></div><div></div>"), OPTION_AREA.format(content="")),
+        list(OPTIONAL_SECTIONS),
+    ),
+    # 섹션 내용이 모두 있음 : 평소처럼 파싱
+    "sections_with_content": (
+        make_product_html(
+            PANEL.format(index=0, content="") + PANEL.format(index=1, content=(
+                '<div class="sc-1jg999i-0"></div>'
+                '<div class="sc-36xiah-0 gtm-impression-content"><div class="sc-36xiah-2"></div></div>')),
+            REVIEW_CONTAINER.format(content="<div></div><div></div><div></div>"),
+            OPTION_AREA.format(content='<div class="pt-1 pb-2"></div>')),
+        [],
+    ),
+}
+
+
+def probe_with_soup(html: str) -> dict:
+    soup = BeautifulSoup(html, "html.parser")
+    return {name: soup.select_one(selector) is not None for name, selector in build_presence_selectors().items()}
+
+
+def probe_with_browser(names: list[str]) -> dict:
+    from crawler import Crawler
+
+    fixture_dir = tempfile.mkdtemp(prefix="probe_fixture_")
+    recorder = FixtureRecorder(fixture_dir)
+    for name in names:
+        recorder.save_product(name, CASES[name][0])
+    presences = {}
+    with FixtureServer(fixture_dir) as server:
+        crawler = Crawler(base_url=f"{server.url}/products", headless=True, option_api_url=None)
+        try:
+            for name in names:
+                crawler.go(f"{crawler.base_url}/{name}")
+                presences[name] = crawler.probe_elements(build_presence_selectors())
+        finally:
+            crawler.close()
+    return presences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="선택 섹션 존재 여부 확인 로직 점검")
+    parser.add_argument("--browser", action="store_true", help="로컬 fixture 서버와 크롬으로 확인")
+    args = parser.parse_args()
+
+    if args.browser:
+        presences = probe_with_browser(list(CASES))
+    else:
+        presences = {name: probe_with_soup(html) for name, (html, _) in CASES.items()}
+    for name, (_, expected) in CASES.items():
+        absent = get_absent_sections(presences[name])
+        assert absent == expected, f"[{name}] not_exist 로 처리된 섹션이 다릅니다: {absent} != {expected}"
+        print(f"[{name}] 바로 not_exist 로 처리되는 섹션 : {absent}")
+
+
+if __name__ == "__main__":
+    main()
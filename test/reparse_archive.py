@@ -0,0 +1,37 @@
+import _path_utils
+from crawler.archive import SnapshotArchive
+from crawler.reparse import reparse_archive
+from crawler.checkpoint import convert_jsonl_to_json
+from pathlib import Path
+import argparse
+import time
+
+# 크롤링 중 저장한 섹션 HTML(스냅샷 아카이브)을 브라우저 없이 다시 파싱합니다.
+# 셀렉터가 바뀌었거나 파서에 새 필드를 추가한 경우 , crawler/crawler.py 의 parse_* 함수만 고친 뒤 실행
+#   python test/reparse_archive.py --archive-dir data/snapshot_archive --output data/musinsa_product_detail_reparsed.jsonl
+DATA_DIR = Path("./data")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="스냅샷 아카이브 다시 파싱")
+    parser.add_argument("--archive-dir", type=Path, default=DATA_DIR / "snapshot_archive")
+    parser.add_argument("--output", type=Path, default=DATA_DIR / "musinsa_product_detail_reparsed.jsonl")
+    parser.add_argument("--workers", type=int, default=None, help="프로세스 수 (기본값 : CPU 코어 수)")
+    parser.add_argument("--sections", nargs="*", default=None, help="다시 파싱할 섹션 (기본값 : 전체)")
+    parser.add_argument("--to-json", action="store_true", help="결과 JSONL 을 JSON 파일로도 저장")
+    args = parser.parse_args()
+
+    with SnapshotArchive(args.archive_dir) as archive:
+        print(f"스냅샷 {len(archive)}개 상품을 다시 파싱합니다.")
+        start = time.perf_counter()
+        counts = reparse_archive(archive, args.output, num_workers=args.workers, sections=args.sections)
+    elapsed = time.perf_counter() - start
+    total = sum(counts.values())
+    print(f"{total}개 상품 파싱 완료 ({elapsed:.1f}초 , 초당 {total / elapsed if elapsed else 0:.1f}개) : {counts}")
+    if args.to_json:
+        count = convert_jsonl_to_json(args.output, args.output.with_suffix(".json"))
+        print(f"{count}개를 {args.output.with_suffix('.json')}에 저장했습니다.")
+
+
+if __name__ == "__main__":
+    main()